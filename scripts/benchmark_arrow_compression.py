@@ -0,0 +1,76 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Measure the read throughput of input series files for each supported layout and compression.
+
+Each file holds 60 timeseries x 8760 hours of float64 values, like a RES or load input.
+Usage: PYTHONPATH=src python scripts/benchmark_arrow_compression.py [--files N] [--directory DIR]
+"""
+
+import argparse
+import tempfile
+import time
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from antares.datamanager.core.arrow_format import read_arrow_file
+
+HOURS = 8760
+NB_TIMESERIES = 60
+
+
+def _write(df: pd.DataFrame, path: Path, layout: str) -> None:
+    if layout in ("uncompressed", "lz4", "zstd"):
+        df.to_feather(path, compression=layout)
+        return
+    codec = layout.removesuffix("_frame")
+    raw = pa.BufferOutputStream()
+    pa.feather.write_feather(df, raw, compression="uncompressed")
+    with pa.output_stream(str(path), compression=codec) as sink:
+        sink.write(raw.getvalue())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=50)
+    parser.add_argument("--directory", type=Path, default=None, help="where to write the files (e.g. a NAS mount)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    # Load factors are stored with a limited precision, which is what makes them compressible
+    df = pd.DataFrame({str(i): np.round(rng.random(HOURS), 3) for i in range(NB_TIMESERIES)})
+    decoded_mb = df.memory_usage(index=False).sum() / 1e6
+
+    with tempfile.TemporaryDirectory(dir=args.directory) as directory:
+        print(f"{'layout':<14}{'file (MB)':>10}{'read (s)':>10}{'disk MB/s':>11}{'decoded MB/s':>14}")
+        for layout in ("uncompressed", "lz4", "zstd", "lz4_frame", "zstd_frame"):
+            paths = [Path(directory) / f"{layout}_{i}.arrow" for i in range(args.files)]
+            for path in paths:
+                _write(df, path, layout)
+            file_mb = paths[0].stat().st_size / 1e6
+
+            start = time.perf_counter()
+            for path in paths:
+                read_arrow_file(path)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{layout:<14}{file_mb:>10.2f}{elapsed:>10.3f}"
+                f"{file_mb * args.files / elapsed:>11.0f}{decoded_mb * args.files / elapsed:>14.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
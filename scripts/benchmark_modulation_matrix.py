@@ -0,0 +1,76 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Compare the list-based construction of 8760x4 modulation matrices with the preallocated builder.
+
+Usage: PYTHONPATH=src python scripts/benchmark_modulation_matrix.py [--clusters N] [--repeat N]
+"""
+
+import argparse
+import time
+
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from antares.datamanager.utils.modulation import HOURS_PER_YEAR, build_modulation_matrix
+
+
+def _best_of(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clusters", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    cm = pd.Series(rng.random(HOURS_PER_YEAR))
+    mr = pd.Series(rng.random(HOURS_PER_YEAR))
+
+    cases: dict[str, tuple[Callable[[], Any], Callable[[], Any]]] = {
+        "CM + MR": (
+            lambda: pd.DataFrame([[1, 1, c, m] for c, m in zip(cm, mr)]),
+            lambda: build_modulation_matrix(cm, mr),
+        ),
+        "CM only": (
+            lambda: pd.DataFrame([[1, 1, c, 0] for c in cm]),
+            lambda: build_modulation_matrix(cm_values=cm),
+        ),
+        "MR only": (
+            lambda: pd.DataFrame([[1, 1, 1, m] for m in mr]),
+            lambda: build_modulation_matrix(mr_values=mr),
+        ),
+        "default": (
+            lambda: pd.DataFrame(np.tile([1, 1, 1, 0], (HOURS_PER_YEAR, 1))),
+            lambda: build_modulation_matrix(),
+        ),
+    }
+
+    print(f"{args.clusters} clusters per run")
+    print(f"{'case':<10}{'lists (s)':>12}{'builder (s)':>13}{'speedup':>9}")
+    for name, (lists, builder) in cases.items():
+        lists_time = _best_of(lambda: [lists() for _ in range(args.clusters)], args.repeat)
+        builder_time = _best_of(lambda: [builder() for _ in range(args.clusters)], args.repeat)
+        print(f"{name:<10}{lists_time:>12.4f}{builder_time:>13.4f}{lists_time / builder_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
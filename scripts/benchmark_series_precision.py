@@ -0,0 +1,92 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Compare the memory footprint and build time of hourly series in float64 and float32 precision.
+
+Usage: PYTHONPATH=src python scripts/benchmark_series_precision.py [--repeat N]
+"""
+
+import argparse
+import tempfile
+import time
+
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from antares.datamanager.generator.generate_dsr_clusters import create_dsr_modulation_matrix_from_series
+from antares.datamanager.generator.generate_res_clusters import read_res_hourly_series
+from antares.datamanager.generator.generate_thermal_clusters import create_modulation_matrix
+
+HOURS = 8760
+NB_TIMESERIES = 60
+NB_RES_FILES = 20
+
+PRECISIONS = {"float64": np.dtype(np.float64), "float32": np.dtype(np.float32)}
+
+
+def _best_of(func: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _nbytes(result: Any) -> int:
+    frames = result if isinstance(result, list) else [result]
+    return sum(int(frame.memory_usage(index=False).sum()) for frame in frames)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as directory:
+        base_dir = Path(directory)
+        for i in range(NB_RES_FILES):
+            frame = pd.DataFrame({str(k): rng.random(HOURS) for k in range(NB_TIMESERIES)})
+            frame.insert(0, "date", np.arange(HOURS, dtype=np.float64))
+            frame.to_feather(base_dir / f"res_{i}.arrow")
+        dsr_series = pd.Series(rng.random(HOURS) * 500)
+        modulation_dir = base_dir / "modulation"
+        modulation_dir.mkdir()
+        pd.DataFrame({"v": rng.random(HOURS)}).to_feather(modulation_dir / "CM_cluster.arrow")
+        pd.DataFrame({"v": rng.random(HOURS)}).to_feather(modulation_dir / "MR_cluster.arrow")
+
+        def cases(dtype: np.dtype) -> dict[str, Callable[[], Any]]:
+            return {
+                f"RES {NB_RES_FILES} files x {NB_TIMESERIES} TS": lambda: [
+                    read_res_hourly_series(base_dir=base_dir, filename=f"res_{i}.arrow", dtype=dtype)
+                    for i in range(NB_RES_FILES)
+                ],
+                "thermal modulation": lambda: create_modulation_matrix(
+                    ["CM_cluster.arrow", "MR_cluster.arrow"], base_dir=modulation_dir, dtype=dtype
+                ),
+                "DSR modulation": lambda: create_dsr_modulation_matrix_from_series(dsr_series, 500.0, dtype=dtype),
+            }
+
+        print(f"{'case':<28}{'precision':>10}{'time (s)':>10}{'memory (MB)':>13}")
+        for precision, dtype in PRECISIONS.items():
+            for name, case in cases(dtype).items():
+                elapsed, result = _best_of(case, args.repeat)
+                print(f"{name:<28}{precision:>10}{elapsed:>10.4f}{_nbytes(result) / 1e6:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Compare the per-hour Python validation of STS constraint occurrences with the array-based parser.
+The speedup is given against a Python loop doing the same checks (range and duplicates).
+
+Usage: PYTHONPATH=src python scripts/benchmark_sts_occurrences.py [--constraints N] [--blocks N] [--repeat N]
+"""
+
+import argparse
+import time
+
+from typing import Any, Callable
+
+import numpy as np
+
+from antares.craft import Occurrence
+from antares.datamanager.generator.generate_sts_clusters import HOURS_PER_YEAR, _parse_occurrences
+
+
+def _parse_occurrences_loop(raw_hours: list[list[Any]]) -> list[Occurrence]:
+    """Former implementation: isinstance and positivity checks hour by hour (no range nor duplicate check)."""
+    occurrences = []
+    for occurrence_hours in raw_hours:
+        if not isinstance(occurrence_hours, list):
+            raise ValueError("Invalid hours block")
+        sanitized_hours = []
+        for hour in occurrence_hours:
+            if not isinstance(hour, int) or hour <= 0:
+                raise ValueError(f"Invalid hour value: {hour!r}")
+            sanitized_hours.append(hour)
+        occurrences.append(Occurrence(hours=sanitized_hours))
+    return occurrences
+
+
+def _parse_occurrences_checked_loop(raw_hours: list[list[Any]]) -> list[Occurrence]:
+    """Same checks as the array-based parser (range and duplicates), hour by hour."""
+    occurrences = []
+    for occurrence_hours in raw_hours:
+        if not isinstance(occurrence_hours, list):
+            raise ValueError("Invalid hours block")
+        for hour in occurrence_hours:
+            if not isinstance(hour, int) or not 1 <= hour <= HOURS_PER_YEAR:
+                raise ValueError(f"Invalid hour value: {hour!r}")
+        if len(set(occurrence_hours)) != len(occurrence_hours):
+            raise ValueError("Duplicate hour")
+        occurrences.append(Occurrence(hours=list(occurrence_hours)))
+    return occurrences
+
+
+def _best_of(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--constraints", type=int, default=50)
+    parser.add_argument("--blocks", type=int, default=300, help="occurrence blocks per constraint")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{args.constraints} constraints of {args.blocks} blocks per run")
+    print(f"{'hours/block':<13}{'loop (s)':>10}{'checked loop (s)':>18}{'arrays (s)':>12}{'speedup':>9}")
+    for block_size in (24, 168, 720):
+        constraints = [
+            [sorted(rng.choice(HOURS_PER_YEAR, size=block_size, replace=False) + 1) for _ in range(args.blocks)]
+            for _ in range(args.constraints)
+        ]
+        # JSON payloads hold plain Python ints
+        constraints = [[[int(hour) for hour in block] for block in blocks] for blocks in constraints]
+
+        loop_time = _best_of(lambda: [_parse_occurrences_loop(blocks) for blocks in constraints], args.repeat)
+        checked_time = _best_of(
+            lambda: [_parse_occurrences_checked_loop(blocks) for blocks in constraints], args.repeat
+        )
+        array_time = _best_of(
+            lambda: [_parse_occurrences(blocks, "cluster", "constraint") for blocks in constraints], args.repeat
+        )
+        print(
+            f"{block_size:<13}{loop_time:>10.4f}{checked_time:>18.4f}{array_time:>12.4f}"
+            f"{checked_time / array_time:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
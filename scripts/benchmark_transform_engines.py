@@ -0,0 +1,67 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Compare the pandas and polars transform engines on study-sized inputs.
+
+Usage: PYTHONPATH=src python scripts/benchmark_transform_engines.py [--repeat N]
+"""
+
+import argparse
+import time
+
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from antares.datamanager.core.settings import TransformEngine
+from antares.datamanager.utils.transform_engine import add_column, scaled_sum
+
+HOURS = 8760
+NB_TIMESERIES = 60
+NB_MISC_GROUPS = 12
+
+
+def _time(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    misc_series = [pd.Series(rng.random(HOURS)) for _ in range(NB_MISC_GROUPS)]
+    misc_factors = list(rng.random(NB_MISC_GROUPS) * 1000)
+    hvdc = pd.DataFrame(rng.random((HOURS, NB_TIMESERIES)) * 1000)
+    hvac = rng.integers(0, 3000, HOURS)
+
+    cases: dict[str, Callable[[TransformEngine], Any]] = {
+        "MISC scaled sum": lambda engine: scaled_sum(misc_series, misc_factors, engine=engine),
+        "Link HVAC + HVDC": lambda engine: add_column(hvdc, hvac, engine=engine),
+    }
+
+    print(f"{'case':<24}{'pandas (s)':>12}{'polars (s)':>12}{'speedup':>10}")
+    for name, case in cases.items():
+        pandas_time = _time(lambda: case(TransformEngine.PANDAS), args.repeat)
+        polars_time = _time(lambda: case(TransformEngine.POLARS), args.repeat)
+        print(f"{name:<24}{pandas_time:>12.4f}{polars_time:>12.4f}{pandas_time / polars_time:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
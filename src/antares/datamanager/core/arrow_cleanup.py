@@ -0,0 +1,241 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+
+import atexit
+import hashlib
+import json
+import queue
+import shutil
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
+
+from antares.datamanager.core.input_snapshot import check_study_id
+from antares.datamanager.core.settings import settings
+from antares.datamanager.logs.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+ARROW_SUFFIX = ".arrow"
+# Trashed file -> original path, one JSON object per line, in each study trash directory
+TRASH_MANIFEST = "manifest.jsonl"
+
+
+@dataclass(frozen=True)
+class _CleanupJob:
+    files: tuple[Path, ...]
+    study_id: str
+
+
+class ArrowCleanupWorker:
+    """
+    Removes consumed .arrow input files off the request thread.
+
+    Files are handed over with ``submit`` and processed by a background thread, in batches of
+    ``batch_size`` with at most ``max_workers`` concurrent filesystem operations.
+    When ``trash_directory`` is set, files are moved to ``<trash>/<study_id>/`` instead of being unlinked,
+    and their original paths (drive included) are recorded in the manifest of that directory, so that an
+    immediate retry of the same study can ``restore`` them.
+    Trashed studies older than ``trash_retention_seconds`` are purged after each job.
+    Files that could not be removed are kept in ``failed`` until ``retry_failed`` is called.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 200,
+        max_workers: int = 4,
+        trash_directory: Optional[Path] = None,
+        trash_retention_seconds: float = 3600,
+    ):
+        self.batch_size = max(1, batch_size)
+        self.max_workers = max(1, max_workers)
+        self.trash_directory = trash_directory
+        self.trash_retention_seconds = trash_retention_seconds
+        self.failed: dict[Path, str] = {}
+        self._failed_study_ids: dict[Path, str] = {}
+        self._lock = threading.Lock()
+        self._queue: queue.Queue[Optional[_CleanupJob]] = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        # study_id -> number of submitted jobs not processed yet
+        self._pending: dict[str, int] = {}
+        self._pending_changed = threading.Condition(self._lock)
+
+    def submit(self, files: Iterable[Path], study_id: str = "") -> None:
+        arrow_files = tuple(sorted({file for file in files if file.name.endswith(ARROW_SUFFIX)}))
+        if not arrow_files:
+            return
+        self._ensure_started()
+        with self._lock:
+            self._pending[study_id] = self._pending.get(study_id, 0) + 1
+        self._queue.put(_CleanupJob(files=arrow_files, study_id=study_id))
+
+    def flush(self) -> None:
+        """Block until every submitted job has been processed."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def wait_for_study(self, study_id: str) -> None:
+        """Block until the jobs submitted for ``study_id`` have been processed, whatever the other studies."""
+        with self._pending_changed:
+            self._pending_changed.wait_for(lambda: study_id not in self._pending)
+
+    def retry_failed(self) -> None:
+        with self._lock:
+            failed_by_study: dict[str, list[Path]] = {}
+            for file in self.failed:
+                failed_by_study.setdefault(self._failed_study_ids.get(file, ""), []).append(file)
+            self.failed.clear()
+            self._failed_study_ids.clear()
+        for study_id, files in failed_by_study.items():
+            self.submit(files, study_id=study_id)
+
+    def restore(self, study_id: str) -> int:
+        """
+        Move the trashed inputs of ``study_id`` back to their original location.
+        Returns the number of restored files.
+        """
+        if self.trash_directory is None or not study_id:
+            return 0
+        # A cleanup of the same study may still be running
+        self.wait_for_study(study_id)
+        study_trash = self.trash_directory / check_study_id(study_id)
+        manifest = study_trash / TRASH_MANIFEST
+        if not manifest.is_file():
+            return 0
+
+        restored = 0
+        with self._lock:
+            entries = manifest.read_text(encoding="utf-8").splitlines()
+        for line in entries:
+            entry = json.loads(line)
+            trashed_file, original = study_trash / entry["trashed"], Path(entry["original"])
+            if not trashed_file.is_file():
+                continue
+            if original.exists():
+                # Replaced by a newer upstream export, which must not be overwritten
+                logger.info(f"Not restoring arrow file {original}: it already exists")
+                continue
+            try:
+                original.parent.mkdir(parents=True, exist_ok=True)
+                shutil.move(trashed_file, original)
+                restored += 1
+            except OSError as e:
+                logger.error(f"Failed to restore arrow file {original} from trash: {e}")
+        shutil.rmtree(study_trash, ignore_errors=True)
+        logger.info(f"Restored {restored} arrow files of study {study_id} from trash")
+        return restored
+
+    def purge_trash(self, now: Optional[float] = None) -> int:
+        if self.trash_directory is None or not self.trash_directory.is_dir():
+            return 0
+        limit = (time.time() if now is None else now) - self.trash_retention_seconds
+        purged = 0
+        for study_trash in self.trash_directory.iterdir():
+            try:
+                if study_trash.stat().st_mtime < limit:
+                    shutil.rmtree(study_trash)
+                    purged += 1
+            except OSError as e:
+                logger.error(f"Failed to purge trash directory {study_trash}: {e}")
+        return purged
+
+    def shutdown(self) -> None:
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="arrow-cleanup", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._process(job)
+            except Exception as e:
+                logger.error(f"Arrow cleanup job failed: {e}")
+            finally:
+                if job is not None:
+                    self._job_done(job.study_id)
+                self._queue.task_done()
+
+    def _job_done(self, study_id: str) -> None:
+        with self._pending_changed:
+            self._pending[study_id] -= 1
+            if not self._pending[study_id]:
+                del self._pending[study_id]
+            self._pending_changed.notify_all()
+
+    def _process(self, job: _CleanupJob) -> None:
+        removed = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for start in range(0, len(job.files), self.batch_size):
+                batch = job.files[start : start + self.batch_size]
+                for file, error in zip(batch, executor.map(lambda f: self._dispose(f, job.study_id), batch)):
+                    if error is None:
+                        removed += 1
+                        continue
+                    with self._lock:
+                        self.failed[file] = error
+                        self._failed_study_ids[file] = job.study_id
+
+        action = "Trashed" if self.trash_directory is not None else "Removed"
+        logger.info(f"{action} {removed}/{len(job.files)} arrow files of study {job.study_id or '<unknown>'}")
+        self.purge_trash()
+
+    def _dispose(self, file: Path, study_id: str) -> Optional[str]:
+        try:
+            if not file.exists():
+                return None
+            if self.trash_directory is None:
+                file.unlink()
+            else:
+                self._trash(file, self.trash_directory / (check_study_id(study_id) if study_id else "_"))
+            logger.debug(f"Removed arrow file: {file}")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to remove arrow file {file}: {e}")
+            return str(e)
+
+    def _trash(self, file: Path, study_trash: Path) -> None:
+        # Flat layout: names are unique per original path, which the manifest keeps with its drive
+        trashed_name = f"{hashlib.sha256(str(file).encode('utf-8')).hexdigest()[:16]}_{file.name}"
+        study_trash.mkdir(parents=True, exist_ok=True)
+        shutil.move(file, study_trash / trashed_name)
+        entry = json.dumps({"trashed": trashed_name, "original": str(file)})
+        with self._lock, open(study_trash / TRASH_MANIFEST, "a", encoding="utf-8") as manifest:
+            manifest.write(entry + "\n")
+
+
+@lru_cache(maxsize=1)
+def get_cleanup_worker() -> ArrowCleanupWorker:
+    worker = ArrowCleanupWorker(
+        batch_size=settings.arrow_cleanup_batch_size,
+        max_workers=settings.arrow_cleanup_max_workers,
+        trash_directory=settings.arrow_cleanup_trash_directory,
+        trash_retention_seconds=settings.arrow_cleanup_trash_retention_seconds,
+    )
+    # Pending deletions are finished before the process exits
+    atexit.register(worker.shutdown)
+    return worker
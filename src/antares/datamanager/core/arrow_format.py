@@ -0,0 +1,102 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+
+from enum import Enum
+from pathlib import Path
+from typing import Literal, Optional
+
+import pandas as pd
+import pyarrow as pa
+
+from antares.datamanager.logs.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+ARROW_FILE_MAGIC = b"ARROW1"
+ARROW_STREAM_CONTINUATION = b"\xff\xff\xff\xff"
+LZ4_FRAME_MAGIC = b"\x04\x22\x4d\x18"
+ZSTD_FRAME_MAGIC = b"\x28\xb5\x2f\xfd"
+MAGIC_LENGTH = 8
+
+
+class ArrowLayout(Enum):
+    """
+    Layout of an input series file, detected from its first bytes.
+
+    FILE and STREAM may carry LZ4/ZSTD compressed buffers (feather v2 ``compression=``), which pyarrow
+    decompresses column by column on its thread pool. LZ4_FRAME and ZSTD_FRAME are whole files
+    compressed as a single frame (e.g. ``zstd input.arrow``), wrapping one of the two other layouts.
+    """
+
+    FILE = "file"
+    STREAM = "stream"
+    LZ4_FRAME = "lz4"
+    ZSTD_FRAME = "zstd"
+
+
+def detect_layout(header: bytes) -> Optional[ArrowLayout]:
+    if header.startswith(ARROW_FILE_MAGIC):
+        return ArrowLayout.FILE
+    if header.startswith(LZ4_FRAME_MAGIC):
+        return ArrowLayout.LZ4_FRAME
+    if header.startswith(ZSTD_FRAME_MAGIC):
+        return ArrowLayout.ZSTD_FRAME
+    if header.startswith(ARROW_STREAM_CONTINUATION):
+        return ArrowLayout.STREAM
+    return None
+
+
+def read_arrow_file(path: Path) -> pd.DataFrame:
+    """
+    Read a local input series file, whatever its layout and compression.
+    Uncompressed and buffer-compressed IPC files keep going through ``pd.read_feather`` (memory-mapped).
+    """
+    layout = _detect_file_layout(path)
+    if layout in (ArrowLayout.LZ4_FRAME, ArrowLayout.ZSTD_FRAME):
+        with pa.input_stream(str(path), compression=_frame_codec(layout)) as stream:
+            return read_arrow_bytes(stream.read())
+    if layout == ArrowLayout.STREAM:
+        with pa.memory_map(str(path)) as source:
+            return _read_stream(source)
+    # IPC file, or unknown content left to pyarrow to report
+    return pd.read_feather(path)
+
+
+def read_arrow_bytes(data: bytes) -> pd.DataFrame:
+    """In-memory counterpart of ``read_arrow_file`` (object store reads, snapshots)."""
+    layout = detect_layout(data[:MAGIC_LENGTH])
+    if layout in (ArrowLayout.LZ4_FRAME, ArrowLayout.ZSTD_FRAME):
+        with pa.input_stream(pa.py_buffer(data), compression=_frame_codec(layout)) as stream:
+            return read_arrow_bytes(stream.read())
+    if layout == ArrowLayout.STREAM:
+        return _read_stream(pa.BufferReader(data))
+    return pd.read_feather(pa.BufferReader(data))
+
+
+def _detect_file_layout(path: Path) -> Optional[ArrowLayout]:
+    try:
+        with open(path, "rb") as file:
+            return detect_layout(file.read(MAGIC_LENGTH))
+    except OSError:
+        # Missing or unreadable files are reported by the reader
+        return None
+
+
+def _frame_codec(layout: ArrowLayout) -> Literal["lz4", "zstd"]:
+    return "lz4" if layout == ArrowLayout.LZ4_FRAME else "zstd"
+
+
+def _read_stream(source: pa.NativeFile) -> pd.DataFrame:
+    options = pa.ipc.IpcReadOptions(use_threads=True)
+    with pa.ipc.open_stream(source, options=options) as reader:
+        table = reader.read_all()
+    return table.to_pandas(use_threads=True)
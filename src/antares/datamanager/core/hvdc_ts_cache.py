@@ -0,0 +1,142 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+
+import hashlib
+import json
+import os
+import threading
+import uuid
+
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+from antares.datamanager.core.settings import settings
+from antares.datamanager.logs.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Bumped when the layout of the cached arrays changes
+CACHE_FORMAT_VERSION = 1
+TSGEN_DISTRIBUTION = "antares-timeseries-generation"
+
+
+class HvdcTimeSeriesCache:
+    """
+    Local store of the daily available HVDC units drawn by tsgen, shared by the studies generated on this host.
+
+    Layout:
+        <root>/<key>.npy    (365, number of time series) array, in the narrowest unsigned integer dtype
+
+    Entries are keyed by ``hvdc_ts_cache_key``. The least recently used ones are evicted once the store
+    exceeds ``max_bytes`` (reading an entry refreshes its modification time). Writes go through a temporary
+    file, so that several processes can share the same directory.
+    """
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional["np.ndarray[Any, Any]"]:
+        path = self._entry_path(key)
+        try:
+            units: "np.ndarray[Any, Any]" = np.load(path, allow_pickle=False)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable HVDC time series cache entry {path}: {e}")
+            return None
+        return units
+
+    def put(self, key: str, units: "np.ndarray[Any, Any]") -> None:
+        with self._lock:
+            try:
+                self.root.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.root / f".{uuid.uuid4().hex}.tmp"
+                try:
+                    with open(tmp_path, "wb") as file:
+                        np.save(file, _compact(units), allow_pickle=False)
+                    os.replace(tmp_path, self._entry_path(key))
+                finally:
+                    tmp_path.unlink(missing_ok=True)
+                self._evict(keep=key)
+            except OSError as e:
+                logger.warning(f"Failed to cache HVDC time series {key}: {e}")
+
+    def _evict(self, keep: str) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.root.glob("*.npy"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        # Least recently used entries go first until the store fits in the size cap
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path.stem == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / f"{key}.npy"
+
+
+def _compact(units: "np.ndarray[Any, Any]") -> "np.ndarray[Any, Any]":
+    """Available units are counts bounded by the number of units: the narrowest unsigned dtype holding them."""
+    max_units = int(units.max()) if units.size else 0
+    return units.astype(np.min_scalar_type(max_units), copy=False)
+
+
+def hvdc_ts_cache_key(
+    unit_count: int, fo_rate: float, seed_tsgen_link: int, link_name: str, number_of_timeseries: int
+) -> str:
+    """
+    Key of the units drawn for these outage parameters and seed. The nominal capacity (``hvdcmw*``) only scales
+    the draws, so that links differing by their capacity only share the same entry.
+    """
+    payload = [
+        CACHE_FORMAT_VERSION,
+        _tsgen_version(),
+        int(unit_count),
+        float(fo_rate).hex(),
+        int(seed_tsgen_link),
+        link_name,
+        int(number_of_timeseries),
+    ]
+    return hashlib.sha256(json.dumps(payload).encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _tsgen_version() -> str:
+    try:
+        return metadata.version(TSGEN_DISTRIBUTION)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+@lru_cache(maxsize=1)
+def get_hvdc_ts_cache() -> Optional[HvdcTimeSeriesCache]:
+    """Cache configured by HVDC_TS_CACHE_DIRECTORY, or None when the cache is disabled."""
+    directory = settings.hvdc_ts_cache_directory
+    if directory is None:
+        return None
+    return HvdcTimeSeriesCache(root=directory, max_bytes=settings.hvdc_ts_cache_max_bytes)
@@ -0,0 +1,258 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Final, Iterable, Iterator, Optional
+
+import pyarrow as pa
+
+from antares.datamanager.core.settings import StorageBackendType, settings
+from antares.datamanager.logs.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+SNAPSHOT_COMPRESSION: Final = "zstd"
+READ_CHUNK_SIZE = 1 << 20
+
+# Characters that would let a study id name a file outside of its directory
+_UNSAFE_STUDY_ID_CHARACTERS = ("/", "\\", ":", "\0")
+
+# Study whose snapshot is used as a fallback for missing input files
+_active_study_id: ContextVar[Optional[str]] = ContextVar("active_snapshot_study_id", default=None)
+
+
+def check_study_id(study_id: str) -> str:
+    """
+    ``study_id``, checked to be usable as a single file or directory name.
+    Raises ValueError for ids that could resolve outside of the directory they are joined to.
+    """
+    if study_id in ("", ".", "..") or any(character in study_id for character in _UNSAFE_STUDY_ID_CHARACTERS):
+        raise ValueError(f"Invalid study id {study_id!r}: it cannot be used as a file name")
+    return study_id
+
+
+class InputSnapshotStore:
+    """
+    Local, compressed, content-addressed store of the inputs of failed studies.
+
+    Layout:
+        <root>/blobs/<sha256>.zst        one blob per distinct file content
+        <root>/manifests/<study_id>.json original path -> blob digest, per study
+
+    When a study fails, its used files are moved into the store (``save``), so that a retry
+    of the same study can read them back (``read_bytes``) once the upstream export is gone.
+    Manifests older than ``max_age_seconds`` are evicted first, then the oldest ones until the
+    blobs fit in ``max_bytes`` (the snapshot being saved is always kept).
+    """
+
+    def __init__(self, root: Path, max_bytes: int, max_age_seconds: float):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+
+    @property
+    def blobs_directory(self) -> Path:
+        return self.root / "blobs"
+
+    @property
+    def manifests_directory(self) -> Path:
+        return self.root / "manifests"
+
+    def save(self, study_id: str, files: Iterable[Path]) -> int:
+        """
+        Move ``files`` into the snapshot of ``study_id``. Returns the number of stored files.
+        Files already absent are kept from a previous snapshot of the same study, if any.
+        """
+        with self._lock:
+            self.blobs_directory.mkdir(parents=True, exist_ok=True)
+            self.manifests_directory.mkdir(parents=True, exist_ok=True)
+
+            manifest = self._load_manifest(study_id)
+            entries: dict[str, str] = manifest.get("files", {}) if manifest else {}
+            stored = 0
+            for file in sorted(set(files)):
+                if not file.is_file():
+                    continue
+                try:
+                    entries[str(file)] = self._store_blob(file)
+                    file.unlink()
+                    stored += 1
+                except OSError as e:
+                    logger.error(f"Failed to snapshot input file {file}: {e}")
+
+            self._write_manifest(study_id, {"created_at": time.time(), "files": entries})
+            self._evict(keep=study_id)
+
+        logger.info(f"Snapshot of study {study_id}: {stored} input files stored ({len(entries)} in total)")
+        return stored
+
+    def contains(self, study_id: str, path: Path) -> bool:
+        manifest = self._load_manifest(study_id)
+        return manifest is not None and str(path) in manifest.get("files", {})
+
+    def read_bytes(self, study_id: str, path: Path) -> Optional[bytes]:
+        manifest = self._load_manifest(study_id)
+        if manifest is None:
+            return None
+        digest = manifest.get("files", {}).get(str(path))
+        if digest is None:
+            return None
+        try:
+            with pa.input_stream(str(self._blob_path(digest)), compression=SNAPSHOT_COMPRESSION) as stream:
+                data: bytes = stream.read()
+        except (OSError, pa.ArrowException) as e:
+            logger.error(f"Failed to read snapshot of {path} for study {study_id}: {e}")
+            return None
+        return data
+
+    def discard(self, study_id: str) -> None:
+        with self._lock:
+            manifest_path = self._manifest_path(study_id)
+            if not manifest_path.exists():
+                return
+            manifest_path.unlink()
+            self._collect_garbage()
+        logger.info(f"Discarded input snapshot of study {study_id}")
+
+    def evict(self, now: Optional[float] = None) -> None:
+        with self._lock:
+            self._evict(keep=None, now=now)
+
+    def _evict(self, keep: Optional[str], now: Optional[float] = None) -> None:
+        limit = (time.time() if now is None else now) - self.max_age_seconds
+        remaining: list[tuple[float, Path]] = []
+        for manifest_path in self.manifests_directory.glob("*.json"):
+            manifest = self._read_json(manifest_path)
+            created_at = float(manifest.get("created_at", 0)) if manifest else 0.0
+            if manifest_path.stem != keep and created_at < limit:
+                manifest_path.unlink(missing_ok=True)
+            else:
+                remaining.append((created_at, manifest_path))
+
+        # Oldest snapshots go first until the blobs fit in the size cap
+        blob_sizes = self._collect_garbage()
+        for _, manifest_path in sorted(remaining):
+            if sum(blob_sizes.values()) <= self.max_bytes:
+                break
+            if manifest_path.stem == keep:
+                continue
+            manifest_path.unlink(missing_ok=True)
+            blob_sizes = self._collect_garbage()
+
+    def _collect_garbage(self) -> dict[str, int]:
+        """Remove the blobs no manifest references anymore, returns the size of the remaining ones."""
+        referenced: set[str] = set()
+        for manifest_path in self.manifests_directory.glob("*.json"):
+            manifest = self._read_json(manifest_path)
+            if manifest:
+                referenced.update(manifest.get("files", {}).values())
+
+        sizes: dict[str, int] = {}
+        for blob in self.blobs_directory.glob("*.zst"):
+            if blob.stem in referenced:
+                sizes[blob.stem] = blob.stat().st_size
+            else:
+                blob.unlink(missing_ok=True)
+        return sizes
+
+    def _store_blob(self, file: Path) -> str:
+        digest = hashlib.sha256()
+        tmp_path = self.blobs_directory / f".{uuid.uuid4().hex}.tmp"
+        try:
+            with open(file, "rb") as source, pa.output_stream(str(tmp_path), compression=SNAPSHOT_COMPRESSION) as sink:
+                while chunk := source.read(READ_CHUNK_SIZE):
+                    digest.update(chunk)
+                    sink.write(chunk)
+            blob_path = self._blob_path(digest.hexdigest())
+            # Same content may already be stored by another file or study
+            if not blob_path.exists():
+                os.replace(tmp_path, blob_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return digest.hexdigest()
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blobs_directory / f"{digest}.zst"
+
+    def _manifest_path(self, study_id: str) -> Path:
+        return self.manifests_directory / f"{check_study_id(study_id)}.json"
+
+    def _load_manifest(self, study_id: str) -> Optional[dict[str, Any]]:
+        return self._read_json(self._manifest_path(study_id))
+
+    def _write_manifest(self, study_id: str, manifest: dict[str, Any]) -> None:
+        manifest_path = self._manifest_path(study_id)
+        tmp_path = manifest_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(tmp_path, manifest_path)
+
+    @staticmethod
+    def _read_json(path: Path) -> Optional[dict[str, Any]]:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
+
+@lru_cache(maxsize=1)
+def get_snapshot_store() -> Optional[InputSnapshotStore]:
+    """Store configured by INPUT_SNAPSHOT_DIRECTORY, or None when snapshots are disabled."""
+    directory = settings.input_snapshot_directory
+    if directory is None:
+        return None
+    if settings.input_storage_backend == StorageBackendType.S3:
+        # Snapshots move local files, objects of the store are left where they are
+        logger.warning("Input snapshots are not supported with the S3 input storage backend, they are disabled")
+        return None
+    return InputSnapshotStore(
+        root=directory,
+        max_bytes=settings.input_snapshot_max_bytes,
+        max_age_seconds=settings.input_snapshot_max_age_seconds,
+    )
+
+
+@contextmanager
+def input_snapshot_scope(study_id: Optional[str]) -> Iterator[None]:
+    """Within this scope, input files missing from the storage are read from the snapshot of ``study_id``."""
+    token = _active_study_id.set(None if study_id is None else check_study_id(study_id))
+    try:
+        yield
+    finally:
+        _active_study_id.reset(token)
+
+
+def read_snapshot_bytes(path: Path) -> Optional[bytes]:
+    study_id = _active_study_id.get()
+    store = get_snapshot_store()
+    if study_id is None or store is None:
+        return None
+    return store.read_bytes(study_id, path)
+
+
+def snapshot_contains(path: Path) -> bool:
+    study_id = _active_study_id.get()
+    store = get_snapshot_store()
+    if study_id is None or store is None:
+        return False
+    return store.contains(study_id, path)
@@ -15,6 +15,7 @@ import os
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+from typing import Optional
 
 from dotenv import find_dotenv, load_dotenv
 
@@ -30,6 +31,26 @@ class GenerationMode(str, Enum):
     LOCAL = "LOCAL"
 
 
+class StorageBackendType(str, Enum):
+    LOCAL = "LOCAL"
+    S3 = "S3"
+
+
+class TransformEngine(str, Enum):
+    PANDAS = "PANDAS"
+    POLARS = "POLARS"
+
+
+class SeriesPrecision(str, Enum):
+    FLOAT64 = "FLOAT64"
+    FLOAT32 = "FLOAT32"
+
+
+class FrAggregationMode(str, Enum):
+    IN_MEMORY = "IN_MEMORY"
+    STREAMING = "STREAMING"
+
+
 @dataclass(frozen=True)
 class Settings:
     """
@@ -133,5 +154,143 @@ class Settings:
             return int(value)
         return 60
 
+    @property
+    def hvdc_ts_workers(self) -> int:
+        # Processes generating the HVDC series of the links, 1 generates them link by link
+        value = os.getenv("HVDC_TS_WORKERS")
+        if value:
+            return int(value)
+        return 1
+
+    @property
+    def hvdc_ts_cache_directory(self) -> Optional[Path]:
+        # Optional: when set, the HVDC outage draws are kept there and reused by the next studies
+        if not os.getenv("HVDC_TS_CACHE_DIRECTORY"):
+            return None
+        return self._resolve_env_path("HVDC_TS_CACHE_DIRECTORY")
+
+    @property
+    def hvdc_ts_cache_max_bytes(self) -> int:
+        value = os.getenv("HVDC_TS_CACHE_MAX_BYTES")
+        if value:
+            return int(value)
+        return 1024**3
+
+    @property
+    def link_ts_chunk_days(self) -> int:
+        # Days of link capacities computed and written at a time in local studies, 0 computes them all at once
+        value = os.getenv("LINK_TS_CHUNK_DAYS")
+        if value:
+            return int(value)
+        return 0
+
+    @property
+    def input_storage_backend(self) -> StorageBackendType:
+        value = os.getenv("INPUT_STORAGE_BACKEND") or "LOCAL"
+        return StorageBackendType(value.upper())
+
+    @property
+    def storage_max_workers(self) -> int:
+        value = os.getenv("STORAGE_MAX_WORKERS")
+        if value:
+            return int(value)
+        return 8
+
+    @property
+    def s3_endpoint_url(self) -> str:
+        return os.getenv("S3_ENDPOINT_URL", "")
+
+    @property
+    def s3_bucket(self) -> str:
+        return os.getenv("S3_BUCKET", "")
+
+    @property
+    def s3_prefix(self) -> str:
+        return os.getenv("S3_PREFIX", "")
+
+    @property
+    def s3_region(self) -> str:
+        return os.getenv("S3_REGION", "")
+
+    @property
+    def s3_access_key_id(self) -> str:
+        return os.getenv("S3_ACCESS_KEY_ID", "")
+
+    @property
+    def s3_secret_access_key(self) -> str:
+        return os.getenv("S3_SECRET_ACCESS_KEY", "")
+
+    @property
+    def s3_max_pool_connections(self) -> int:
+        value = os.getenv("S3_MAX_POOL_CONNECTIONS")
+        if value:
+            return int(value)
+        return max(10, self.storage_max_workers)
+
+    @property
+    def arrow_cleanup_batch_size(self) -> int:
+        value = os.getenv("ARROW_CLEANUP_BATCH_SIZE")
+        if value:
+            return int(value)
+        return 200
+
+    @property
+    def arrow_cleanup_max_workers(self) -> int:
+        value = os.getenv("ARROW_CLEANUP_MAX_WORKERS")
+        if value:
+            return int(value)
+        return 4
+
+    @property
+    def arrow_cleanup_trash_directory(self) -> Optional[Path]:
+        # Optional: when set, consumed arrow files are moved there instead of being deleted
+        if not os.getenv("ARROW_CLEANUP_TRASH_DIRECTORY"):
+            return None
+        return self._resolve_env_path("ARROW_CLEANUP_TRASH_DIRECTORY")
+
+    @property
+    def arrow_cleanup_trash_retention_seconds(self) -> float:
+        value = os.getenv("ARROW_CLEANUP_TRASH_RETENTION_SECONDS")
+        if value:
+            return float(value)
+        return 3600.0
+
+    @property
+    def input_snapshot_directory(self) -> Optional[Path]:
+        # Optional: when set, the inputs of failed studies are kept there for retries
+        if not os.getenv("INPUT_SNAPSHOT_DIRECTORY"):
+            return None
+        return self._resolve_env_path("INPUT_SNAPSHOT_DIRECTORY")
+
+    @property
+    def input_snapshot_max_bytes(self) -> int:
+        value = os.getenv("INPUT_SNAPSHOT_MAX_BYTES")
+        if value:
+            return int(value)
+        return 20 * 1024**3
+
+    @property
+    def input_snapshot_max_age_seconds(self) -> float:
+        value = os.getenv("INPUT_SNAPSHOT_MAX_AGE_SECONDS")
+        if value:
+            return float(value)
+        return 7 * 24 * 3600.0
+
+    @property
+    def transform_engine(self) -> TransformEngine:
+        value = os.getenv("TRANSFORM_ENGINE") or "PANDAS"
+        return TransformEngine(value.upper())
+
+    @property
+    def fr_aggregation_mode(self) -> FrAggregationMode:
+        value = os.getenv("FR_AGGREGATION_MODE") or "IN_MEMORY"
+        return FrAggregationMode(value.upper())
+
+    @property
+    def series_precision(self) -> SeriesPrecision:
+        # Default precision of the hourly series, a study JSON may override it with "precision"
+        value = os.getenv("SERIES_PRECISION") or "FLOAT64"
+        return SeriesPrecision(value.upper())
+
 
 settings = Settings()
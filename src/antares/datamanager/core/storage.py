@@ -0,0 +1,288 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+
+import contextvars
+import io
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional, Protocol, Sequence
+
+import pandas as pd
+
+from antares.datamanager.core.arrow_format import read_arrow_bytes, read_arrow_file
+from antares.datamanager.core.input_snapshot import read_snapshot_bytes, snapshot_contains
+from antares.datamanager.core.settings import StorageBackendType, settings
+from antares.datamanager.logs.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+NOT_FOUND_ERROR_CODES = {"404", "NoSuchKey", "NotFound"}
+
+
+@dataclass(frozen=True)
+class StoredObjectInfo:
+    path: Path
+    size: int
+    modified_at: float
+
+
+class StorageBackend(Protocol):
+    """
+    Read-only access to the input series files (loads, modulation, STS, DSR, misc, RES, hydro).
+
+    Paths are always the logical paths built by the generators (``settings.*_directory / filename``),
+    each backend maps them onto its own location.
+    """
+
+    def stat(self, path: Path) -> StoredObjectInfo: ...
+
+    def exists(self, path: Path) -> bool: ...
+
+    def read_bytes(self, path: Path, start: int = 0, end: Optional[int] = None) -> bytes: ...
+
+    def read_table(self, path: Path) -> pd.DataFrame: ...
+
+
+class LocalStorageBackend:
+    """Local filesystem (NAS mount) adapter"""
+
+    def stat(self, path: Path) -> StoredObjectInfo:
+        file_stat = path.stat()
+        return StoredObjectInfo(path=path, size=file_stat.st_size, modified_at=file_stat.st_mtime)
+
+    def exists(self, path: Path) -> bool:
+        return path.exists()
+
+    def read_bytes(self, path: Path, start: int = 0, end: Optional[int] = None) -> bytes:
+        with open(path, "rb") as file:
+            file.seek(start)
+            if end is None:
+                return file.read()
+            return file.read(max(0, end - start))
+
+    def read_table(self, path: Path) -> pd.DataFrame:
+        # Local files are memory-mapped by pyarrow, no need to buffer them ourselves
+        return read_arrow_file(path)
+
+
+class S3StorageBackend:
+    """
+    S3-compatible object store adapter.
+
+    Logical paths are mapped onto object keys relative to ``root`` (the NAS path by default),
+    e.g. ``<NAS>/res/FR01_pv.arrow`` -> ``<prefix>/res/FR01_pv.arrow``.
+    The client is shared between threads so its connection pool is reused by concurrent reads.
+    """
+
+    def __init__(self, client: Any, bucket: str, root: Path, prefix: str = ""):
+        self.client = client
+        self.bucket = bucket
+        self.root = root
+        self.prefix = prefix.strip("/")
+
+    def _key(self, path: Path) -> str:
+        try:
+            relative = path.relative_to(self.root).as_posix()
+        except ValueError as e:
+            raise ValueError(f"Path {path} is outside of the storage root {self.root}") from e
+        return f"{self.prefix}/{relative}" if self.prefix else relative
+
+    def stat(self, path: Path) -> StoredObjectInfo:
+        try:
+            response = self.client.head_object(Bucket=self.bucket, Key=self._key(path))
+        except Exception as e:
+            if _is_not_found(e):
+                raise FileNotFoundError(f"Object not found in bucket '{self.bucket}': {path}") from e
+            raise
+        return StoredObjectInfo(
+            path=path, size=int(response["ContentLength"]), modified_at=_to_timestamp(response["LastModified"])
+        )
+
+    def exists(self, path: Path) -> bool:
+        try:
+            self.stat(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def read_bytes(self, path: Path, start: int = 0, end: Optional[int] = None) -> bytes:
+        request: dict[str, Any] = {"Bucket": self.bucket, "Key": self._key(path)}
+        if end is not None:
+            if end <= start:
+                return b""
+            # HTTP ranges are inclusive
+            request["Range"] = f"bytes={start}-{end - 1}"
+        elif start > 0:
+            request["Range"] = f"bytes={start}-"
+
+        try:
+            response = self.client.get_object(**request)
+        except Exception as e:
+            if _is_not_found(e):
+                raise FileNotFoundError(f"Object not found in bucket '{self.bucket}': {path}") from e
+            raise
+        body = response["Body"]
+        try:
+            data: bytes = body.read()
+        finally:
+            body.close()
+        return data
+
+    def read_table(self, path: Path) -> pd.DataFrame:
+        return read_arrow_bytes(self.read_bytes(path))
+
+
+class LocalObjectStoreError(Exception):
+    """Mirrors the shape of botocore's ``ClientError`` so that backends handle both the same way."""
+
+    def __init__(self, code: str, message: str) -> None:
+        self.response = {"Error": {"Code": code, "Message": message}}
+        super().__init__(message)
+
+
+class LocalObjectStoreClient:
+    """
+    Stand-in for an S3 client backed by a local directory: ``<root>/<bucket>/<key>``.
+
+    It implements the subset of the boto3 client API used by ``S3StorageBackend`` and lets
+    the S3 code path run without any object store (tests, local development).
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def _object_path(self, bucket: str, key: str) -> Path:
+        bucket_path = (self.root / bucket).resolve()
+        object_path = (bucket_path / key).resolve()
+        if bucket_path not in object_path.parents:
+            raise LocalObjectStoreError("InvalidKey", f"Invalid key: {key}")
+        if not object_path.is_file():
+            raise LocalObjectStoreError("NoSuchKey", f"The specified key does not exist: {key}")
+        return object_path
+
+    def head_object(self, Bucket: str, Key: str) -> dict[str, Any]:
+        file_stat = self._object_path(Bucket, Key).stat()
+        return {
+            "ContentLength": file_stat.st_size,
+            "LastModified": datetime.fromtimestamp(file_stat.st_mtime, tz=timezone.utc),
+        }
+
+    def get_object(self, Bucket: str, Key: str, Range: Optional[str] = None) -> dict[str, Any]:
+        data = self._object_path(Bucket, Key).read_bytes()
+        if Range is not None:
+            start_str, _, end_str = Range.removeprefix("bytes=").partition("-")
+            start = int(start_str)
+            end = int(end_str) + 1 if end_str else len(data)
+            data = data[start:end]
+        return {"Body": io.BytesIO(data), "ContentLength": len(data)}
+
+
+def create_s3_client() -> Any:
+    """
+    Build a boto3 S3 client from the settings, with a connection pool sized for concurrent reads.
+    """
+    try:
+        import boto3
+
+        from botocore.config import Config
+    except ImportError as e:
+        raise ImportError(
+            "boto3 is required for the S3 input storage backend, install antares_datamanager_generator[s3]"
+        ) from e
+
+    config = Config(max_pool_connections=settings.s3_max_pool_connections, retries={"mode": "standard"})
+    return boto3.client(
+        "s3",
+        endpoint_url=settings.s3_endpoint_url or None,
+        region_name=settings.s3_region or None,
+        aws_access_key_id=settings.s3_access_key_id or None,
+        aws_secret_access_key=settings.s3_secret_access_key or None,
+        config=config,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_storage_backend() -> StorageBackend:
+    """
+    Backend configured by INPUT_STORAGE_BACKEND, built once per process.
+    Call ``get_storage_backend.cache_clear()`` after changing the configuration.
+    """
+    if settings.input_storage_backend == StorageBackendType.S3:
+        if not settings.s3_bucket:
+            raise ValueError("Missing environment variable: 'S3_BUCKET'")
+        return S3StorageBackend(
+            client=create_s3_client(),
+            bucket=settings.s3_bucket,
+            root=settings.nas_path,
+            prefix=settings.s3_prefix,
+        )
+    return LocalStorageBackend()
+
+
+def input_exists(path: Path) -> bool:
+    return get_storage_backend().exists(path) or snapshot_contains(path)
+
+
+def inputs_exist(paths: Sequence[Path]) -> dict[Path, bool]:
+    """Concurrent counterpart of ``input_exists``, keyed by path."""
+    return _read_concurrently(input_exists, paths, settings.storage_max_workers)
+
+
+def read_input_table(path: Path) -> pd.DataFrame:
+    """
+    Read an input series file from the configured backend.
+    When it is missing, fall back to the input snapshot of the study being retried, if any.
+    """
+    try:
+        return get_storage_backend().read_table(path)
+    except FileNotFoundError:
+        data = read_snapshot_bytes(path)
+        if data is None:
+            raise
+        logger.info(f"Reading input file from snapshot: {path}")
+        return read_arrow_bytes(data)
+
+
+def read_input_tables(paths: Sequence[Path]) -> dict[Path, pd.DataFrame]:
+    """
+    Read several input files concurrently, keyed by path (duplicates are read once).
+    """
+    return _read_concurrently(read_input_table, paths, settings.storage_max_workers)
+
+
+def _read_concurrently(reader: Any, paths: Sequence[Path], max_workers: int) -> dict[Path, Any]:
+    unique_paths = list(dict.fromkeys(paths))
+    if len(unique_paths) <= 1 or max_workers <= 1:
+        return {path: reader(path) for path in unique_paths}
+
+    # Worker threads do not inherit context variables (e.g. the snapshot scope), run each read in a copy
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_paths))) as executor:
+        results = executor.map(lambda path: context.copy().run(reader, path), unique_paths)
+        return dict(zip(unique_paths, results))
+
+
+def _is_not_found(error: Exception) -> bool:
+    response = getattr(error, "response", None)
+    if not isinstance(response, dict):
+        return False
+    return str(response.get("Error", {}).get("Code")) in NOT_FOUND_ERROR_CODES
+
+
+def _to_timestamp(value: Any) -> float:
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
@@ -11,8 +11,9 @@
 # This file is part of the Antares project.
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, Hashable, Optional, Set, cast
 
 import numpy as np
 import pandas as pd
@@ -20,12 +21,20 @@ import pandas as pd
 from antares.craft import Month, ThermalClusterProperties
 from antares.craft.model.area import Area
 from antares.datamanager.core.settings import settings
+from antares.datamanager.core.storage import input_exists, read_input_table
+from antares.datamanager.generator.generate_thermal_clusters import set_prepro_matrices
 from antares.datamanager.logs.logging_setup import configure_ecs_logger, get_logger
-from antares.datamanager.utils.season_utils import SeasonManager
+from antares.datamanager.utils.matrix_interning import content_key, intern_matrix
+from antares.datamanager.utils.modulation import build_modulation_matrix, default_modulation_matrix
+from antares.datamanager.utils.precision import series_dtype
+from antares.datamanager.utils.study_calendar import get_study_calendar
 
 configure_ecs_logger()
 logger = get_logger(__name__)
 
+HOURS_PER_DAY = 24
+DAYS_IN_BC_DAILY = 366
+
 
 def generate_dsr_clusters(
     area_obj: Area, dsr: Dict[str, Any], first_month: Optional[Month] = None, used_files: Optional[Set[Path]] = None
@@ -35,10 +44,69 @@ def generate_dsr_clusters(
     """
 
     # DSR as Thermals
-    base_dir = generator_dsr_modulation_directory()
-    cluster_series = {}
+    # 1. Load all CM series of the zone into one buffer
+    capacities = load_dsr_capacity_series(dsr, generator_dsr_modulation_directory(), used_files)
+
+    # Global max of the SUM of all DSR capacities in this zone
+    global_max = capacities.global_max()
 
-    # 1. Collect all series to find the global max for this zone
+    # 2. Create clusters with normalized modulation
+    for cluster_name, values in dsr.items():
+        logger.info(f"Creating dsr cluster: {cluster_name}")
+
+        cluster_series_data: Optional[pd.Series[Any]] = capacities.series(cluster_name)
+        modulation_matrix = create_dsr_modulation_matrix_from_series(cluster_series_data, global_max)
+
+        create_dsr_cluster(area_obj, cluster_name, values, modulation_matrix, first_month)
+
+    # 3. Generate coupling constraints
+    return _dsr_binding_constraints(dsr, capacities)
+
+
+@dataclass(frozen=True)
+class DsrCapacitySeries:
+    """
+    Hourly CM series of the DSR clusters of an area, one row of ``values`` per cluster of ``names``.
+    Rows are padded with NaN when the series do not have the same length.
+    """
+
+    names: tuple[str, ...]
+    labels: tuple[Hashable, ...]
+    values: np.ndarray[Any, Any]
+
+    @classmethod
+    def from_series(cls, cluster_series: Dict[str, pd.Series[Any]]) -> DsrCapacitySeries:
+        series = list(cluster_series.values())
+        arrays = [values.to_numpy() for values in series]
+        lengths = {len(array) for array in arrays}
+        nb_hours = max(lengths, default=0)
+        if len(lengths) > 1:
+            buffer = np.full((len(arrays), nb_hours), np.nan)
+        else:
+            buffer = np.empty((len(arrays), nb_hours), dtype=np.result_type(*arrays) if arrays else np.float64)
+        for row, array in zip(buffer, arrays):
+            row[: len(array)] = array
+        return cls(tuple(cluster_series), tuple(values.name for values in series), buffer)
+
+    def series(self, cluster_name: str) -> Optional[pd.Series[Any]]:
+        """CM series of ``cluster_name`` (a view on the buffer), None when it has no CM file."""
+        if cluster_name not in self.names:
+            return None
+        index = self.names.index(cluster_name)
+        return pd.Series(self.values[index], name=self.labels[index], copy=False)
+
+    def global_max(self) -> float:
+        """Maximum over the hours of the summed capacity of all clusters, 0 without CM series."""
+        if not self.names:
+            return 0
+        # Same column by column summation as a pandas row-wise sum
+        return cast(float, np.nansum(self.values, axis=0).max())
+
+
+def load_dsr_capacity_series(
+    dsr: Dict[str, Any], base_dir: Path, used_files: Optional[Set[Path]] = None
+) -> DsrCapacitySeries:
+    cluster_series = {}
     for cluster_name, values in dsr.items():
         cluster_modulation = values.get("modulation", [])
         if not cluster_modulation:
@@ -49,31 +117,11 @@ def generate_dsr_clusters(
             cm_path = base_dir / cm_file
             if used_files is not None:
                 used_files.add(cm_path)
-            if cm_path.exists():
-                df_cm = pd.read_feather(cm_path)
-                series = df_cm.iloc[:, 0]
-                cluster_series[cluster_name] = series
+            if input_exists(cm_path):
+                cluster_series[cluster_name] = read_input_table(cm_path).iloc[:, 0]
             else:
                 logger.warning(f"DSR CM file '{cm_file}' not found at {cm_path}")
-
-    # Global max of the SUM of all DSR capacities in this zone
-    global_max = 0
-    if cluster_series:
-        # Sum all series element-wise to get the total DSR capacity at each hour
-        total_series = pd.concat(cluster_series.values(), axis=1).sum(axis=1)
-        global_max = total_series.max()
-
-    # 2. Create clusters with normalized modulation
-    for cluster_name, values in dsr.items():
-        logger.info(f"Creating dsr cluster: {cluster_name}")
-
-        cluster_series_data: Optional[pd.Series[Any]] = cluster_series.get(cluster_name)
-        modulation_matrix = create_dsr_modulation_matrix_from_series(cluster_series_data, global_max)
-
-        create_dsr_cluster(area_obj, cluster_name, values, modulation_matrix, first_month)
-
-    # 3. Generate coupling constraints
-    return generate_dsr_binding_constraints(dsr, cluster_series)
+    return DsrCapacitySeries.from_series(cluster_series)
 
 
 def generate_dsr_binding_constraints(
@@ -90,45 +138,83 @@ def generate_dsr_binding_constraints(
 
     FR Case: Do not sum sub-clusters. Keep FR_* columns separate.
     """
-    if not cluster_series:
-        return pd.DataFrame()
+    return _dsr_binding_constraints(dsr_data, DsrCapacitySeries.from_series(cluster_series))
 
-    results = {}
-    for cluster_name, series in cluster_series.items():
-        data = dsr_data.get(cluster_name, {}).get("data", {})
-        max_hour_per_day = data.get("max_hour_per_day", 1)
-        nb_hour_per_day = data.get("nb_hour_per_day", 1)
 
-        if nb_hour_per_day == 0:
-            logger.warning(f"nb_hour_per_day is 0 for {cluster_name}, using 1 to avoid division by zero.")
-            nb_hour_per_day = 1
+def _dsr_binding_constraints(dsr_data: Dict[str, Any], capacities: DsrCapacitySeries) -> pd.DataFrame:
+    if not capacities.names:
+        return pd.DataFrame()
 
-        coefficient = 24 * max_hour_per_day / nb_hour_per_day
+    names = list(capacities.names)
+    # 2. Coefficient of every cluster
+    coefficients = np.array([_dsr_constraint_coefficient(dsr_data, name) for name in names])
+
+    # 1. and 3. Daily means of every cluster at once, multiplied by the coefficients
+    daily_values = _daily_means(capacities.values) * coefficients[:, None]
+
+    # FR columns are kept separate, other columns are summed
+    column_names = [name for name in names if name.startswith("FR_")]
+    columns = [daily_values[index] for index, name in enumerate(names) if name.startswith("FR_")]
+    non_fr_rows = [index for index, name in enumerate(names) if not name.startswith("FR_")]
+    if non_fr_rows:
+        # The column name will be used to identify the area in the constraint generation.
+        # It is the name of the last cluster, which replaces an FR column of the same name.
+        non_fr_sum = np.nansum(daily_values[non_fr_rows], axis=0)
+        if names[-1] in column_names:
+            columns[column_names.index(names[-1])] = non_fr_sum
+        else:
+            column_names.append(names[-1])
+            columns.append(non_fr_sum)
+
+    nb_days = daily_values.shape[1]
+    # Antares always expects 366 rows for bc_daily, the padding row is left to 0
+    matrix = np.zeros((DAYS_IN_BC_DAILY if nb_days == 365 else nb_days, len(columns)))
+    matrix[:nb_days] = np.column_stack(columns)
+    final_df = pd.DataFrame(matrix, columns=column_names)
 
-        daily_mean = series.groupby(series.index // 24).mean()
+    logger.info(f"Generated coupling constraints matrix with shape {final_df.shape}")
+    return final_df
 
-        # 3. Multiply by coeff
-        results[cluster_name] = daily_mean * coefficient
 
-    df_results = pd.DataFrame(results)
+def _dsr_constraint_coefficient(dsr_data: Dict[str, Any], cluster_name: str) -> float:
+    data = dsr_data.get(cluster_name, {}).get("data", {})
+    max_hour_per_day = data.get("max_hour_per_day", 1)
+    nb_hour_per_day = data.get("nb_hour_per_day", 1)
 
-    fr_columns = [col for col in df_results.columns if col.startswith("FR_")]
-    non_fr_columns = [col for col in df_results.columns if not col.startswith("FR_")]
+    if nb_hour_per_day == 0:
+        logger.warning(f"nb_hour_per_day is 0 for {cluster_name}, using 1 to avoid division by zero.")
+        nb_hour_per_day = 1
 
-    final_df = df_results[fr_columns].copy()
+    return float(24 * max_hour_per_day / nb_hour_per_day)
 
-    if non_fr_columns:
-        # If it's not a FR area, we sum all columns.
-        # The column name will be used to identify the area in the constraint generation
-        final_df[cluster_name] = df_results[non_fr_columns].sum(axis=1)
 
-    logger.info(f"Generated coupling constraints matrix with shape {final_df.shape}")
-    # Antares always expects 366 rows for bc_daily
-    if len(final_df) == 365:
-        final_df = pd.concat(
-            [final_df, pd.DataFrame([[0] * final_df.shape[1]], columns=final_df.columns)], ignore_index=True
-        )
-    return final_df
+def _daily_means(hourly: np.ndarray[Any, Any]) -> np.ndarray[Any, np.dtype[np.float64]]:
+    """
+    Daily means of (n_series, n_hours) hourly values, as a (n_series, n_days) array.
+
+    Whole days are reshaped into a (n_series, n_days, 24) array and summed hour by hour with the
+    compensated (Kahan) summation of pandas groupby means, so that results are identical.
+    Other inputs (missing values, partial days) go through pandas groupby.
+    """
+    nb_series, nb_hours = hourly.shape
+    if (
+        nb_hours == 0
+        or nb_hours % HOURS_PER_DAY
+        or not (hourly.dtype == np.float64 or np.issubdtype(hourly.dtype, np.integer))
+        or not np.isfinite(hourly).all()
+    ):
+        by_day = pd.DataFrame(hourly.T).groupby(np.arange(nb_hours) // HOURS_PER_DAY).mean()
+        return by_day.to_numpy(dtype=np.float64).T
+
+    days = hourly.astype(np.float64, copy=False).reshape(nb_series, nb_hours // HOURS_PER_DAY, HOURS_PER_DAY)
+    total = np.zeros(days.shape[:2])
+    compensation = np.zeros(days.shape[:2])
+    for hour in range(HOURS_PER_DAY):
+        value = days[:, :, hour] - compensation
+        new_total = total + value
+        compensation = new_total - total - value
+        total = new_total
+    return total / HOURS_PER_DAY
 
 
 def create_dsr_cluster(
@@ -152,33 +238,40 @@ def create_dsr_cluster(
     prepro_matrix = create_dsr_prepro_data_matrix(cluster_data, first_month=first_month)
 
     thermal_cluster = area_obj.create_thermal_cluster(cluster_name, cluster_properties)
-    thermal_cluster.set_prepro_data(prepro_matrix)
-    thermal_cluster.set_prepro_modulation(modulation_matrix)
+    set_prepro_matrices(thermal_cluster, prepro_matrix, modulation_matrix)
 
 
 def generator_dsr_modulation_directory() -> Path:
     return settings.dsr_modulation_directory
 
 
-def create_dsr_modulation_matrix_from_series(series: "pd.Series[Any] | None", global_max: float) -> pd.DataFrame:
+def create_dsr_modulation_matrix_from_series(
+    series: "pd.Series[Any] | None", global_max: float, dtype: Optional[np.dtype] = None
+) -> pd.DataFrame:
     """
     Returns a 4-column DataFrame without column names:
         [1, 1, capacity_modulation, 0]
 
     If series is None:
         returns 8760 rows of [1, 1, 1, 0]
+
+    In reduced precision (float32 study or ``dtype``), every column is converted to that dtype.
     """
     if series is None:
         logger.info("DSR modulation series is None, skipping dsr modulation matrix generation.")
-        data = np.tile([1, 1, 1, 0], (8760, 1))
-        return pd.DataFrame(data)
+        return default_modulation_matrix(dtype)
+
+    key = ("dsr_modulation", content_key(series), global_max, series_dtype(dtype).str)
+    return intern_matrix(key, lambda: _build_dsr_modulation_matrix(series, global_max, dtype))
+
 
+def _build_dsr_modulation_matrix(series: pd.Series[Any], global_max: float, dtype: Optional[np.dtype]) -> pd.DataFrame:
+    values = series.to_numpy()
     if global_max > 0:
-        cm_values = (series / global_max).round(3)
-    else:
-        cm_values = series.round(3)
+        values = values / global_max
+    cm_values = np.round(values, 3)
 
-    df = pd.DataFrame([[1, 1, cm, 0] for cm in cm_values])
+    df = build_modulation_matrix(cm_values=cm_values, dtype=dtype)
     logger.info(f"Final dsr modulation matrix shape: {df.shape}")
     return df
 
@@ -213,6 +306,14 @@ def create_dsr_prepro_data_matrix(data: Dict[str, Any], first_month: Optional[Mo
             - npo_min: default: 0.
             - npo_max: default: 0.
     """
+    if first_month is None:
+        first_month = settings.study_setting_first_month
+    # DSR clusters of a study sharing the same data share the same matrix
+    key = ("dsr_prepro", content_key(data), first_month)
+    return intern_matrix(key, lambda: _create_dsr_prepro_data_matrix(data, first_month))
+
+
+def _create_dsr_prepro_data_matrix(data: Dict[str, Any], first_month: Month) -> pd.DataFrame:
     # If no data is provided  return the default 365x6 matrix
     if not data:
         # fo_duration, po_duration, fo_rate, po_rate, npo_min, npo_max
@@ -228,20 +329,8 @@ def create_dsr_prepro_data_matrix(data: Dict[str, Any], first_month: Optional[Mo
     if len(fo_monthly_rate) != 12:
         raise ValueError("fo_monthly_rate must have 12 values")
 
-    if first_month is None:
-        first_month = settings.study_setting_first_month
-
-    season_manager = SeasonManager(first_month)
-    month_order = season_manager.get_month_order()
-    days_in_month = season_manager.get_days_per_month()
-
-    # Build 365-day arrays directly
-    fo_rate_daily = []
-
-    for i in range(12):
-        month_idx_in_data = month_order[i] - 1
-        for _ in range(days_in_month[i]):
-            fo_rate_daily.append(fo_monthly_rate[month_idx_in_data])
+    # Monthly rates expanded to the 365 days of the study
+    fo_rate_daily = np.asarray(fo_monthly_rate)[get_study_calendar(first_month).month_index_of_day]
 
     # Constant daily durations
     fo_duration_daily = np.full(365, fo_duration_const)
@@ -250,17 +339,7 @@ def create_dsr_prepro_data_matrix(data: Dict[str, Any], first_month: Optional[Mo
     npo_min = np.zeros(365)
     npo_max = np.zeros(365)
 
-    df = pd.DataFrame(
-        list(
-            zip(
-                fo_duration_daily,
-                po_duration,
-                fo_rate_daily,
-                po_rate,
-                npo_min,
-                npo_max,
-            )
-        )
-    )
+    columns = [fo_duration_daily, po_duration, fo_rate_daily, po_rate, npo_min, npo_max]
+    df = pd.DataFrame(dict(enumerate(columns)))
 
     return df
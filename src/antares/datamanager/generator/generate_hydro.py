@@ -17,6 +17,7 @@ import pandas as pd
 
 from antares.craft import HydroAllocation, HydroPropertiesUpdate
 from antares.datamanager.core.settings import settings
+from antares.datamanager.core.storage import input_exists, read_input_table
 from antares.datamanager.logs.logging_setup import get_logger
 
 logger = get_logger(__name__)
@@ -79,10 +80,10 @@ def generate_hydro(area_obj: Any, hydro: dict[str, Any], used_files: Optional[Se
         file_path = base_dir / series_file
         if used_files is not None:
             used_files.add(file_path)
-        if not file_path.exists():
+        if not input_exists(file_path):
             raise FileNotFoundError(f"ERROR: file {file_path} doesn't exist")
 
-        df = pd.read_feather(file_path)
+        df = read_input_table(file_path)
 
         if "_mod" in series_file:
             area_obj.hydro.set_mod_series(df)
@@ -10,31 +10,51 @@
 #
 # This file is part of the Antares project.
 
-from typing import Any
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Optional, Sequence, Union
 
 import numpy as np
 import pandas as pd
+import polars as pl
 
+from antares.craft import Month
+from antares.datamanager.core.hvdc_ts_cache import get_hvdc_ts_cache, hvdc_ts_cache_key
 from antares.datamanager.core.settings import settings
 from antares.datamanager.utils.seed_factory import SeedFactory
+from antares.datamanager.utils.study_calendar import DAYS_PER_YEAR, HOURS_PER_DAY, get_study_calendar
+from antares.datamanager.utils.transform_engine import add_column
 from antares.tsgen.duration_generator import ProbabilityLaw
 from antares.tsgen.random_generator import MersenneTwisterRNG
 from antares.tsgen.ts_generator import LinkCapacity, OutageGenerationParameters, TimeseriesGenerator
 
+LINK_DIRECTIONS = ("direct", "indirect")
+# Links by name, or (link_name, link_data) pairs
+LinksData = Union[Mapping[str, dict[str, int]], Sequence[tuple[str, dict[str, int]]]]
+# Candidate dtypes of the capacity matrices, narrowest first
+CAPACITY_DTYPES = (np.int8, np.int16, np.int32, np.int64)
 
-def _generate_hvdc_ts(link_data_lower: dict[str, Any], mode: str, seed_tsgen_link: int, link_name: str) -> pd.DataFrame:
-    """
-    Generate random time series for 100% HVDC links.
-    """
+
+def _hvdc_parameters(link_data_lower: dict[str, Any], mode: str) -> tuple[Any, Any, Any]:
+    """(total MW, number of units, forced outage rate) of the HVDC part of a link in one direction."""
     prefix = mode.lower()
-    mw_key = f"hvdcmw{prefix}"
-    nb_key = f"hvdcnb{prefix}"
-    fo_rate_key = f"hvdcforate{prefix}"
+    return (
+        link_data_lower.get(f"hvdcmw{prefix}", 0),
+        link_data_lower.get(f"hvdcnb{prefix}", 1),
+        link_data_lower.get(f"hvdcforate{prefix}", 0),
+    )
 
-    hvdc_mw = link_data_lower.get(mw_key, 0)
-    hvdc_nb = link_data_lower.get(nb_key, 1)
-    hvdc_fo_rate = link_data_lower.get(fo_rate_key, 0)
 
+def _nominal_capacity(hvdc_mw: Any, hvdc_nb: Any) -> float:
+    # nominal capacity is total capacity / number of units
+    return float(hvdc_mw) / float(hvdc_nb) if hvdc_nb > 0 else 0.0
+
+
+def _hvdc_link_capacity(hvdc_mw: Any, hvdc_nb: Any, hvdc_fo_rate: Any) -> LinkCapacity:
     # outage generation parameters
     # fo_rate, po_rate, fo_duration, po_duration, npo_min, npo_max are indexed by day of year (365)
     days = 365
@@ -57,38 +77,227 @@ def _generate_hvdc_ts(link_data_lower: dict[str, Any], mode: str, seed_tsgen_lin
         po_volatility=0.0,
     )
 
-    # nominal capacity is total capacity / number of units
-    nominal_cap = float(hvdc_mw) / float(hvdc_nb) if hvdc_nb > 0 else 0.0
-
     # modulation is a matrix of 1 (hourly: 8760)
     modulation = np.ones(8760, dtype=float)
 
-    link_capacity = LinkCapacity(
+    return LinkCapacity(
         outage_gen_params=outage_params,
-        nominal_capacity=nominal_cap,
+        nominal_capacity=_nominal_capacity(hvdc_mw, hvdc_nb),
         modulation_direct=modulation,
         modulation_indirect=modulation,
     )
 
+
+def _hvdc_available_units(link_capacity: LinkCapacity, seed_tsgen_link: int, link_name: str) -> "np.ndarray[Any, Any]":
+    """
+    Daily available units (365 x number of time series) drawn by tsgen, read from the HVDC time series
+    cache when it is enabled and already holds them.
+    """
+    number_of_timeseries = settings.number_of_timeseries
+    cache = get_hvdc_ts_cache()
+    key = None
+    if cache is not None:
+        outage_params = link_capacity.outage_gen_params
+        key = hvdc_ts_cache_key(
+            outage_params.unit_count,
+            float(outage_params.fo_rate[0]),
+            seed_tsgen_link,
+            link_name,
+            number_of_timeseries,
+        )
+        cached_units = cache.get(key)
+        if cached_units is not None:
+            return cached_units
+
     seed_int = SeedFactory.for_timeseries(seed_tsgen_link, link_name)
     rng = MersenneTwisterRNG(seed_int)
 
     ts_generator = TimeseriesGenerator(rng=rng)
 
-    link_output = ts_generator.generate_time_series_for_links(
-        link_capacity, number_of_timeseries=settings.number_of_timeseries
-    )
+    link_output = ts_generator.generate_time_series_for_links(link_capacity, number_of_timeseries=number_of_timeseries)
+    units: "np.ndarray[Any, Any]" = link_output.outage_output.available_units
+    if cache is not None and key is not None:
+        cache.put(key, units)
+    return units
+
 
-    if prefix == "direct":
-        data = link_output.direct_available_power
+def _link_hvdc_units(
+    link_data_lower: dict[str, Any], seed_tsgen_link: int, link_name: str
+) -> dict[str, "np.ndarray[Any, Any]"]:
+    """
+    Daily available HVDC units of the directions of a link that have an HVDC part.
+
+    Both directions are drawn with the same seed, so when they share the same number of units and
+    forced outage rate, their outages are the same: units are then drawn once, and only scaled by
+    the nominal capacity of each direction, exactly as a dedicated run would give.
+    """
+    units_by_mode: dict[str, "np.ndarray[Any, Any]"] = {}
+    units_by_outage_params: dict[tuple[int, float], "np.ndarray[Any, Any]"] = {}
+    for mode in LINK_DIRECTIONS:
+        if link_data_lower.get(f"hvdcmw{mode}") is None:
+            continue
+        link_capacity = _hvdc_link_capacity(*_hvdc_parameters(link_data_lower, mode))
+        outage_params = (link_capacity.outage_gen_params.unit_count, float(link_capacity.outage_gen_params.fo_rate[0]))
+        if outage_params not in units_by_outage_params:
+            units_by_outage_params[outage_params] = _hvdc_available_units(link_capacity, seed_tsgen_link, link_name)
+        units_by_mode[mode] = units_by_outage_params[outage_params]
+    return units_by_mode
+
+
+def _generate_links_hvdc_units(
+    links_data_lower: Sequence[tuple[str, dict[str, Any]]], seed_tsgen_link: int, max_workers: int
+) -> list[Optional[dict[str, "np.ndarray[Any, Any]"]]]:
+    """Daily available HVDC units of each link, in the order of ``links_data_lower``, None for links without HVDC."""
+    hvdc_indices = [
+        i
+        for i, (_, link_data_lower) in enumerate(links_data_lower)
+        if any(link_data_lower.get(f"hvdcmw{mode}") is not None for mode in LINK_DIRECTIONS)
+    ]
+    names = [links_data_lower[i][0] for i in hvdc_indices]
+    hvdc_links = [links_data_lower[i][1] for i in hvdc_indices]
+    seeds = [seed_tsgen_link] * len(names)
+    if max_workers <= 1 or len(names) <= 1:
+        results = list(map(_link_hvdc_units, hvdc_links, seeds, names))
+    else:
+        # spawn: the generator runs in a multi-threaded server process, which must not be forked
+        # Workers send back the daily units, 24 times smaller than the hourly series
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(names)), mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            results = list(executor.map(_link_hvdc_units, hvdc_links, seeds, names))
+    units_by_link: list[Optional[dict[str, "np.ndarray[Any, Any]"]]] = [None] * len(links_data_lower)
+    for i, units_by_mode in zip(hvdc_indices, results):
+        units_by_link[i] = units_by_mode
+    return units_by_link
+
+
+def _period_values_and_hvdc_mw(link_data_lower: dict[str, Any], mode: str) -> tuple[list[Any], Any]:
+    """WINTER_HC, WINTER_HP, SUMMER_HC and SUMMER_HP capacities of a direction, and its HVDC MW if any."""
+    if mode.lower() == "direct":
+        winter_hc_value = link_data_lower["winterhcdirectmw"]
+        winter_hp_value = link_data_lower["winterhpdirectmw"]
+        summer_hc_value = link_data_lower["summerhcdirectmw"]
+        summer_hp_value = link_data_lower["summerhpdirectmw"]
+        hvdc_mw = link_data_lower.get("hvdcmwdirect")
+    elif mode.lower() == "indirect":
+        winter_hc_value = link_data_lower["winterhcindirectmw"]
+        winter_hp_value = link_data_lower["winterhpindirectmw"]
+        summer_hc_value = link_data_lower["summerhcindirectmw"]
+        summer_hp_value = link_data_lower["summerhpindirectmw"]
+        hvdc_mw = link_data_lower.get("hvdcmwindirect")
     else:
-        data = link_output.indirect_available_power
+        raise ValueError("Mode must be either 'direct' or 'indirect'")
+    return [winter_hc_value, winter_hp_value, summer_hc_value, summer_hp_value], hvdc_mw
+
+
+def _hvac_period_values(period_values: list[Any], hvdc_mw: Any) -> tuple[list[Any], bool]:
+    """Period values of the HVAC part of a direction, and whether the direction is 100% HVDC."""
+    if hvdc_mw is None:
+        return period_values, False
+    is_full_hvdc = all(value == hvdc_mw for value in period_values)
+    return [value - hvdc_mw for value in period_values], is_full_hvdc
 
-    return pd.DataFrame(data)
+
+def _capacity_dtype(lowest: int, highest: int) -> np.dtype:
+    """Narrowest signed integer dtype holding capacities from ``lowest`` to ``highest`` MW."""
+    for dtype in CAPACITY_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= lowest and highest <= info.max:
+            return np.dtype(dtype)
+    raise ValueError(f"Link capacities from {lowest} to {highest} MW do not fit in 64-bit integers")
+
+
+@dataclass(frozen=True)
+class LinkCapacitySeries:
+    """
+    Hourly capacity of one direction of a link, computed on demand: the HVAC capacity (None for 100% HVDC
+    directions) plus, when the direction has an HVDC part, its daily available units times their nominal capacity.
+    """
+
+    hvac: Optional["np.ndarray[Any, Any]"]
+    hvdc_units: Optional["np.ndarray[Any, Any]"] = None
+    hvdc_capacity: Optional[LinkCapacity] = None
+
+    @cached_property
+    def dtype(self) -> np.dtype:
+        """
+        Narrowest integer dtype holding every hourly capacity, from the bounds of the HVAC capacity and of the
+        available units. float64 when the HVDC units have a fractional nominal capacity.
+        """
+        lowest = highest = 0
+        if self.hvac is not None:
+            lowest, highest = int(self.hvac.min()), int(self.hvac.max())
+        if self.hvdc_units is not None and self.hvdc_capacity is not None:
+            nominal_capacity = float(self.hvdc_capacity.nominal_capacity)
+            if not nominal_capacity.is_integer() or not (self.hvdc_capacity.modulation_direct == 1).all():
+                return np.dtype(np.float64)
+            max_units = int(self.hvdc_units.max()) if self.hvdc_units.size else 0
+            # Units are available or not (0 to max_units), the HVAC part is added to every series
+            highest += max_units * int(nominal_capacity)
+        return _capacity_dtype(lowest, highest)
+
+    def to_frame(self) -> pd.DataFrame:
+        if self.hvdc_units is None:
+            assert self.hvac is not None
+            return pd.DataFrame(self.hvac.astype(self.dtype, copy=False))
+        hvdc_ts = pd.DataFrame(self._hvdc_power(0, DAYS_PER_YEAR))
+        if self.hvac is None:
+            return hvdc_ts
+        # Sum the hvac capacity (1 column) to each column of hvdc_ts (60 columns)
+        return add_column(hvdc_ts, self.hvac.astype(self.dtype, copy=False))
+
+    def iter_blocks(self, days_per_block: int) -> Iterator["np.ndarray[Any, Any]"]:
+        """
+        Consecutive row blocks of ``to_frame()`` covering ``days_per_block`` days each, with the same values:
+        only one block of the HVDC time series is held in memory at a time.
+        """
+        for first_day in range(0, DAYS_PER_YEAR, days_per_block):
+            last_day = min(first_day + days_per_block, DAYS_PER_YEAR)
+            hours = slice(first_day * HOURS_PER_DAY, last_day * HOURS_PER_DAY)
+            if self.hvdc_units is None:
+                assert self.hvac is not None
+                yield self.hvac[hours, np.newaxis].astype(self.dtype, copy=False)
+                continue
+            block = self._hvdc_power(first_day, last_day)
+            if self.hvac is not None:
+                block += self.hvac[hours, np.newaxis].astype(self.dtype, copy=False)
+            yield block
+
+    def _hvdc_power(self, first_day: int, last_day: int) -> "np.ndarray[Any, Any]":
+        assert self.hvdc_units is not None and self.hvdc_capacity is not None
+        units = self.hvdc_units[first_day:last_day]
+        if self.dtype.kind == "f":
+            # Same operations as tsgen, the modulation of 1 included, for bit-identical values
+            hours = slice(first_day * HOURS_PER_DAY, last_day * HOURS_PER_DAY)
+            power: "np.ndarray[Any, Any]" = (
+                np.repeat(units.astype(int, copy=False), HOURS_PER_DAY, axis=0)
+                * self.hvdc_capacity.nominal_capacity
+                * self.hvdc_capacity.modulation_direct[hours, np.newaxis]
+            )
+            return power
+        # Bounds checked by dtype: the products cannot overflow
+        hourly_units = np.repeat(units.astype(self.dtype), HOURS_PER_DAY, axis=0)
+        hourly_units *= self.dtype.type(int(self.hvdc_capacity.nominal_capacity))
+        return hourly_units
+
+
+def write_link_capacity(series: LinkCapacitySeries, file_path: Path, days_per_block: int) -> None:
+    """
+    Write ``series`` as the study writes capacity matrices (tab-separated, no header), block by block.
+    The file is the same as the one written from ``series.to_frame()``.
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(file_path, "wb") as file:
+        for block in series.iter_blocks(days_per_block):
+            pl.DataFrame(block).write_csv(file, separator="\t", include_header=False)
 
 
 def generate_link_capacity_df(
-    link_data: dict[str, int], mode: str, seed_tsgen_link: int = 0, link_name: str = ""
+    link_data: dict[str, int],
+    mode: str,
+    seed_tsgen_link: int = 0,
+    link_name: str = "",
+    first_month: Month = Month.JANUARY,
 ) -> pd.DataFrame:
     """
     Generate a DataFrame representing link capacity based on input parameters.
@@ -110,6 +319,8 @@ def generate_link_capacity_df(
             applicable. Defaults to 0.
         link_name (str, optional): An identifier for the link, used for generating
             HVDC time-series if applicable. Defaults to an empty string.
+        first_month (Month, optional): First month of the study year, which sets the
+            season of each hour. Defaults to January.
 
     Returns:
         pd.DataFrame: A DataFrame representing the link capacity over 8760 hours
@@ -119,69 +330,90 @@ def generate_link_capacity_df(
     Raises:
         ValueError: If the `mode` argument is not "direct" or "indirect".
     """
-    is_full_hvdc = False
-    hvdc_ts = None
-    total_hours = 8760
-    indices = np.arange(total_hours)
-    hours = indices % 24
-    day_of_year = (indices // 24) + 1
-    seasons = np.where((day_of_year <= 90) | (day_of_year >= 274), "winter", "summer")
-    periods = np.where((hours >= 8) & (hours <= 19), "HP", "HC")
-
     # Make link_data case-insensitive by creating a lowercase copy
     link_data_lower = {k.lower(): v for k, v in link_data.items()}
 
-    if mode.lower() == "direct":
-        winter_hc_value = link_data_lower["winterhcdirectmw"]
-        winter_hp_value = link_data_lower["winterhpdirectmw"]
-        summer_hc_value = link_data_lower["summerhcdirectmw"]
-        summer_hp_value = link_data_lower["summerhpdirectmw"]
-        hvdc_mw = link_data_lower.get("hvdcmwdirect")
-    elif mode.lower() == "indirect":
-        winter_hc_value = link_data_lower["winterhcindirectmw"]
-        winter_hp_value = link_data_lower["winterhpindirectmw"]
-        summer_hc_value = link_data_lower["summerhcindirectmw"]
-        summer_hp_value = link_data_lower["summerhpindirectmw"]
-        hvdc_mw = link_data_lower.get("hvdcmwindirect")
-    else:
-        raise ValueError("Mode must be either 'direct' or 'indirect'")
+    period_values, hvdc_mw = _period_values_and_hvdc_mw(link_data_lower, mode)
+    hvac_values, is_full_hvdc = _hvac_period_values(period_values, hvdc_mw)
+    hvac = None
+    if not is_full_hvdc:
+        # Values indexed by the WINTER_HC, WINTER_HP, SUMMER_HC and SUMMER_HP periods of the calendar
+        hvac = np.array(hvac_values, dtype=np.int64)[get_study_calendar(first_month).period_of_hour]
+    if hvdc_mw is None:
+        return LinkCapacitySeries(hvac).to_frame()
+
+    link_capacity = _hvdc_link_capacity(*_hvdc_parameters(link_data_lower, mode))
+    units = _hvdc_available_units(link_capacity, seed_tsgen_link, link_name)
+    return LinkCapacitySeries(hvac, units, link_capacity).to_frame()
+
+
+def generate_links_capacity_series(
+    links_data: LinksData,
+    seed_tsgen_link: int = 0,
+    first_month: Month = Month.JANUARY,
+) -> Iterator[tuple[str, LinkCapacitySeries, LinkCapacitySeries]]:
+    """
+    ``(link_name, direct, indirect)`` capacities of several links, in the order of ``links_data``, given by name
+    or as ``(link_name, link_data)`` pairs, which keep links whose names collide.
 
-    if hvdc_mw is not None:
-        is_full_hvdc = (
-            winter_hc_value == hvdc_mw
-            and winter_hp_value == hvdc_mw
-            and summer_hc_value == hvdc_mw
-            and summer_hp_value == hvdc_mw
-        )
-        if is_full_hvdc:
-            return _generate_hvdc_ts(link_data_lower, mode, seed_tsgen_link, link_name)
-        else:
-            hvdc_ts = _generate_hvdc_ts(link_data_lower, mode, seed_tsgen_link, link_name)
-            winter_hc_value -= hvdc_mw
-            winter_hp_value -= hvdc_mw
-            summer_hc_value -= hvdc_mw
-            summer_hp_value -= hvdc_mw
-
-    capacity = np.empty(total_hours, dtype=int)
-    winter_hc_mask = (seasons == "winter") & (periods == "HC")
-    winter_hp_mask = (seasons == "winter") & (periods == "HP")
-    summer_hc_mask = (seasons == "summer") & (periods == "HC")
-    summer_hp_mask = (seasons == "summer") & (periods == "HP")
-
-    capacity[winter_hc_mask] = winter_hc_value
-    capacity[winter_hp_mask] = winter_hp_value
-    capacity[summer_hc_mask] = summer_hc_value
-    capacity[summer_hp_mask] = summer_hp_value
-
-    hvac_ts = pd.DataFrame(capacity)
-
-    if hvdc_mw is not None and not is_full_hvdc:
-        # Sum hvac_ts (1 column) to each column of hvdc_ts (60 columns)
-        # Using .values[0] or broadcasting
-        assert hvdc_ts is not None
-        return hvdc_ts.add(hvac_ts.values, axis=0)
-
-    return hvac_ts
+    The HVAC capacities of all links are computed at once, as a (links, directions, 8760) array gathered from
+    the period values of each link, and each link gets views of its rows. HVDC units are drawn when the link
+    is reached, unless they are drawn up front on a pool of processes (HVDC_TS_WORKERS > 1), and only turned
+    into hourly series by ``LinkCapacitySeries``.
+    """
+    items = links_data.items() if isinstance(links_data, Mapping) else links_data
+    links_data_lower = [(name, {k.lower(): v for k, v in link_data.items()}) for name, link_data in items]
+    hvdc_modes = np.zeros((len(links_data_lower), len(LINK_DIRECTIONS)), dtype=bool)
+    full_hvdc = np.zeros((len(links_data_lower), len(LINK_DIRECTIONS)), dtype=bool)
+    period_values = np.zeros((len(links_data_lower), len(LINK_DIRECTIONS), 4), dtype=np.int64)
+    for i, (link_name, link_data_lower) in enumerate(links_data_lower):
+        for j, mode in enumerate(LINK_DIRECTIONS):
+            values, hvdc_mw = _period_values_and_hvdc_mw(link_data_lower, mode)
+            hvac_values, full_hvdc[i, j] = _hvac_period_values(values, hvdc_mw)
+            try:
+                period_values[i, j] = hvac_values
+            except OverflowError as e:
+                raise ValueError(
+                    f"{mode.capitalize()} capacities of link {link_name} do not fit in 64-bit integers"
+                ) from e
+            hvdc_modes[i, j] = hvdc_mw is not None
+
+    if period_values.size:
+        period_values = period_values.astype(_capacity_dtype(int(period_values.min()), int(period_values.max())))
+    # Single gather of the WINTER_HC, WINTER_HP, SUMMER_HC and SUMMER_HP values of every link and direction
+    capacities = np.take(period_values, get_study_calendar(first_month).period_of_hour, axis=2)
+
+    units_by_link: list[Optional[dict[str, "np.ndarray[Any, Any]"]]] = [None] * len(links_data_lower)
+    if settings.hvdc_ts_workers > 1:
+        units_by_link = _generate_links_hvdc_units(links_data_lower, seed_tsgen_link, settings.hvdc_ts_workers)
+    return _iter_links_capacity_series(
+        links_data_lower, capacities, hvdc_modes, full_hvdc, units_by_link, seed_tsgen_link
+    )
+
+
+def _iter_links_capacity_series(
+    links_data_lower: Sequence[tuple[str, dict[str, Any]]],
+    capacities: "np.ndarray[Any, Any]",
+    hvdc_modes: "np.ndarray[Any, np.dtype[np.bool_]]",
+    full_hvdc: "np.ndarray[Any, np.dtype[np.bool_]]",
+    units_by_link: Sequence[Optional[dict[str, "np.ndarray[Any, Any]"]]],
+    seed_tsgen_link: int,
+) -> Iterator[tuple[str, LinkCapacitySeries, LinkCapacitySeries]]:
+    for i, (link_name, link_data_lower) in enumerate(links_data_lower):
+        units_by_mode = units_by_link[i]
+        if units_by_mode is None and hvdc_modes[i].any():
+            units_by_mode = _link_hvdc_units(link_data_lower, seed_tsgen_link, link_name)
+
+        series = []
+        for j, mode in enumerate(LINK_DIRECTIONS):
+            hvac = None if full_hvdc[i, j] else capacities[i, j]
+            if not hvdc_modes[i, j]:
+                series.append(LinkCapacitySeries(hvac))
+                continue
+            assert units_by_mode is not None
+            hvdc_capacity = _hvdc_link_capacity(*_hvdc_parameters(link_data_lower, mode))
+            series.append(LinkCapacitySeries(hvac, units_by_mode[mode], hvdc_capacity))
+        yield link_name, series[0], series[1]
 
 
 def generate_link_parameters_df(hurdle_cost: float) -> pd.DataFrame:
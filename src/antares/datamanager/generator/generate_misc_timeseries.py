@@ -19,8 +19,11 @@ import pandas as pd
 
 from antares.craft.model.area import Area
 from antares.datamanager.core.settings import settings
+from antares.datamanager.core.storage import input_exists, read_input_table
 from antares.datamanager.exceptions.exceptions import MiscGenerationError
 from antares.datamanager.logs.logging_setup import get_logger
+from antares.datamanager.utils.precision import series_dtype
+from antares.datamanager.utils.transform_engine import scaled_sum
 
 logger = get_logger(__name__)
 
@@ -56,14 +59,18 @@ def generate_misc_timeseries(
 
 
 def build_misc_timeseries_matrix(
-    area_name: str, misc: dict[str, Any], used_files: Optional[Set[Path]] = None
+    area_name: str, misc: dict[str, Any], used_files: Optional[Set[Path]] = None, dtype: Optional[np.dtype] = None
 ) -> pd.DataFrame:
-    matrix = pd.DataFrame(np.zeros((EXPECTED_HOURS, len(MISC_COLUMNS)), dtype=np.float64), columns=MISC_COLUMNS)
+    # Sums are accumulated in float64, the matrix follows the precision of the study
+    dtype = series_dtype(dtype)
+    matrix = pd.DataFrame(np.zeros((EXPECTED_HOURS, len(MISC_COLUMNS)), dtype=dtype), columns=MISC_COLUMNS)
 
     if not misc:
         return matrix
 
     unmapped_groups_found: set[str] = set()
+    contributions_by_column: dict[str, list[pd.Series[Any]]] = {}
+    capacities_by_column: dict[str, list[float]] = {}
 
     base_dir = settings.misc_ts_directory
     for group_name, group_values in misc.items():
@@ -88,7 +95,11 @@ def build_misc_timeseries_matrix(
         # _validate_normalized_load_factor(normalized_load_factor, area_name, group_name)
 
         # ts_values = load_factor_mean X puissance total (0 < load_factor < 1)
-        matrix[target_column] += normalized_load_factor * capacity
+        contributions_by_column.setdefault(target_column, []).append(normalized_load_factor)
+        capacities_by_column.setdefault(target_column, []).append(capacity)
+
+    for target_column, contributions in contributions_by_column.items():
+        matrix[target_column] = scaled_sum(contributions, capacities_by_column[target_column]).astype(dtype)
 
     if unmapped_groups_found:
         logger.debug(
@@ -140,7 +151,7 @@ def _read_load_factor_series(
     file_path = _resolve_and_validate_misc_path(base_dir, filename)
     if used_files is not None:
         used_files.add(file_path)
-    df = pd.read_feather(file_path)
+    df = read_input_table(file_path)
     return _extract_hourly_series(df, area_name, group_name, filename)
 
 
@@ -204,7 +215,7 @@ def _resolve_and_validate_misc_path(base_dir: Path, filename: str) -> Path:
     if base_resolved != file_path and base_resolved not in file_path.parents:
         raise MiscGenerationError(f"MISC series path outside allowed directory: '{filename}'")
 
-    if not file_path.exists():
+    if not input_exists(file_path):
         raise FileNotFoundError(f"MISC series file not found: {file_path}")
 
     return file_path
@@ -11,17 +11,21 @@
 # This file is part of the Antares project.
 from __future__ import annotations
 
+from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Mapping, Optional, Set, cast
+from typing import Any, Iterable, Mapping, Optional, Set, cast
 
 import numpy as np
 import pandas as pd
 
 from antares.craft.model.area import Area
 from antares.craft.model.renewable import RenewableClusterProperties, TimeSeriesInterpretation
-from antares.datamanager.core.settings import settings
+from antares.datamanager.core.settings import FrAggregationMode, settings
+from antares.datamanager.core.storage import input_exists, read_input_table
 from antares.datamanager.exceptions.exceptions import RESGenerationError
 from antares.datamanager.logs.logging_setup import get_logger
+from antares.datamanager.utils.precision import series_dtype
 
 logger = get_logger(__name__)
 
@@ -37,6 +41,65 @@ RES_GROUP_TO_AW = {
 }
 
 
+@dataclass(frozen=True)
+class _FrSeriesFile:
+    """One file of series_by_zone_and_tech, with the weights it is aggregated with."""
+
+    zone: str
+    tech: str
+    filename: str
+    zone_weight: float
+    tech_weight: float
+
+    @property
+    def contributes(self) -> bool:
+        return self.zone_weight > 0 and self.tech_weight > 0
+
+
+ZoneAverageKey = tuple[str, tuple[tuple[str, Optional[str], float], ...]]
+
+
+class ZoneAverageCache:
+    """
+    Zone averages shared by the FR clusters of a study.
+
+    Clusters often aggregate the same technology files of a zone with the same weights,
+    so averages are keyed by the zone and its sorted (tech, file, weight) inputs.
+    Only the zones used by several clusters (``count_uses``) are averaged and kept: the other ones
+    go straight into the contraction of their cluster.
+    """
+
+    def __init__(self) -> None:
+        self._averages: dict[ZoneAverageKey, pd.DataFrame] = {}
+        self._uses: Counter[ZoneAverageKey] = Counter()
+        self.hits = 0
+        self.misses = 0
+
+    def count_uses(self, keys: Iterable[ZoneAverageKey]) -> None:
+        self._uses.update(keys)
+
+    def is_shared(self, key: ZoneAverageKey) -> bool:
+        return self._uses[key] > 1
+
+    def get(self, key: ZoneAverageKey) -> Optional[pd.DataFrame]:
+        average = self._averages.get(key)
+        if average is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return average
+
+    def put(self, key: ZoneAverageKey, average: pd.DataFrame) -> None:
+        self._averages[key] = average
+
+    def log_statistics(self) -> None:
+        lookups = self.hits + self.misses
+        if lookups:
+            logger.info(
+                f"FR zone average cache: {self.hits}/{lookups} hits, {len(self._averages)} zone averages computed"
+            )
+
+
 def map_res_group_to_aw(group: str) -> str:
     normalized = str(group).strip().lower()
     if normalized in RES_GROUP_TO_AW:
@@ -73,15 +136,16 @@ def read_res_hourly_series(
     filename: str,
     expected_rows: int = EXPECTED_HOURS,
     used_files: Optional[Set[Path]] = None,
+    dtype: Optional[np.dtype] = None,
 ) -> pd.DataFrame:
     """
     Read an .arrow file and return a DataFrame containing all TS
-    columns.
+    columns, in ``dtype`` (the precision of the study by default).
     """
     file_path = resolve_and_validate_res_arrow_path(base_dir, filename)
     if used_files is not None:
         used_files.add(file_path)
-    df = pd.read_feather(file_path)
+    df = read_input_table(file_path)
 
     if df.empty or df.shape[1] < 1:
         raise RESGenerationError(f"RES series file has no time series columns for file='{filename}'")
@@ -98,7 +162,7 @@ def read_res_hourly_series(
         raise RESGenerationError(f"RES series file contains no numeric time series for file='{filename}'")
 
     ts_df = pd.DataFrame({column: pd.to_numeric(ts_df[column], errors="coerce") for column in ts_df.columns}).astype(
-        float
+        series_dtype(dtype)
     )
     if ts_df.isna().any(axis=None):
         raise RESGenerationError(f"RES series file contains non-numeric values for file='{filename}'")
@@ -131,7 +195,7 @@ def resolve_and_validate_res_arrow_path(
     if base_resolved != file_path and base_resolved not in file_path.parents:
         raise RESGenerationError(f"RES series path outside allowed directory: '{filename}'")
 
-    if not file_path.exists():
+    if not input_exists(file_path):
         raise FileNotFoundError(f"RES series file not found: {file_path}")
 
     return file_path
@@ -146,17 +210,12 @@ def compute_fr_weighted_load_factor(
     if not zonal_weights:
         raise RESGenerationError("zonal_weights is empty")
 
-    zone_averages = _compute_zone_averages(
+    return _compute_fr_weighted_load_factor_tensor(
         techno_series_by_zone=techno_series_by_zone,
         techno_weights_by_zone=techno_weights_by_zone,
         zonal_weights=zonal_weights,
     )
 
-    if not zone_averages:
-        raise RESGenerationError("No usable zone averages for FR weighted load factor")
-
-    return _compute_global_weighted_series(zone_averages=zone_averages, zonal_weights=zonal_weights)
-
 
 def build_res_cluster_payload(
     *,
@@ -181,7 +240,11 @@ def build_res_cluster_payload(
 
 
 def generate_res_clusters(
-    area_obj: Area, area_name: str, res: dict[str, Any], used_files: Optional[Set[Path]] = None
+    area_obj: Area,
+    area_name: str,
+    res: dict[str, Any],
+    used_files: Optional[Set[Path]] = None,
+    zone_average_cache: Optional[ZoneAverageCache] = None,
 ) -> None:
     """
     Expected RES JSON
@@ -232,6 +295,10 @@ def generate_res_clusters(
         raise RESGenerationError(f"Invalid RES payload for area='{area_name}': expected object")
 
     normalized_area_name = str(area_name).strip().upper()
+    if zone_average_cache is None:
+        zone_average_cache = ZoneAverageCache()
+    if normalized_area_name == "FR":
+        zone_average_cache.count_uses(_fr_zone_average_keys(area_name=area_name, res=res))
 
     for cluster_name, cluster_values in res.items():
         payload, validated_series = _process_res_entry(
@@ -241,6 +308,7 @@ def generate_res_clusters(
             cluster_values=cluster_values,
             base_ts_directory=base_ts_directory,
             used_files=used_files,
+            zone_average_cache=zone_average_cache,
         )
 
         logger.info("Prepared RES cluster payload area=%s cluster=%s payload=%s", area_name, cluster_name, payload)
@@ -248,6 +316,8 @@ def generate_res_clusters(
             area_obj=area_obj, cluster_name=cluster_name, payload=payload, validated_series=validated_series
         )
 
+    zone_average_cache.log_statistics()
+
 
 def _resolve_res_base_directory() -> Path:
     base_ts_directory = settings.res_ts_directory
@@ -287,7 +357,48 @@ def _build_fr_weighted_series_from_aggregation(
     raw_fr_aggregation: Any,
     base_ts_directory: Path,
     used_files: Optional[Set[Path]] = None,
+    zone_average_cache: Optional[ZoneAverageCache] = None,
 ) -> pd.DataFrame:
+    zone_weights, tech_weights_by_zone, load_plan = _parse_fr_aggregation(
+        area_name=area_name, cluster_name=cluster_name, raw_fr_aggregation=raw_fr_aggregation
+    )
+
+    if settings.fr_aggregation_mode == FrAggregationMode.STREAMING:
+        return _compute_fr_weighted_load_factor_streaming(
+            load_plan=load_plan,
+            tech_weights_by_zone=tech_weights_by_zone,
+            zone_weights=zone_weights,
+            base_ts_directory=base_ts_directory,
+            used_files=used_files,
+        )
+
+    if zone_average_cache is not None:
+        return _compute_fr_weighted_load_factor_cached(
+            load_plan=load_plan,
+            tech_weights_by_zone=tech_weights_by_zone,
+            zone_weights=zone_weights,
+            base_ts_directory=base_ts_directory,
+            zone_average_cache=zone_average_cache,
+            used_files=used_files,
+        )
+
+    techno_series_by_zone = _load_tech_series_by_zone(
+        load_plan=load_plan,
+        base_ts_directory=base_ts_directory,
+        used_files=used_files,
+    )
+
+    return compute_fr_weighted_load_factor(
+        techno_series_by_zone=techno_series_by_zone,
+        techno_weights_by_zone=tech_weights_by_zone,
+        zonal_weights=zone_weights,
+    )
+
+
+def _parse_fr_aggregation(
+    *, area_name: str, cluster_name: str, raw_fr_aggregation: Any
+) -> tuple[dict[str, float], dict[str, dict[str, float]], list[_FrSeriesFile]]:
+    """Zone weights, technology weights by zone and load plan of an fr_aggregation payload."""
     if not isinstance(raw_fr_aggregation, Mapping):
         raise RESGenerationError(
             f"Missing or invalid fr_aggregation for FR area='{area_name}', cluster='{cluster_name}'"
@@ -313,21 +424,236 @@ def _build_fr_weighted_series_from_aggregation(
         expected_zones=set(zone_weights.keys()),
     )
 
-    techno_series_by_zone = _load_tech_series_by_zone(
+    load_plan = _build_fr_load_plan(
         area_name=area_name,
         cluster_name=cluster_name,
         raw_series_by_zone_and_tech=raw_fr_aggregation.get("series_by_zone_and_tech", {}),
-        expected_zones=set(zone_weights.keys()),
-        expected_techs_by_zone={zone: set(techs.keys()) for zone, techs in tech_weights_by_zone.items()},
-        base_ts_directory=base_ts_directory,
-        used_files=used_files,
+        zone_weights=zone_weights,
+        tech_weights_by_zone=tech_weights_by_zone,
     )
+    return zone_weights, tech_weights_by_zone, load_plan
 
-    return compute_fr_weighted_load_factor(
-        techno_series_by_zone=techno_series_by_zone,
-        techno_weights_by_zone=tech_weights_by_zone,
-        zonal_weights=zone_weights,
-    )
+
+def _fr_zone_average_keys(*, area_name: str, res: Mapping[str, Any]) -> list[ZoneAverageKey]:
+    """
+    Keys of the active zones of every FR cluster, so that the zones shared by several clusters are known upfront.
+    Invalid payloads are left to the generation of their cluster, which reports them.
+    """
+    keys: list[ZoneAverageKey] = []
+    for cluster_name, cluster_values in res.items():
+        if not isinstance(cluster_values, Mapping):
+            continue
+        try:
+            zone_weights, tech_weights_by_zone, load_plan = _parse_fr_aggregation(
+                area_name=area_name,
+                cluster_name=cluster_name,
+                raw_fr_aggregation=cluster_values.get("fr_aggregation"),
+            )
+        except RESGenerationError:
+            continue
+        for zone, zone_weight in zone_weights.items():
+            tech_weights = tech_weights_by_zone.get(zone)
+            if zone_weight > 0 and tech_weights:
+                zone_plan = [entry for entry in load_plan if entry.zone == zone]
+                keys.append(_zone_average_key(zone, tech_weights, zone_plan))
+    return keys
+
+
+def _compute_fr_weighted_load_factor_cached(
+    *,
+    load_plan: list[_FrSeriesFile],
+    tech_weights_by_zone: Mapping[str, Mapping[str, float]],
+    zone_weights: Mapping[str, float],
+    base_ts_directory: Path,
+    zone_average_cache: ZoneAverageCache,
+    used_files: Optional[Set[Path]] = None,
+) -> pd.DataFrame:
+    """
+    Same result as ``compute_fr_weighted_load_factor``, as a single contraction per cluster.
+
+    Zones used by several clusters enter the contraction as their zone average, computed for the first
+    of them and reused by the next ones (whose files are then validated and registered only). The other
+    zones enter it as their technology series, like in ``_compute_fr_weighted_load_factor_tensor``.
+    """
+    plan_by_zone: dict[str, list[_FrSeriesFile]] = {}
+    for entry in load_plan:
+        plan_by_zone.setdefault(entry.zone, []).append(entry)
+
+    frames: list[pd.DataFrame] = []
+    coefficients: list[float] = []
+    zone_weight_sum = 0.0
+    for zone, zone_weight in zone_weights.items():
+        zone_plan = plan_by_zone.get(zone, [])
+        if zone_weight == 0:
+            _register_fr_series_files(zone_plan, base_ts_directory, used_files)
+            continue
+
+        tech_weights = tech_weights_by_zone.get(zone)
+
+        # active zones (> 0) MUST have technology rows
+        if tech_weights is None or not tech_weights:
+            raise RESGenerationError(f"Active zone '{zone}' is missing from tech_weights_by_zone")
+
+        key = _zone_average_key(zone, tech_weights, zone_plan)
+        if zone_average_cache.is_shared(key):
+            average = zone_average_cache.get(key)
+            if average is None:
+                series_by_tech = _load_tech_series_by_zone(
+                    load_plan=zone_plan, base_ts_directory=base_ts_directory, used_files=used_files
+                ).get(zone, {})
+                average = _compute_zone_average(zone=zone, tech_weights=tech_weights, series_by_tech=series_by_tech)
+                zone_average_cache.put(key, average)
+            else:
+                _register_fr_series_files(zone_plan, base_ts_directory, used_files)
+            zone_frames, zone_coefficients = [average], [1.0]
+        else:
+            series_by_tech = _load_tech_series_by_zone(
+                load_plan=zone_plan, base_ts_directory=base_ts_directory, used_files=used_files
+            ).get(zone, {})
+            zone_frames, weights = _collect_zone_series(
+                zone=zone, tech_weights=tech_weights, series_by_tech=series_by_tech
+            )
+            zone_coefficients = [weight / sum(weights) for weight in weights]
+
+        if frames:
+            if len(zone_frames[0]) != len(frames[0]):
+                raise RESGenerationError(f"Inconsistent zone series length for zone='{zone}'")
+            if list(zone_frames[0].columns) != list(frames[0].columns):
+                raise RESGenerationError(f"Inconsistent zone series columns for zone='{zone}'")
+
+        frames.extend(zone_frames)
+        coefficients.extend(zone_weight * coefficient for coefficient in zone_coefficients)
+        zone_weight_sum += zone_weight
+
+    if not frames:
+        raise RESGenerationError("No usable zone averages for FR weighted load factor")
+
+    return _contract(frames, [coefficient / zone_weight_sum for coefficient in coefficients])
+
+
+def _compute_fr_weighted_load_factor_streaming(
+    *,
+    load_plan: list[_FrSeriesFile],
+    tech_weights_by_zone: Mapping[str, Mapping[str, float]],
+    zone_weights: Mapping[str, float],
+    base_ts_directory: Path,
+    used_files: Optional[Set[Path]] = None,
+) -> pd.DataFrame:
+    """
+    Same result as ``compute_fr_weighted_load_factor``, folding each file into running weighted sums
+    as soon as it is read: only one input series is resident besides the zone and global accumulators.
+    Zone averages are not kept for other clusters, so that memory does not grow with the number of zones.
+    """
+    plan_by_zone: dict[str, list[_FrSeriesFile]] = {}
+    for entry in load_plan:
+        plan_by_zone.setdefault(entry.zone, []).append(entry)
+
+    global_sum: Optional[np.ndarray[Any, np.dtype[np.float64]]] = None
+    columns: list[Any] = []
+    zone_weight_sum = 0.0
+    for zone, zone_weight in zone_weights.items():
+        zone_plan = plan_by_zone.get(zone, [])
+        if zone_weight == 0:
+            _register_fr_series_files(zone_plan, base_ts_directory, used_files)
+            continue
+
+        tech_weights = tech_weights_by_zone.get(zone)
+
+        # active zones (> 0) MUST have technology rows
+        if tech_weights is None or not tech_weights:
+            raise RESGenerationError(f"Active zone '{zone}' is missing from tech_weights_by_zone")
+
+        zone_average, zone_columns = _stream_zone_average(
+            zone=zone,
+            tech_weights=tech_weights,
+            zone_plan=zone_plan,
+            base_ts_directory=base_ts_directory,
+            used_files=used_files,
+        )
+        if global_sum is None:
+            global_sum = np.zeros_like(zone_average)
+            columns = zone_columns
+        elif zone_average.shape[0] != global_sum.shape[0]:
+            raise RESGenerationError(f"Inconsistent zone series length for zone='{zone}'")
+        elif zone_columns != columns:
+            raise RESGenerationError(f"Inconsistent zone series columns for zone='{zone}'")
+
+        zone_average *= zone_weight
+        global_sum += zone_average
+        zone_weight_sum += zone_weight
+
+    if global_sum is None:
+        raise RESGenerationError("No usable zone averages for FR weighted load factor")
+
+    global_sum /= zone_weight_sum
+    return pd.DataFrame(global_sum, columns=columns)
+
+
+def _stream_zone_average(
+    *,
+    zone: str,
+    tech_weights: Mapping[str, float],
+    zone_plan: list[_FrSeriesFile],
+    base_ts_directory: Path,
+    used_files: Optional[Set[Path]] = None,
+) -> tuple[np.ndarray[Any, np.dtype[np.float64]], list[Any]]:
+    files_by_tech = {entry.tech: entry for entry in zone_plan}
+    zone_sum: Optional[np.ndarray[Any, np.dtype[np.float64]]] = None
+    columns: list[Any] = []
+    weight_sum = 0.0
+
+    for tech, tech_weight in tech_weights.items():
+        if tech_weight < 0:
+            raise RESGenerationError(f"Negative technology weight for zone='{zone}', tech='{tech}'")
+
+        entry = files_by_tech.get(tech)
+        # Skip techs with weight 0
+        if tech_weight == 0:
+            if entry is not None:
+                _register_fr_series_files([entry], base_ts_directory, used_files)
+            continue
+
+        if entry is None:
+            raise RESGenerationError(f"Missing technology series for zone='{zone}', tech='{tech}'")
+        series = read_res_hourly_series(
+            base_dir=base_ts_directory,
+            filename=entry.filename,
+            expected_rows=EXPECTED_HOURS,
+            used_files=used_files,
+        )
+        values = _coerce_numeric_df(df=series, zone=zone, tech=tech).to_numpy(dtype=np.float64)
+        if zone_sum is None:
+            zone_sum = np.zeros_like(values)
+            columns = list(series.columns)
+        elif values.shape[0] != zone_sum.shape[0]:
+            raise RESGenerationError(f"Inconsistent series length in zone='{zone}', tech='{tech}'")
+        elif list(series.columns) != columns:
+            raise RESGenerationError(f"Inconsistent series columns in zone='{zone}', tech='{tech}'")
+
+        zone_sum += values * tech_weight
+        weight_sum += tech_weight
+        # Release the input before reading the next one
+        del series, values
+
+    if zone_sum is None or weight_sum <= 0:
+        raise RESGenerationError(f"No usable technology series for zone='{zone}'")
+
+    zone_sum /= weight_sum
+    return zone_sum, columns
+
+
+def _zone_average_key(zone: str, tech_weights: Mapping[str, float], zone_plan: list[_FrSeriesFile]) -> ZoneAverageKey:
+    filenames = {entry.tech: entry.filename for entry in zone_plan}
+    return zone, tuple(sorted((tech, filenames.get(tech), weight) for tech, weight in tech_weights.items()))
+
+
+def _register_fr_series_files(
+    load_plan: list[_FrSeriesFile], base_ts_directory: Path, used_files: Optional[Set[Path]]
+) -> None:
+    for entry in load_plan:
+        file_path = resolve_and_validate_res_arrow_path(base_ts_directory, entry.filename)
+        if used_files is not None:
+            used_files.add(file_path)
 
 
 def _parse_zone_weights(*, area_name: str, cluster_name: str, raw_zone_weights: Any) -> dict[str, float]:
@@ -385,28 +711,26 @@ def _parse_tech_weights_by_zone(
     return parsed
 
 
-def _load_tech_series_by_zone(
+def _build_fr_load_plan(
     *,
     area_name: str,
     cluster_name: str,
     raw_series_by_zone_and_tech: Any,
-    expected_zones: set[str],
-    expected_techs_by_zone: Mapping[str, set[str]],
-    base_ts_directory: Path,
-    used_files: Optional[Set[Path]] = None,
-) -> dict[str, dict[str, pd.DataFrame]]:
+    zone_weights: Mapping[str, float],
+    tech_weights_by_zone: Mapping[str, Mapping[str, float]],
+) -> list[_FrSeriesFile]:
     if not isinstance(raw_series_by_zone_and_tech, Mapping):
         raise RESGenerationError(f"Invalid series_by_zone_and_tech for area='{area_name}', cluster='{cluster_name}'")
 
     incoming_zones = {str(zone).strip().upper() for zone in raw_series_by_zone_and_tech.keys()}
     for zone in incoming_zones:
-        if zone not in expected_zones:
+        if zone not in zone_weights:
             raise RESGenerationError(
                 f"Zone '{zone}' in series_by_zone_and_tech not found in zone_weights for "
                 f"area='{area_name}', cluster='{cluster_name}'"
             )
 
-    series_by_zone: dict[str, dict[str, pd.DataFrame]] = {}
+    load_plan: list[_FrSeriesFile] = []
     for raw_zone, raw_series_by_tech in raw_series_by_zone_and_tech.items():
         zone = str(raw_zone).strip().upper()
         if not isinstance(raw_series_by_tech, Mapping):
@@ -414,8 +738,9 @@ def _load_tech_series_by_zone(
                 f"Invalid technology series map for zone='{zone}', area='{area_name}', cluster='{cluster_name}'"
             )
 
+        tech_weights = tech_weights_by_zone.get(zone, {})
         tech_keys = {str(key).strip() for key in raw_series_by_tech.keys()}
-        expected_techs = expected_techs_by_zone.get(zone, set())
+        expected_techs = set(tech_weights.keys())
 
         # Verify that all series tech keys are a subset of expected techs
         if not tech_keys.issubset(expected_techs):
@@ -425,16 +750,48 @@ def _load_tech_series_by_zone(
                 f"area='{area_name}', cluster='{cluster_name}'"
             )
 
-        loaded_by_tech: dict[str, pd.DataFrame] = {}
-        for tech, filename in raw_series_by_tech.items():
-            loaded_by_tech[str(tech).strip()] = read_res_hourly_series(
-                base_dir=base_ts_directory,
-                filename=str(filename),
-                expected_rows=EXPECTED_HOURS,
-                used_files=used_files,
+        for raw_tech, filename in raw_series_by_tech.items():
+            tech = str(raw_tech).strip()
+            load_plan.append(
+                _FrSeriesFile(
+                    zone=zone,
+                    tech=tech,
+                    filename=str(filename),
+                    zone_weight=zone_weights[zone],
+                    tech_weight=tech_weights[tech],
+                )
             )
-        series_by_zone[zone] = loaded_by_tech
 
+    return load_plan
+
+
+def _load_tech_series_by_zone(
+    *,
+    load_plan: list[_FrSeriesFile],
+    base_ts_directory: Path,
+    used_files: Optional[Set[Path]] = None,
+) -> dict[str, dict[str, pd.DataFrame]]:
+    """
+    Read the series of the plan that contribute to the FR load factor.
+    The other ones are only checked for existence and registered for cleanup.
+    """
+    series_by_zone: dict[str, dict[str, pd.DataFrame]] = {}
+    skipped = 0
+    for entry in load_plan:
+        if not entry.contributes:
+            _register_fr_series_files([entry], base_ts_directory, used_files)
+            skipped += 1
+            continue
+
+        series_by_zone.setdefault(entry.zone, {})[entry.tech] = read_res_hourly_series(
+            base_dir=base_ts_directory,
+            filename=entry.filename,
+            expected_rows=EXPECTED_HOURS,
+            used_files=used_files,
+        )
+
+    if skipped:
+        logger.debug(f"Skipped reading {skipped}/{len(load_plan)} FR series files with a zero weight")
     return series_by_zone
 
 
@@ -455,24 +812,41 @@ def _coerce_numeric_df(*, df: pd.DataFrame | pd.Series[Any], zone: str, tech: st
             raise RESGenerationError(f"Non numeric values for zone='{zone}', tech='{tech}'")
         return pd.DataFrame({numeric_series.name or "value": numeric_series.astype(float)})
 
-    numeric = pd.DataFrame({column: pd.to_numeric(df[column], errors="coerce") for column in df.columns})
+    if all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes):
+        # Already validated series (read_res_hourly_series), no per-column conversion needed
+        numeric = df
+    else:
+        numeric = pd.DataFrame({column: pd.to_numeric(df[column], errors="coerce") for column in df.columns})
     if numeric.isna().any().any():
         raise RESGenerationError(f"Non numeric values for zone='{zone}', tech='{tech}'")
-    return numeric.astype(float)
+    return numeric.astype(float, copy=False)
 
 
 def _compute_zone_average(
     *,
     zone: str,
     tech_weights: Mapping[str, float],
-    series_by_tech: dict[str, pd.DataFrame],
+    series_by_tech: Mapping[str, pd.DataFrame],
 ) -> pd.DataFrame:
+    weighted_frames, weights = _collect_zone_series(zone=zone, tech_weights=tech_weights, series_by_tech=series_by_tech)
+    weight_sum = sum(weights)
+    return _contract(weighted_frames, [weight / weight_sum for weight in weights])
+
+
+def _collect_zone_series(
+    *,
+    zone: str,
+    tech_weights: Mapping[str, float],
+    series_by_tech: Mapping[str, pd.DataFrame],
+) -> tuple[list[pd.DataFrame], list[float]]:
+    """
+    Validated numeric series of the technologies of ``zone`` with a positive weight, and their weights.
+    """
     if not tech_weights:
         raise RESGenerationError(f"No technology weights for zone='{zone}'")
 
-    weighted_sum: pd.DataFrame | None = None
-    weight_sum = 0.0
-    has_positive_weight = False
+    weighted_frames: list[pd.DataFrame] = []
+    weights: list[float] = []
 
     for tech, tech_weight in tech_weights.items():
         if tech_weight < 0:
@@ -482,38 +856,40 @@ def _compute_zone_average(
         if tech_weight == 0:
             continue
 
-        has_positive_weight = True
         if tech not in series_by_tech:
             raise RESGenerationError(f"Missing technology series for zone='{zone}', tech='{tech}'")
         series = series_by_tech[tech]
         numeric_series = _coerce_numeric_df(df=series, zone=zone, tech=tech)
-        if weighted_sum is None:
-            weighted_sum = pd.DataFrame(
-                np.zeros((len(numeric_series), len(numeric_series.columns)), dtype=np.float64),
-                columns=numeric_series.columns,
-            )
-        else:
-            if len(numeric_series) != len(weighted_sum):
+        if weighted_frames:
+            if len(numeric_series) != len(weighted_frames[0]):
                 raise RESGenerationError(f"Inconsistent series length in zone='{zone}', tech='{tech}'")
-            if list(numeric_series.columns) != list(weighted_sum.columns):
+            if list(numeric_series.columns) != list(weighted_frames[0].columns):
                 raise RESGenerationError(f"Inconsistent series columns in zone='{zone}', tech='{tech}'")
 
-        weighted_sum = weighted_sum + (numeric_series * float(tech_weight))
-        weight_sum += float(tech_weight)
+        weighted_frames.append(numeric_series)
+        weights.append(float(tech_weight))
 
-    if not has_positive_weight or weighted_sum is None or weight_sum <= 0:
+    if not weighted_frames or sum(weights) <= 0:
         raise RESGenerationError(f"No usable technology series for zone='{zone}'")
 
-    return weighted_sum / weight_sum
+    return weighted_frames, weights
 
 
-def _compute_zone_averages(
+def _compute_fr_weighted_load_factor_tensor(
     *,
     techno_series_by_zone: dict[str, dict[str, pd.DataFrame]],
     techno_weights_by_zone: dict[str, dict[str, float]],
     zonal_weights: Mapping[str, float],
-) -> dict[str, pd.DataFrame]:
-    zone_averages: dict[str, pd.DataFrame] = {}
+) -> pd.DataFrame:
+    """
+    FR load factor as one contraction over every (zone, tech) series:
+    ``sum_zt c_zt * x_zt`` with ``c_zt = (W_z / sum_z W_z) * (w_zt / sum_t w_zt)``,
+    which equals the average over zones of the per-zone technology averages.
+    """
+    frames: list[pd.DataFrame] = []
+    coefficients: list[float] = []
+    zone_weight_sum = 0.0
+
     for zone, zone_weight in zonal_weights.items():
         if zone_weight < 0:
             raise RESGenerationError(f"Negative zonal weight for zone='{zone}': {zone_weight}")
@@ -528,51 +904,35 @@ def _compute_zone_averages(
         if tech_weights is None or not tech_weights:
             raise RESGenerationError(f"Active zone '{zone}' is missing from tech_weights_by_zone")
 
-        series_by_tech = techno_series_by_zone.get(zone, {})
-
-        zone_averages[zone] = _compute_zone_average(
-            zone=zone,
-            tech_weights=tech_weights,
-            series_by_tech=series_by_tech,
+        zone_frames, weights = _collect_zone_series(
+            zone=zone, tech_weights=tech_weights, series_by_tech=techno_series_by_zone.get(zone, {})
         )
+        if frames:
+            if len(zone_frames[0]) != len(frames[0]):
+                raise RESGenerationError(f"Inconsistent zone series length for zone='{zone}'")
+            if list(zone_frames[0].columns) != list(frames[0].columns):
+                raise RESGenerationError(f"Inconsistent zone series columns for zone='{zone}'")
 
-    return zone_averages
-
-
-def _compute_global_weighted_series(
-    *,
-    zone_averages: Mapping[str, pd.DataFrame],
-    zonal_weights: Mapping[str, float],
-) -> pd.DataFrame:
-    global_series_sum: pd.DataFrame | None = None
-    global_weight_sum = 0.0
-
-    for zone, zone_weight in zonal_weights.items():
-        # Skip zones with zero weight
-        if zone_weight == 0:
-            continue
+        tech_weight_sum = sum(weights)
+        frames.extend(zone_frames)
+        coefficients.extend(zone_weight * weight / tech_weight_sum for weight in weights)
+        zone_weight_sum += zone_weight
 
-        zone_series = zone_averages.get(zone)
-        if zone_series is None:
-            continue
+    if not frames:
+        raise RESGenerationError("No usable zone averages for FR weighted load factor")
 
-        if global_series_sum is None:
-            global_series_sum = pd.DataFrame(
-                np.zeros((len(zone_series), len(zone_series.columns)), dtype=np.float64), columns=zone_series.columns
-            )
-        else:
-            if len(zone_series) != len(global_series_sum):
-                raise RESGenerationError(f"Inconsistent zone series length for zone='{zone}'")
-            if list(zone_series.columns) != list(global_series_sum.columns):
-                raise RESGenerationError(f"Inconsistent zone series columns for zone='{zone}'")
+    return _contract(frames, [coefficient / zone_weight_sum for coefficient in coefficients])
 
-        global_series_sum = global_series_sum + (zone_series * float(zone_weight))
-        global_weight_sum += float(zone_weight)
 
-    if global_series_sum is None or global_weight_sum <= 0:
-        raise RESGenerationError("No usable global weighted load factor for FR")
+def _contract(frames: list[pd.DataFrame], coefficients: list[float]) -> pd.DataFrame:
+    """``sum_k coefficients[k] * frames[k]`` for frames sharing the same shape and columns."""
+    # One contiguous (series, hours, years) block, filled in place
+    stacked = np.empty((len(frames), *frames[0].shape), dtype=np.float64)
+    for index, frame in enumerate(frames):
+        stacked[index] = frame.to_numpy(dtype=np.float64)
 
-    return global_series_sum / global_weight_sum
+    result = np.tensordot(np.asarray(coefficients), stacked, axes=1)
+    return pd.DataFrame(result, columns=frames[0].columns)
 
 
 def _parse_single_zone_tech_weights(
@@ -610,6 +970,7 @@ def _process_res_entry(
     cluster_values: Any,
     base_ts_directory: Path,
     used_files: Optional[Set[Path]] = None,
+    zone_average_cache: Optional[ZoneAverageCache] = None,
 ) -> tuple[dict[str, Any], pd.DataFrame | None]:
     if not isinstance(cluster_values, Mapping):
         raise RESGenerationError(f"Invalid RES cluster payload for area='{area_name}', cluster='{cluster_name}'")
@@ -647,6 +1008,7 @@ def _process_res_entry(
         fr_aggregation=fr_aggregation,
         base_ts_directory=base_ts_directory,
         used_files=used_files,
+        zone_average_cache=zone_average_cache,
     )
     return payload, validated_series
 
@@ -660,19 +1022,23 @@ def _compute_cluster_series(
     fr_aggregation: Any,
     base_ts_directory: Path,
     used_files: Optional[Set[Path]] = None,
+    zone_average_cache: Optional[ZoneAverageCache] = None,
 ) -> pd.DataFrame:
     if normalized_area_name == "FR":
         if series_files:
             raise RESGenerationError(
                 f"FR RES computed mode expects empty series for area='{area_name}', cluster='{cluster_name}'"
             )
-        return _build_fr_weighted_series_from_aggregation(
+        # Aggregation is accumulated in float64, the result follows the precision of the study
+        fr_series = _build_fr_weighted_series_from_aggregation(
             area_name=area_name,
             cluster_name=cluster_name,
             raw_fr_aggregation=fr_aggregation,
             base_ts_directory=base_ts_directory,
             used_files=used_files,
+            zone_average_cache=zone_average_cache,
         )
+        return fr_series.astype(series_dtype(), copy=False)
 
     if fr_aggregation is not None:
         raise RESGenerationError(
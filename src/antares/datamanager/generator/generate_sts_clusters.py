@@ -9,9 +9,13 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 # This file is part of the Antares project.
+from array import array
+from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, NoReturn, Optional, Set
 
+import numpy as np
 import pandas as pd
 
 from antares.craft import (
@@ -23,6 +27,7 @@ from antares.craft import (
     STStorageProperties,
 )
 from antares.datamanager.core.settings import settings
+from antares.datamanager.core.storage import input_exists, inputs_exist, read_input_tables
 from antares.datamanager.logs.logging_setup import configure_ecs_logger, get_logger
 
 # Configurer le logger au démarrage du module (ou appeler configure_ecs_logger() dans le main)
@@ -31,12 +36,16 @@ logger = get_logger(__name__)
 
 
 STS_CSV_MARKER = ".csv"
+HOURS_PER_YEAR = 8760
+# Prefixes of the STS matrix files, each one pushed with its own storage setter
+STS_MATRIX_KINDS = ("inflows", "lower_curve", "Pmax_injection", "Pmax_soutirage", "upper_curve")
 STS_ENABLED_BY_VALUE = {"true": True, "false": False}
 STS_OPERATOR_BY_VALUE = {operator.value: operator for operator in AdditionalConstraintOperator}
 STS_VARIABLE_BY_VALUE = {variable.value: variable for variable in AdditionalConstraintVariable}
 
 
-def _resolve_sts_file_path(base_dir: Path, filename: str, cluster_name: str, file_kind: str) -> Path:
+def _sts_file_path(base_dir_resolved: Path, filename: str, cluster_name: str, file_kind: str) -> Path:
+    """Path of an STS input file, which must stay within the (already resolved) STS directory."""
     if not isinstance(filename, str) or not filename.strip():
         raise ValueError(f"Invalid {file_kind} filename for cluster '{cluster_name}': {filename!r}")
 
@@ -44,12 +53,16 @@ def _resolve_sts_file_path(base_dir: Path, filename: str, cluster_name: str, fil
     if file_name_path.is_absolute() or ".." in file_name_path.parts:
         raise ValueError(f"Unsafe {file_kind} filename for cluster '{cluster_name}': {filename!r}")
 
-    file_path = (base_dir / file_name_path).resolve(strict=False)
-    base_dir_resolved = base_dir.resolve(strict=False)
+    file_path = (base_dir_resolved / file_name_path).resolve(strict=False)
     if base_dir_resolved not in file_path.parents and file_path != base_dir_resolved:
         raise ValueError(f"Unsafe {file_kind} path for cluster '{cluster_name}': {file_path}")
 
-    if not file_path.exists():
+    return file_path
+
+
+def _resolve_sts_file_path(base_dir: Path, filename: str, cluster_name: str, file_kind: str) -> Path:
+    file_path = _sts_file_path(base_dir.resolve(strict=False), filename, cluster_name, file_kind)
+    if not input_exists(file_path):
         raise FileNotFoundError(f"STS {file_kind} file not found for cluster '{cluster_name}': {file_path}")
 
     return file_path
@@ -76,6 +89,56 @@ def _extract_matrix(df: pd.DataFrame) -> pd.DataFrame:
     return df.iloc[:, [0]]
 
 
+@dataclass(frozen=True)
+class StsMatrixInput:
+    cluster_name: str
+    kind: str
+    path: Path
+
+
+def load_sts_matrices(
+    sts: Dict[str, Any], base_dir: Path, used_files: Optional[Set[Path]] = None
+) -> dict[str, list[tuple[str, pd.DataFrame]]]:
+    """
+    Matrices of all the STS clusters of an area, as ``{cluster_name: [(kind, matrix)]}`` in payload order.
+
+    Every path is checked and the files read concurrently before any storage is created; matrices must have
+    8760 rows (an empty matrix keeps the Antares default values). Files with an unknown prefix are ignored.
+    """
+    base_dir_resolved = base_dir.resolve(strict=False)
+    inputs: list[StsMatrixInput] = []
+    for cluster_name, values in sts.items():
+        for filename in _extract_sts_series(values, cluster_name):
+            kind = filename.split(".")[0]
+            if kind not in STS_MATRIX_KINDS:
+                continue
+            inputs.append(
+                StsMatrixInput(cluster_name, kind, _sts_file_path(base_dir_resolved, filename, cluster_name, "matrix"))
+            )
+
+    existing = inputs_exist([matrix_input.path for matrix_input in inputs])
+    # Files found are registered before a missing one fails the area, so they are still cleaned up or snapshotted
+    if used_files is not None:
+        used_files.update(path for path, exists in existing.items() if exists)
+    for matrix_input in inputs:
+        if not existing[matrix_input.path]:
+            raise FileNotFoundError(
+                f"STS matrix file not found for cluster '{matrix_input.cluster_name}': {matrix_input.path}"
+            )
+
+    tables = read_input_tables([matrix_input.path for matrix_input in inputs])
+    matrices: dict[str, list[tuple[str, pd.DataFrame]]] = {cluster_name: [] for cluster_name in sts}
+    for matrix_input in inputs:
+        matrix = _extract_matrix(tables[matrix_input.path])
+        if len(matrix) not in (0, HOURS_PER_YEAR):
+            raise ValueError(
+                f"Invalid STS {matrix_input.kind} matrix for cluster '{matrix_input.cluster_name}': "
+                f"expected {HOURS_PER_YEAR} rows, got {len(matrix)} ({matrix_input.path})"
+            )
+        matrices[matrix_input.cluster_name].append((matrix_input.kind, matrix))
+    return matrices
+
+
 def _parse_enabled(value: Any, cluster_name: str, constraint_name: str) -> bool:
     if isinstance(value, bool):
         return value
@@ -124,24 +187,53 @@ def _parse_occurrences(raw_hours: Any, cluster_name: str, constraint_name: str)
             f"Invalid hours payload for STS constraint '{constraint_name}' in cluster '{cluster_name}': expected list"
         )
 
-    occurrences: list[Occurrence] = []
+    if not raw_hours:
+        return []
     for index, occurrence_hours in enumerate(raw_hours, start=1):
         if not isinstance(occurrence_hours, list):
             raise ValueError(
                 f"Invalid hours block #{index} for STS constraint '{constraint_name}' in cluster '{cluster_name}'"
             )
 
-        sanitized_hours: list[int] = []
-        for hour in occurrence_hours:
-            if not isinstance(hour, int) or hour <= 0:
-                raise ValueError(
-                    f"Invalid hour value in STS constraint '{constraint_name}' for cluster '{cluster_name}': {hour!r}"
-                )
-            sanitized_hours.append(hour)
+    _validate_occurrence_hours(raw_hours, cluster_name, constraint_name)
+    # Occurrences are only built once every block is valid
+    return [Occurrence(hours=list(occurrence_hours)) for occurrence_hours in raw_hours]
+
+
+def _validate_occurrence_hours(blocks: list[list[Any]], cluster_name: str, constraint_name: str) -> None:
+    """
+    Check the hours of all occurrence blocks at once, as a compact array:
+    integers in 1..8760, without duplicates within a block.
+    """
+    flat = list(chain.from_iterable(blocks))
+    try:
+        # array.array only accepts integers, at C speed
+        values = np.frombuffer(array("q", flat), dtype=np.int64)
+    except (TypeError, OverflowError):
+        _raise_invalid_hour(
+            next(hour for hour in flat if not isinstance(hour, int) or not 1 <= hour <= HOURS_PER_YEAR),
+            cluster_name,
+            constraint_name,
+        )
+    out_of_range = (values < 1) | (values > HOURS_PER_YEAR)
+    if out_of_range.any():
+        _raise_invalid_hour(flat[int(np.argmax(out_of_range))], cluster_name, constraint_name)
+
+    # Same hour twice in a block: equal consecutive keys once sorted by (block, hour)
+    lengths = np.fromiter((len(block) for block in blocks), dtype=np.int64, count=len(blocks))
+    block_ids = np.repeat(np.arange(len(blocks), dtype=np.int64), lengths)
+    keys = np.sort(block_ids * (HOURS_PER_YEAR + 1) + values.astype(np.int16))
+    duplicates = keys[1:] == keys[:-1]
+    if duplicates.any():
+        block_index, hour = divmod(int(keys[1:][duplicates][0]), HOURS_PER_YEAR + 1)
+        raise ValueError(
+            f"Duplicate hour {hour} in hours block #{block_index + 1} for STS constraint '{constraint_name}' "
+            f"in cluster '{cluster_name}'"
+        )
 
-        occurrences.append(Occurrence(hours=sanitized_hours))
 
-    return occurrences
+def _raise_invalid_hour(hour: Any, cluster_name: str, constraint_name: str) -> NoReturn:
+    raise ValueError(f"Invalid hour value in STS constraint '{constraint_name}' for cluster '{cluster_name}': {hour!r}")
 
 
 def _extract_constraint_name_from_series_file(filename: str) -> str | None:
@@ -181,6 +273,9 @@ def _create_sts_additional_constraints(
             raise ValueError(f"Duplicate RHS series for STS constraint '{constraint_name}' in cluster '{cluster_name}'")
         series_by_constraint_name[constraint_name] = filename
 
+    # Every constraint is parsed and its RHS file resolved before anything is created
+    constraints: list[STStorageAdditionalConstraint] = []
+    rhs_paths: dict[str, Path] = {}
     for constraint_name, constraint_data in raw_constraints.items():
         if not isinstance(constraint_name, str) or not constraint_name.strip():
             raise ValueError(f"Invalid STS constraint name for cluster '{cluster_name}': {constraint_name!r}")
@@ -189,37 +284,48 @@ def _create_sts_additional_constraints(
                 f"Invalid STS constraint payload for '{constraint_name}' in cluster '{cluster_name}': expected object"
             )
 
-        constraint = STStorageAdditionalConstraint(
-            name=constraint_name,
-            variable=_parse_variable(constraint_data.get("variable"), cluster_name, constraint_name),
-            operator=_parse_operator(constraint_data.get("operator"), cluster_name, constraint_name),
-            occurrences=_parse_occurrences(constraint_data.get("hours"), cluster_name, constraint_name),
-            enabled=_parse_enabled(constraint_data.get("enabled", True), cluster_name, constraint_name),
+        constraints.append(
+            STStorageAdditionalConstraint(
+                name=constraint_name,
+                variable=_parse_variable(constraint_data.get("variable"), cluster_name, constraint_name),
+                operator=_parse_operator(constraint_data.get("operator"), cluster_name, constraint_name),
+                occurrences=_parse_occurrences(constraint_data.get("hours"), cluster_name, constraint_name),
+                enabled=_parse_enabled(constraint_data.get("enabled", True), cluster_name, constraint_name),
+            )
         )
-        storage.create_constraints([constraint])
 
         rhs_filename = series_by_constraint_name.get(constraint_name.lower())
         if rhs_filename is None:
             raise FileNotFoundError(
                 f"No RHS series found for STS constraint '{constraint_name}' in cluster '{cluster_name}'"
             )
+        rhs_paths[constraint_name] = _resolve_sts_file_path(
+            base_dir, rhs_filename, cluster_name, "constraint RHS matrix"
+        )
+
+    if not constraints:
+        return
+
+    if used_files is not None:
+        used_files.update(rhs_paths.values())
+    rhs_tables = read_input_tables(list(rhs_paths.values()))
 
-        rhs_path = _resolve_sts_file_path(base_dir, rhs_filename, cluster_name, "constraint RHS matrix")
-        if used_files is not None:
-            used_files.add(rhs_path)
-        rhs_df = pd.read_feather(rhs_path)
-        storage.set_constraint_term(constraint_name, _extract_matrix(rhs_df))
+    storage.create_constraints(constraints)
+    # antares-craft has no bulk setter for the RHS terms, they are set one constraint at a time
+    for constraint_name, rhs_path in rhs_paths.items():
+        storage.set_constraint_term(constraint_name, _extract_matrix(rhs_tables[rhs_path]))
 
 
 def generate_sts_clusters(area_obj: Area, sts: Dict[str, Any], used_files: Optional[Set[Path]] = None) -> None:
+    base_dir = settings.sts_ts_directory
+    matrices_by_cluster = load_sts_matrices(sts, base_dir, used_files)
+
     # Short-term storage clusters
     for cluster_name, values in sts.items():
         logger.info("Creating sts cluster : ", cluster_name)
         properties = values.get("properties", {})
         st_storage_properties = STStorageProperties(**properties)
 
-        sts_series = _extract_sts_series(values, cluster_name)
-
         storage = area_obj.create_st_storage(cluster_name, st_storage_properties)
         matrix_setter_map = {
             "inflows": storage.set_storage_inflows,
@@ -228,21 +334,7 @@ def generate_sts_clusters(area_obj: Area, sts: Dict[str, Any], used_files: Optio
             "Pmax_soutirage": storage.set_pmax_withdrawal,
             "upper_curve": storage.set_upper_rule_curve,
         }
-
-        base_dir = settings.sts_ts_directory
-
-        for filename in sts_series:
-            prefix = filename.split(".")[0]
-            setter = matrix_setter_map.get(prefix)
-            if not setter:
-                continue
-
-            file_path = _resolve_sts_file_path(base_dir, filename, cluster_name, "matrix")
-            if used_files is not None:
-                used_files.add(file_path)
-
-            df = pd.read_feather(file_path)
-            matrix = _extract_matrix(df)
-            setter(matrix)
+        for kind, matrix in matrices_by_cluster[cluster_name]:
+            matrix_setter_map[kind](matrix)
 
         _create_sts_additional_constraints(storage, values, base_dir, cluster_name, used_files=used_files)
@@ -15,7 +15,7 @@ import os
 import shutil
 
 from pathlib import Path
-from typing import Any, Set
+from typing import Any, Optional, Set
 
 import pandas as pd
 
@@ -32,8 +32,13 @@ from antares.craft import (
     StudySettingsUpdate,
 )
 from antares.craft.model.area import Area, AreaProperties, AreaUi
+from antares.craft.model.link import Link
 from antares.craft.model.study import Study, import_study_api
-from antares.datamanager.core.settings import GenerationMode, settings
+from antares.craft.tools.time_series_tool import TimeSeriesFileType
+from antares.datamanager.core.arrow_cleanup import get_cleanup_worker
+from antares.datamanager.core.input_snapshot import InputSnapshotStore, get_snapshot_store, input_snapshot_scope
+from antares.datamanager.core.settings import GenerationMode, SeriesPrecision, StorageBackendType, settings
+from antares.datamanager.core.storage import read_input_table
 from antares.datamanager.exceptions.exceptions import (
     APIGenerationError,
     AreaGenerationError,
@@ -42,7 +47,12 @@ from antares.datamanager.exceptions.exceptions import (
 )
 from antares.datamanager.generator.generate_dsr_clusters import generate_dsr_clusters
 from antares.datamanager.generator.generate_hydro import generate_hydro
-from antares.datamanager.generator.generate_link_matrices import generate_link_capacity_df, generate_link_parameters_df
+from antares.datamanager.generator.generate_link_matrices import (
+    LinkCapacitySeries,
+    generate_link_parameters_df,
+    generate_links_capacity_series,
+    write_link_capacity,
+)
 from antares.datamanager.generator.generate_misc_timeseries import generate_misc_timeseries
 from antares.datamanager.generator.generate_res_clusters import generate_res_clusters
 from antares.datamanager.generator.generate_sts_clusters import generate_sts_clusters
@@ -51,15 +61,28 @@ from antares.datamanager.generator.study_adapters import StudyFactory
 from antares.datamanager.logs.logging_setup import configure_ecs_logger, get_logger
 from antares.datamanager.models.study_data_json_model import StudyData
 from antares.datamanager.utils.area_ui_utils import generate_random_color, generate_random_coordinate
+from antares.datamanager.utils.matrix_interning import matrix_interning_scope
+from antares.datamanager.utils.precision import series_precision_scope
 
 configure_ecs_logger()
 logger = get_logger(__name__)
 
 
 def generate_study(study_id: str, factory: StudyFactory) -> dict[str, str]:
+    snapshot_store = get_snapshot_store()
+    # A retry reads the inputs kept from a previous failed attempt when they are gone from the NAS
+    with input_snapshot_scope(study_id if snapshot_store else None):
+        return _generate_study(study_id, factory, snapshot_store)
+
+
+def _generate_study(
+    study_id: str, factory: StudyFactory, snapshot_store: Optional[InputSnapshotStore]
+) -> dict[str, str]:
     used_files: Set[Path] = set()
     study = None
     try:
+        # Inputs trashed by a previous attempt of this study are put back in place
+        get_cleanup_worker().restore(study_id)
         study_data = read_study_data_from_json(study_id)
         study = factory.create_study(study_data.name)
         study_settings = StudySettingsUpdate(
@@ -69,8 +92,11 @@ def generate_study(study_id: str, factory: StudyFactory) -> dict[str, str]:
         )
         study.update_settings(study_settings)
 
-        add_areas_to_study(study, study_data, used_files)
-        add_links_to_study(study, study_data.links, study_data.seed_tsgen_link)
+        # Identical prepro/modulation matrices are built once, and written once in local studies
+        local_study_path = Path(study.path) if settings.generation_mode == GenerationMode.LOCAL and study.path else None
+        with series_precision_scope(study_data.precision), matrix_interning_scope(local_study_path):
+            add_areas_to_study(study, study_data, used_files)
+        add_links_to_study(study, study_data.links, study_data.seed_tsgen_link, study_data.first_month)
         if study_data.area_thermals and study_data.enable_random_ts:
             logger.info(f"Generating timeseries for {study_data.nb_years} years")
             study.generate_thermal_timeseries(settings.nb_years)
@@ -78,6 +104,9 @@ def generate_study(study_id: str, factory: StudyFactory) -> dict[str, str]:
         if settings.generation_mode == GenerationMode.LOCAL:
             _package_and_upload_local_study(study_data.name)
 
+        if snapshot_store:
+            snapshot_store.discard(study_id)
+
         return {
             "message": f"Study {study_data.name} successfully generated",
             "study_id": study_id,
@@ -96,22 +125,32 @@ def generate_study(study_id: str, factory: StudyFactory) -> dict[str, str]:
                     study.delete()
             except Exception as e:
                 logger.error(f"Failed to cleanup failed study: {e}")
+        if snapshot_store:
+            # Keep the inputs so that a retry does not need a new upstream export
+            try:
+                snapshot_store.save(study_id, used_files)
+            except Exception as e:
+                logger.error(f"Failed to snapshot the inputs of failed study {study_id}: {e}")
         raise
     finally:
-        _cleanup_arrow_files(used_files)
+        _cleanup_arrow_files(used_files, study_id=study_id)
 
 
-def _cleanup_arrow_files(used_files: Set[Path]) -> None:
+def _cleanup_arrow_files(used_files: Set[Path], study_id: str = "", wait: bool = False) -> None:
     """
     Remove used .arrow files from the output directories after the study generation process.
+
+    Removal is handed to the background cleanup worker so that it does not delay the response,
+    use ``wait=True`` to block until the files are gone.
+    Inputs read from S3 are left in the object store.
     """
-    for file in used_files:
-        if file.exists() and file.name.endswith(".arrow"):
-            logger.info(f"Removing arrow file: {file}")
-            try:
-                file.unlink()
-            except Exception as e:
-                logger.error(f"Failed to remove arrow file {file}: {e}")
+    if settings.input_storage_backend == StorageBackendType.S3:
+        logger.info(f"Inputs are read from S3, skipping the cleanup of {len(used_files)} input files")
+        return
+    worker = get_cleanup_worker()
+    worker.submit(used_files, study_id=study_id)
+    if wait:
+        worker.flush()
 
 
 def read_study_data_from_json(study_id: str) -> StudyData:
@@ -135,6 +174,9 @@ def read_study_data_from_json(study_id: str) -> StudyData:
     else:
         first_month = settings.study_setting_first_month
 
+    precision_val = raw_study_data.get("precision")
+    precision = SeriesPrecision(str(precision_val).upper()) if precision_val else settings.series_precision
+
     study_data = StudyData(
         name=study_name,
         areas=raw_study_data.get("areas", {}),
@@ -143,6 +185,7 @@ def read_study_data_from_json(study_id: str) -> StudyData:
         seed_tsgen_link=raw_study_data.get("global_seed", 0),
         nb_years=raw_study_data.get("nb_years", settings.nb_years),
         first_month=first_month,
+        precision=precision,
     )
 
     for area, area_info in study_data.areas.items():
@@ -224,7 +267,7 @@ def _set_area_loads(
     for load_file in loads:
         load_path = load_directory / load_file
         used_files.add(load_path)
-        df = pd.read_feather(load_path)
+        df = read_input_table(load_path)
         area_obj.set_load(df)
 
 
@@ -316,24 +359,26 @@ def add_areas_to_study(study: Study, study_data: StudyData, used_files: Set[Path
             raise AreaGenerationError(area_name, e.message) from e
 
 
-def add_links_to_study(study: Study, links: dict[str, dict[str, int]], global_seed: int = 0) -> None:
-    for key, link_data in links.items():
+def add_links_to_study(
+    study: Study, links: dict[str, dict[str, int]], global_seed: int = 0, first_month: Month = Month.JANUARY
+) -> None:
+    # Keys such as "FR-IT/NORD" and "FR/IT-NORD" give the same link name, each one keeps its own capacities
+    keys = list(links)
+    capacities = generate_links_capacity_series(
+        [("-".join(key.lower().split("/")), links[key]) for key in keys],
+        seed_tsgen_link=global_seed,
+        first_month=first_month,
+    )
+
+    for key, (_, capacity_direct, capacity_indirect) in zip(keys, capacities):
         area_from, area_to = key.lower().split("/")
 
         # Make link_data case-insensitive by creating a lowercase copy
-        link_data_lower = {k.lower(): v for k, v in link_data.items()}
-
-        df_capacity_direct = generate_link_capacity_df(
-            link_data, "direct", seed_tsgen_link=global_seed, link_name=f"{area_from}-{area_to}"
-        )
-        df_capacity_indirect = generate_link_capacity_df(
-            link_data, "indirect", seed_tsgen_link=global_seed, link_name=f"{area_from}-{area_to}"
-        )
+        link_data_lower = {k.lower(): v for k, v in links[key].items()}
 
         try:
             link = study.create_link(area_from=area_from, area_to=area_to)
-            link.set_capacity_direct(df_capacity_direct)
-            link.set_capacity_indirect(df_capacity_indirect)
+            _set_link_capacities(study, link, capacity_direct, capacity_indirect)
 
             hurdle_cost = link_data_lower.get("hurdlecost")
             if hurdle_cost is not None:
@@ -345,6 +390,24 @@ def add_links_to_study(study: Study, links: dict[str, dict[str, int]], global_se
             raise LinkGenerationError(area_from, area_to, f"Link from {area_from} to {area_to} not created") from e
 
 
+def _set_link_capacities(
+    study: Study, link: Link, capacity_direct: LinkCapacitySeries, capacity_indirect: LinkCapacitySeries
+) -> None:
+    chunk_days = settings.link_ts_chunk_days
+    if chunk_days <= 0 or settings.generation_mode != GenerationMode.LOCAL or not study.path:
+        link.set_capacity_direct(capacity_direct.to_frame())
+        link.set_capacity_indirect(capacity_indirect.to_frame())
+        return
+
+    # Written block by block where antares-craft would write the whole matrices
+    for capacity, file_type in (
+        (capacity_direct, TimeSeriesFileType.LINKS_CAPACITIES_DIRECT),
+        (capacity_indirect, TimeSeriesFileType.LINKS_CAPACITIES_INDIRECT),
+    ):
+        relative_path = file_type.value.format(area_id=link.area_from_id, second_area_id=link.area_to_id)
+        write_link_capacity(capacity, Path(study.path) / relative_path, chunk_days)
+
+
 def _package_and_upload_local_study(study_id_name: str) -> None:
     study_path = settings.nas_path / study_id_name
     if not study_path.exists():
@@ -9,17 +9,24 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 # This file is part of the Antares project.
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, Optional, Sequence, Set, cast
 
 import numpy as np
 import pandas as pd
 
 from antares.craft import Month, ThermalClusterProperties, ThermalClusterPropertiesUpdate
 from antares.craft.model.area import Area
+from antares.craft.model.thermal import ThermalCluster
+from antares.craft.tools.time_series_tool import TimeSeriesFileType
 from antares.datamanager.core.settings import settings
+from antares.datamanager.core.storage import read_input_table
 from antares.datamanager.logs.logging_setup import get_logger
-from antares.datamanager.utils.season_utils import SeasonManager
+from antares.datamanager.utils.matrix_interning import content_key, intern_matrix, write_matrix
+from antares.datamanager.utils.modulation import build_modulation_matrix, default_modulation_matrix
+from antares.datamanager.utils.precision import series_dtype
+from antares.datamanager.utils.study_calendar import get_study_calendar
 
 logger = get_logger(__name__)
 
@@ -29,6 +36,15 @@ logger = get_logger(__name__)
 NPO_SUMMER_DIVISOR = 3
 NPO_WINTER_DIVISOR = 4
 
+# Prepro data is built only when these keys are given, otherwise DEFAULT_PREPRO_ROW is used for every day
+PREPRO_CRITICAL_KEYS = ("fo_duration", "po_duration", "npo_max_winter", "npo_max_summer")
+# Input keys of the fo_duration, po_duration, fo_rate and po_rate columns
+PREPRO_INPUT_KEYS = ("fo_duration", "po_duration", "fo_monthly_rate", "po_monthly_rate")
+# Prepro rows are left empty when one of these monthly rates is empty
+PREPRO_MONTHLY_RATE_KEYS = ("fo_monthly_rate", "po_monthly_rate")
+# fo_duration, po_duration, fo_rate, po_rate, npo_min, npo_max
+DEFAULT_PREPRO_ROW = [1, 1, 0, 0, 0, 0]
+
 
 def calculate_min_stable_power(
     min_stable_power: float,
@@ -43,7 +59,7 @@ def calculate_min_stable_power(
         cm_path = base_dir / cm_file
         if used_files is not None:
             used_files.add(cm_path)
-        df_cm = pd.read_feather(cm_path)
+        df_cm = read_input_table(cm_path)
         cm_values = df_cm.iloc[:, 0]
         logger.info(f"CM file '{cm_file}' size: {len(cm_values)}")
         min_cm_value = cm_values.min()
@@ -61,24 +77,53 @@ def generate_thermal_clusters(
     if first_month is None:
         first_month = settings.study_setting_first_month
 
+    cluster_properties = {
+        cluster_name: ThermalClusterProperties(**values.get("properties", {}))
+        for cluster_name, values in thermals.items()
+    }
+    # Prepro matrices of all the clusters of the area are built in one batch
+    with_prepro = [name for name, properties in cluster_properties.items() if hasattr(properties, "unit_count")]
+    prepro_matrices = dict(
+        zip(
+            with_prepro,
+            create_prepro_data_matrices(
+                [thermals[name].get("data", {}) for name in with_prepro],
+                [cluster_properties[name].unit_count for name in with_prepro],
+                first_month=first_month,
+            ),
+        )
+    )
+
     # Thermals
     for cluster_name, values in thermals.items():
         logger.info(f"Creating thermal cluster: {cluster_name}")
 
         cluster_modulation = values.get("modulation", {})
         modulation_matrix = create_modulation_matrix(cluster_modulation, used_files=used_files)
+        prepro_matrix_func = (
+            partial(_precomputed_prepro_matrix, prepro_matrices[cluster_name])
+            if cluster_name in prepro_matrices
+            else create_prepro_data_matrix
+        )
 
         create_thermal_cluster_with_prepro(
             area_obj,
             cluster_name,
             values,
-            create_prepro_data_matrix,
+            prepro_matrix_func,
             modulation_matrix,
             first_month,
             used_files=used_files,
+            cluster_properties=cluster_properties[cluster_name],
         )
 
 
+def _precomputed_prepro_matrix(
+    prepro_matrix: pd.DataFrame, data: Dict[str, Any], unit_count: int, first_month: Optional[Month] = None
+) -> pd.DataFrame:
+    return prepro_matrix
+
+
 def create_thermal_cluster_with_prepro(
     area_obj: Area,
     cluster_name: str,
@@ -88,11 +133,13 @@ def create_thermal_cluster_with_prepro(
     first_month: Optional[Month] = None,
     base_dir: Optional[Path] = None,
     used_files: Optional[Set[Path]] = None,
+    cluster_properties: Optional[ThermalClusterProperties] = None,
 ) -> None:
     """
     Creates a thermal cluster, generates its prepro matrix, and sets it.
     """
-    cluster_properties = ThermalClusterProperties(**cluster_values.get("properties", {}))
+    if cluster_properties is None:
+        cluster_properties = ThermalClusterProperties(**cluster_values.get("properties", {}))
 
     # If cluster_properties doesn't expose attributes (e.g., patched as dict in tests),
     if not hasattr(cluster_properties, "unit_count"):
@@ -113,113 +160,144 @@ def create_thermal_cluster_with_prepro(
 
     thermal_cluster = area_obj.create_thermal_cluster(cluster_name, cluster_properties)
     thermal_cluster.update_properties(ThermalClusterPropertiesUpdate(min_stable_power=min_stable_power_final))
-    thermal_cluster.set_prepro_data(prepro_matrix)
-    thermal_cluster.set_prepro_modulation(modulation_matrix)
+    set_prepro_matrices(thermal_cluster, prepro_matrix, modulation_matrix)
 
 
-def _build_npo_max_daily(
-    season_manager: SeasonManager,
-    unit_count: int,
-    npo_max_summer: float,
-    npo_max_winter: float,
-    factor: float,
-) -> np.ndarray[Any, np.dtype[np.float64]]:
-    # Determine season using SeasonManager
-    season_is_winter = season_manager.is_winter()
-    season_is_summer = season_manager.is_summer()
-    npo_max_daily = np.zeros(365)
-
-    # In summer, division by NPO_SUMMER_DIVISOR and in winter by NPO_WINTER_DIVISOR
-    # to indicate that there are fewer NPO (Number of Planned Outages) in summer.
-    if npo_max_summer == 0:
-        npo_max_daily[season_is_summer] = int(unit_count / NPO_SUMMER_DIVISOR)
-    else:
-        npo_max_daily[season_is_summer] = npo_max_summer * factor
-
-    if npo_max_winter == 0:
-        npo_max_daily[season_is_winter] = int(unit_count / NPO_WINTER_DIVISOR)
-    else:
-        npo_max_daily[season_is_winter] = npo_max_winter * factor
-
-    return npo_max_daily
+def set_prepro_matrices(
+    thermal_cluster: ThermalCluster, prepro_matrix: pd.DataFrame, modulation_matrix: pd.DataFrame
+) -> None:
+    """
+    Set the prepro data and modulation of a thermal (or DSR) cluster.
+    Files of matrices shared with clusters already written in a local study are copied.
+    """
+    for matrix, file_type, setter in (
+        (prepro_matrix, TimeSeriesFileType.THERMAL_DATA, thermal_cluster.set_prepro_data),
+        (modulation_matrix, TimeSeriesFileType.THERMAL_MODULATION, thermal_cluster.set_prepro_modulation),
+    ):
+        relative_path = file_type.value.format(area_id=thermal_cluster.area_id, cluster_id=thermal_cluster.id)
+        write_matrix(matrix, relative_path, partial(setter, matrix))
 
 
 def create_prepro_data_matrix(
     data: Dict[str, Any], unit_count: int, first_month: Optional[Month] = None
 ) -> pd.DataFrame:
+    return create_prepro_data_matrices([data], [unit_count], first_month=first_month)[0]
+
+
+def create_prepro_data_matrices(
+    cluster_data: Sequence[Dict[str, Any]], unit_counts: Sequence[int], first_month: Optional[Month] = None
+) -> list[pd.DataFrame]:
+    """
+    Prepro matrices of a batch of thermal clusters, whose rows are built at once by build_prepro_data_arrays.
+    """
     # Use global setting if not provided explicitly
     if first_month is None:
         first_month = settings.study_setting_first_month
+    # Clusters without data or with empty monthly rates are left out of the batch
+    batch = [data if _builds_prepro_rows(data) else None for data in cluster_data]
+    prepro = build_prepro_data_arrays(batch, unit_counts, first_month=first_month)
+
+    matrices = []
+    for data, unit_count, rows in zip(cluster_data, unit_counts, prepro):
+        # Clusters of a study sharing the same data and unit count share the same matrix
+        key = ("thermal_prepro", content_key(data), unit_count, first_month)
+        matrices.append(intern_matrix(key, partial(_create_prepro_data_matrix, data, rows)))
+    return matrices
 
+
+def _builds_prepro_rows(data: Optional[Dict[str, Any]]) -> bool:
+    return _has_prepro_data(data) and all(cast(Dict[str, Any], data).get(key) for key in PREPRO_MONTHLY_RATE_KEYS)
+
+
+def _create_prepro_data_matrix(data: Dict[str, Any], rows: np.ndarray[Any, np.dtype[np.float64]]) -> pd.DataFrame:
     # If no data is provided OR if critical keys are missing, return the default 365x6 matrix
     # Critical keys: fo_duration, po_duration, npo_max_winter, npo_max_summer
-    if not data or any(k not in data for k in ["fo_duration", "po_duration", "npo_max_winter", "npo_max_summer"]):
+    if not _has_prepro_data(data):
         # fo_duration, po_duration, fo_rate, po_rate, npo_min, npo_max
-        return pd.DataFrame([[1, 1, 0, 0, 0, 0]] * 365)
+        return pd.DataFrame([DEFAULT_PREPRO_ROW] * 365)
 
-    fo_duration_const = data.get("fo_duration", 0)
-    po_duration_const = data.get("po_duration", 0)
-    npo_max_winter = data.get("npo_max_winter", 0)
-    npo_max_summer = data.get("npo_max_summer", 0)
+    if not _builds_prepro_rows(data):
+        logger.info("fo_monthly_rate or po_monthly_rate area empty skipping modulation matrix generation.")
+        return pd.DataFrame()  # empty DF
 
-    nb_unit_raw = data.get("nb_unit", 1)
+    prepro = pd.DataFrame(rows)
+    # Durations and rates given as integers stay integers in the written prepro data
+    integer_columns = [
+        column for column, key in enumerate(PREPRO_INPUT_KEYS) if np.asarray(data[key]).dtype.kind in "iu"
+    ]
+    return prepro.astype({column: np.int64 for column in integer_columns})
 
-    # Avoid division by zero → if nb_unit = 0, NPO_max = 0
-    factor = (unit_count / nb_unit_raw) if nb_unit_raw > 0 else 0.0
 
-    fo_monthly_rate = data.get("fo_monthly_rate", [])
-    po_monthly_rate = data.get("po_monthly_rate", [])
+def build_prepro_data_arrays(
+    cluster_data: Sequence[Optional[Dict[str, Any]]],
+    unit_counts: Sequence[int],
+    first_month: Optional[Month] = None,
+) -> np.ndarray[Any, np.dtype[np.float64]]:
+    """
+    Prepro data of a batch of thermal clusters, as a (n_clusters, 365, 6) array whose columns are
+    fo_duration, po_duration, fo_rate, po_rate, npo_min, npo_max.
 
-    if not fo_monthly_rate or not po_monthly_rate:
-        logger.info("fo_monthly_rate or po_monthly_rate area empty skipping modulation matrix generation.")
-        return pd.DataFrame()  # empty DF
+    Monthly rates are expanded to days with the day -> month index of the study calendar.
+    Clusters missing a critical key get the default rows [1, 1, 0, 0, 0, 0]; the other ones
+    must provide 12 values of fo_monthly_rate and po_monthly_rate.
+    """
+    # Use global setting if not provided explicitly
+    if first_month is None:
+        first_month = settings.study_setting_first_month
 
-    if len(fo_monthly_rate) != 12 or len(po_monthly_rate) != 12:
-        raise ValueError("fo_monthly_rate and po_monthly_rate must have 12 values")
+    if len(cluster_data) != len(unit_counts):
+        raise ValueError("build_prepro_data_arrays expects one unit count per cluster")
 
-    season_manager = SeasonManager(first_month)
-    month_order = season_manager.get_month_order()
-    days_in_month = season_manager.get_days_per_month()
-
-    # Build 365-day arrays directly
-    fo_rate_daily = []
-    po_rate_daily = []
-
-    for i in range(12):
-        month_idx_in_data = month_order[i] - 1
-        for _ in range(days_in_month[i]):
-            fo_rate_daily.append(fo_monthly_rate[month_idx_in_data])
-            po_rate_daily.append(po_monthly_rate[month_idx_in_data])
-
-    npo_max_daily = _build_npo_max_daily(
-        season_manager=season_manager,
-        unit_count=unit_count,
-        npo_max_summer=npo_max_summer,
-        npo_max_winter=npo_max_winter,
-        factor=factor,
-    )
+    prepro = np.zeros((len(cluster_data), 365, 6))
+    prepro[:, :, :] = DEFAULT_PREPRO_ROW
+
+    complete = [index for index, data in enumerate(cluster_data) if _has_prepro_data(data)]
+    if not complete:
+        return prepro
+
+    rows = [cast(Dict[str, Any], cluster_data[index]) for index in complete]
+    fo_monthly_rate = np.array([_monthly_rate(data, "fo_monthly_rate") for data in rows], dtype=np.float64)
+    po_monthly_rate = np.array([_monthly_rate(data, "po_monthly_rate") for data in rows], dtype=np.float64)
+    fo_duration = np.array([data.get("fo_duration", 0) for data in rows], dtype=np.float64)
+    po_duration = np.array([data.get("po_duration", 0) for data in rows], dtype=np.float64)
+    npo_max_winter = np.array([data.get("npo_max_winter", 0) for data in rows], dtype=np.float64)
+    npo_max_summer = np.array([data.get("npo_max_summer", 0) for data in rows], dtype=np.float64)
+    nb_unit = np.array([data.get("nb_unit", 1) for data in rows], dtype=np.float64)
+    unit_count = np.array([unit_counts[index] for index in complete], dtype=np.float64)
+
+    # Avoid division by zero → if nb_unit = 0, NPO_max = 0
+    factor = np.divide(unit_count, nb_unit, out=np.zeros_like(unit_count), where=nb_unit > 0)
 
+    # In summer, division by NPO_SUMMER_DIVISOR and in winter by NPO_WINTER_DIVISOR
+    # to indicate that there are fewer NPO (Number of Planned Outages) in summer.
+    npo_summer = np.where(npo_max_summer == 0, np.trunc(unit_count / NPO_SUMMER_DIVISOR), npo_max_summer * factor)
+    npo_winter = np.where(npo_max_winter == 0, np.trunc(unit_count / NPO_WINTER_DIVISOR), npo_max_winter * factor)
+
+    calendar = get_study_calendar(first_month)
+    # Month (0-11) of each of the 365 days of the study
+    month_index = calendar.month_index_of_day
+    is_winter = calendar.winter_days
+
+    prepro[complete, :, 0] = fo_duration[:, None]
+    prepro[complete, :, 1] = po_duration[:, None]
+    prepro[complete, :, 2] = fo_monthly_rate[:, month_index]
+    prepro[complete, :, 3] = po_monthly_rate[:, month_index]
     # NPO_min always zero
-    npo_min_daily = np.zeros(365)
-
-    # Constant daily durations
-    fo_duration_daily = np.full(365, fo_duration_const)
-    po_duration_daily = np.full(365, po_duration_const)
-
-    df = pd.DataFrame(
-        list(
-            zip(
-                fo_duration_daily,
-                po_duration_daily,
-                fo_rate_daily,
-                po_rate_daily,
-                npo_min_daily,
-                npo_max_daily,
-            )
-        )
-    )
+    prepro[complete, :, 4] = 0
+    prepro[complete, :, 5] = np.where(is_winter[None, :], npo_winter[:, None], npo_summer[:, None])
+
+    return prepro
+
+
+def _has_prepro_data(data: Optional[Dict[str, Any]]) -> bool:
+    return bool(data) and all(key in cast(Dict[str, Any], data) for key in PREPRO_CRITICAL_KEYS)
 
-    return df
+
+def _monthly_rate(data: Dict[str, Any], key: str) -> list[Any]:
+    rate = data.get(key, [])
+    if len(rate) != 12:
+        raise ValueError("fo_monthly_rate and po_monthly_rate must have 12 values")
+    return list(rate)
 
 
 def generator_param_modulation_directory() -> Path:
@@ -227,7 +305,10 @@ def generator_param_modulation_directory() -> Path:
 
 
 def create_modulation_matrix(
-    cluster_modulation: list[str], base_dir: Optional[Path] = None, used_files: Optional[Set[Path]] = None
+    cluster_modulation: list[str],
+    base_dir: Optional[Path] = None,
+    used_files: Optional[Set[Path]] = None,
+    dtype: Optional[np.dtype] = None,
 ) -> pd.DataFrame:
     """
     cluster_modulation: list of filenames
@@ -236,11 +317,12 @@ def create_modulation_matrix(
 
     If cluster_modulation is empty:
         returns 8760 rows of [1, 1, 1, 0]
+
+    In reduced precision (float32 study or ``dtype``), every column is converted to that dtype.
     """
     if not cluster_modulation:
         logger.info("cluster_modulation is empty, skipping thermal modulation matrix generation.")
-        data = np.tile([1, 1, 1, 0], (8760, 1))
-        return pd.DataFrame(data)
+        return default_modulation_matrix(dtype)
 
     if base_dir is None:
         base_dir = generator_param_modulation_directory()
@@ -252,47 +334,33 @@ def create_modulation_matrix(
     # If both are missing, reuse existing fallback behavior
     if cm_file is None and mr_file is None:
         logger.info("No CM or MR file found, using default modulation matrix.")
-        data = np.tile([1, 1, 1, 0], (8760, 1))
-        return pd.DataFrame(data)
+        return default_modulation_matrix(dtype)
 
-    cm_values = None
-    mr_values = None
+    cm_path = None if cm_file is None else base_dir / cm_file
+    mr_path = None if mr_file is None else base_dir / mr_file
+    if used_files is not None:
+        used_files.update(path for path in (cm_path, mr_path) if path is not None)
 
-    # Read CM if present
-    if cm_file is not None:
-        cm_path = base_dir / cm_file
-        if used_files is not None:
-            used_files.add(cm_path)
-        df_cm = pd.read_feather(cm_path)
-        cm_values = df_cm.iloc[:, 0]
-        logger.info(f"CM file '{cm_file}' size: {len(cm_values)}")
+    # Input files do not change during a study, clusters using the same CM/MR files share the same matrix
+    key = ("thermal_modulation", cm_path, mr_path, series_dtype(dtype).str)
+    return intern_matrix(key, lambda: _build_file_modulation_matrix(cm_path, mr_path, dtype))
 
-    # Read MR if present
-    if mr_file is not None:
-        mr_path = base_dir / mr_file
-        if used_files is not None:
-            used_files.add(mr_path)
-        df_mr = pd.read_feather(mr_path)
-        mr_values = df_mr.iloc[:, 0]
-        logger.info(f"MR file '{mr_file}' size: {len(mr_values)}")
-
-    # If both exist, row counts must match
-    if cm_values is not None and mr_values is not None:
-        if len(cm_values) != len(mr_values):
-            raise ValueError(
-                f"CM and MR files must have the same number of rows. Got {len(cm_values)} vs {len(mr_values)}"
-            )
-        df = pd.DataFrame([[1, 1, cm, mr] for cm, mr in zip(cm_values, mr_values)])
-
-    # CM missing → CM = 1
-    elif cm_values is None:
-        assert mr_values is not None
-        df = pd.DataFrame([[1, 1, 1, mr] for mr in mr_values])
-
-    # MR missing → MR = 0
-    else:  # mr_values is None
-        assert cm_values is not None
-        df = pd.DataFrame([[1, 1, cm, 0] for cm in cm_values])
 
+def _build_file_modulation_matrix(
+    cm_path: Optional[Path], mr_path: Optional[Path], dtype: Optional[np.dtype]
+) -> pd.DataFrame:
+    # CM missing → CM = 1, MR missing → MR = 0
+    cm_values = _read_modulation_values(cm_path)
+    mr_values = _read_modulation_values(mr_path)
+
+    df = build_modulation_matrix(cm_values, mr_values, dtype=dtype)
     logger.info(f"Final DataFrame shape: {df.shape}")
     return df
+
+
+def _read_modulation_values(path: Optional[Path]) -> "Optional[pd.Series[Any]]":
+    if path is None:
+        return None
+    values = read_input_table(path).iloc[:, 0]
+    logger.info(f"Modulation file '{path.name}' size: {len(values)}")
+    return values
@@ -14,7 +14,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from antares.craft import Month
-from antares.datamanager.core.settings import settings
+from antares.datamanager.core.settings import SeriesPrecision, settings
 
 
 @dataclass
@@ -34,3 +34,4 @@ class StudyData:
     seed_tsgen_link: int = 0
     nb_years: int = field(default_factory=lambda: settings.nb_years)
     first_month: Month = field(default_factory=lambda: settings.study_setting_first_month)
+    precision: SeriesPrecision = field(default_factory=lambda: settings.series_precision)
@@ -0,0 +1,149 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Study-scoped interning of the matrices built from identical inputs (prepro data, modulation).
+
+Within ``matrix_interning_scope``, ``intern_matrix`` builds a matrix once per content key and then
+returns the same object, built over read-only arrays so that an in-place write raises instead of
+changing the matrix of every cluster sharing it. When the study is written on the local
+filesystem, ``write_matrix`` copies the file already written for an interned matrix instead of
+formatting it again. Outside of a scope, matrices are built and written every time.
+"""
+
+import hashlib
+import shutil
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from antares.datamanager.logs.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+_active_interner: ContextVar[Optional["MatrixInterner"]] = ContextVar("matrix_interner", default=None)
+
+
+class MatrixInterner:
+    def __init__(self, study_path: Optional[Path] = None):
+        self.study_path = study_path
+        self.hits = 0
+        self.misses = 0
+        self.copied_files = 0
+        self._matrices: dict[Hashable, pd.DataFrame] = {}
+        # id of interned matrix -> first file it was written to
+        self._interned_ids: set[int] = set()
+        self._written_files: dict[int, Path] = {}
+
+    def intern(self, key: Hashable, build: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        matrix = self._matrices.get(key)
+        if matrix is not None:
+            self.hits += 1
+            return matrix
+        self.misses += 1
+        matrix = _read_only_copy(build())
+        self._matrices[key] = matrix
+        self._interned_ids.add(id(matrix))
+        return matrix
+
+    def write(self, matrix: pd.DataFrame, relative_path: Optional[str], write: Callable[[], None]) -> None:
+        target = self.study_path / relative_path if self.study_path is not None and relative_path else None
+        if target is None or id(matrix) not in self._interned_ids:
+            write()
+            return
+
+        source = self._written_files.get(id(matrix))
+        if source is not None:
+            try:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(source, target)
+                self.copied_files += 1
+                return
+            except OSError as e:
+                logger.warning(f"Failed to reuse matrix file {source} for {target}, writing it again: {e}")
+        write()
+        if target.is_file():
+            self._written_files[id(matrix)] = target
+
+    def log_statistics(self) -> None:
+        logger.info(
+            f"Matrix interning: {self.misses} distinct matrices built, {self.hits} reused, "
+            f"{self.copied_files} files copied instead of written"
+        )
+
+
+def _read_only_copy(matrix: pd.DataFrame) -> pd.DataFrame:
+    """``matrix`` over read-only copies of its values, owned by the interner."""
+    if matrix.dtypes.nunique() <= 1:
+        values = matrix.to_numpy(copy=True)
+        values.flags.writeable = False
+        return pd.DataFrame(values, index=matrix.index, columns=matrix.columns, copy=False)
+
+    # Mixed dtypes (integer prepro columns): one array per column keeps the dtype of each column
+    columns = {}
+    for column in matrix.columns:
+        column_values = matrix[column].to_numpy(copy=True)
+        column_values.flags.writeable = False
+        columns[column] = column_values
+    return pd.DataFrame(columns, index=matrix.index, copy=False)
+
+
+@contextmanager
+def matrix_interning_scope(study_path: Optional[Path] = None) -> Iterator[MatrixInterner]:
+    """Interns the matrices built within this scope; ``study_path`` is given for studies written locally."""
+    interner = MatrixInterner(study_path)
+    token = _active_interner.set(interner)
+    try:
+        yield interner
+    finally:
+        _active_interner.reset(token)
+        interner.log_statistics()
+
+
+def intern_matrix(key: Hashable, build: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+    interner = _active_interner.get()
+    if interner is None:
+        return build()
+    return interner.intern(key, build)
+
+
+def write_matrix(matrix: pd.DataFrame, relative_path: Optional[str], write: Callable[[], None]) -> None:
+    """
+    Write ``matrix`` with ``write``, or copy the file already written for the same interned matrix
+    to ``relative_path`` (relative to the study directory) when the study is written locally.
+    """
+    interner = _active_interner.get()
+    if interner is None:
+        write()
+        return
+    interner.write(matrix, relative_path, write)
+
+
+def content_key(value: Any) -> Hashable:
+    """
+    Hashable key of JSON-like inputs (dicts, lists, scalars) and arrays.
+    Types are part of the key since integer and float inputs do not give the same matrices.
+    """
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted((str(key), content_key(item)) for key, item in value.items())))
+    if isinstance(value, (list, tuple)):
+        return ("list", tuple(content_key(item) for item in value))
+    if isinstance(value, pd.Series):
+        return content_key(value.to_numpy())
+    if isinstance(value, np.ndarray):
+        digest = hashlib.blake2b(np.ascontiguousarray(value).tobytes(), digest_size=16).hexdigest()
+        return ("array", value.dtype.str, value.shape, digest)
+    return (type(value).__name__, value)
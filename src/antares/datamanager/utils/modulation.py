@@ -0,0 +1,75 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Hourly modulation matrices of thermal and DSR clusters.
+
+A modulation matrix has 4 columns without names:
+    [marginal cost modulation, market bid modulation, capacity modulation (CM), min generation modulation (MR)]
+The first two are always 1; CM defaults to 1 and MR to 0 when no series is given.
+"""
+
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from antares.datamanager.utils.matrix_interning import intern_matrix
+from antares.datamanager.utils.precision import is_reduced_precision, series_dtype
+
+HOURS_PER_YEAR = 8760
+
+CM_COLUMN = 2
+MR_COLUMN = 3
+DEFAULT_MODULATION_ROW = (1, 1, 1, 0)
+
+
+def build_modulation_matrix(
+    cm_values: Optional["np.ndarray[Any, Any] | pd.Series[Any]"] = None,
+    mr_values: Optional["np.ndarray[Any, Any] | pd.Series[Any]"] = None,
+    dtype: Optional[np.dtype] = None,
+) -> pd.DataFrame:
+    """
+    Modulation matrix with the given CM and/or MR hourly values, 8760 default rows when both are None.
+
+    Values are written column by column into a preallocated float array. In full precision, the columns
+    left to their default (and the ones given as integers) are returned as integers, like the matrices
+    historically built from Python lists, so that the written study files do not change.
+    """
+    if cm_values is not None and mr_values is not None and len(cm_values) != len(mr_values):
+        raise ValueError(f"CM and MR files must have the same number of rows. Got {len(cm_values)} vs {len(mr_values)}")
+    given = cm_values if cm_values is not None else mr_values
+    nb_rows = HOURS_PER_YEAR if given is None else len(given)
+
+    dtype = series_dtype(dtype)
+    matrix = np.empty((nb_rows, len(DEFAULT_MODULATION_ROW)), dtype=dtype)
+    matrix[:] = DEFAULT_MODULATION_ROW
+    integer_columns = [0, 1]
+    for column, values in ((CM_COLUMN, cm_values), (MR_COLUMN, mr_values)):
+        if values is None:
+            integer_columns.append(column)
+            continue
+        buffer = np.asarray(values)
+        matrix[:, column] = buffer
+        if np.issubdtype(buffer.dtype, np.integer):
+            integer_columns.append(column)
+
+    if is_reduced_precision(dtype):
+        return pd.DataFrame(matrix)
+    if len(integer_columns) == matrix.shape[1]:
+        return pd.DataFrame(matrix.astype(np.int64))
+    return pd.DataFrame(matrix).astype({column: np.int64 for column in integer_columns})
+
+
+def default_modulation_matrix(dtype: Optional[np.dtype] = None) -> pd.DataFrame:
+    """8760 default rows, shared by the clusters of a study without CM/MR series."""
+    dtype = series_dtype(dtype)
+    return intern_matrix(("default_modulation", dtype.str), lambda: build_modulation_matrix(dtype=dtype))
@@ -0,0 +1,52 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Floating point precision of the hourly series built for a study (load factors, modulation coefficients).
+
+Series are kept in the precision of the study being generated; sums and weighted averages
+are still accumulated in float64 and only the results are converted.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+import numpy as np
+
+from antares.datamanager.core.settings import SeriesPrecision
+
+_DTYPES: dict[SeriesPrecision, np.dtype] = {
+    SeriesPrecision.FLOAT64: np.dtype(np.float64),
+    SeriesPrecision.FLOAT32: np.dtype(np.float32),
+}
+
+_active_precision: ContextVar[SeriesPrecision] = ContextVar("series_precision", default=SeriesPrecision.FLOAT64)
+
+
+@contextmanager
+def series_precision_scope(precision: SeriesPrecision) -> Iterator[None]:
+    token = _active_precision.set(precision)
+    try:
+        yield
+    finally:
+        _active_precision.reset(token)
+
+
+def series_dtype(dtype: Optional[np.dtype] = None) -> np.dtype:
+    """``dtype`` when given, otherwise the dtype of the precision of the active study."""
+    if dtype is not None:
+        return np.dtype(dtype)
+    return _DTYPES[_active_precision.get()]
+
+
+def is_reduced_precision(dtype: np.dtype) -> bool:
+    return np.dtype(dtype).itemsize < np.dtype(np.float64).itemsize
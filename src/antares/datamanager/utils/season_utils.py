@@ -14,6 +14,7 @@ from typing import Any, List
 import numpy as np
 
 from antares.craft import Month
+from antares.datamanager.utils.study_calendar import DAYS_IN_MONTH_JAN_TO_DEC, get_study_calendar
 
 
 class SeasonManager:
@@ -22,37 +23,19 @@ class SeasonManager:
     starting from a configurable first month.
     """
 
-    DAYS_IN_MONTH_JAN_TO_DEC = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+    DAYS_IN_MONTH_JAN_TO_DEC = list(DAYS_IN_MONTH_JAN_TO_DEC)
 
     def __init__(self, first_month: Month):
         self.first_month = first_month
         self.months_list = list(first_month.__class__)
         self.first_month_idx = self.months_list.index(first_month) + 1  # 1-indexed
 
-        self.month_order: List[int] = []
-        self.days_per_month: List[int] = []
-        self.month_of_day: np.ndarray[Any, np.dtype[np.int_]] = np.array([], dtype=int)
-
-        self._initialize_mappings()
-
-    def _initialize_mappings(self) -> None:
-        """Initialize month order and days per month mappings based on first_month."""
-        month_order = []
-        days_per_month = []
-        for i in range(12):
-            m = (self.first_month_idx + i - 1) % 12 + 1
-            month_order.append(m)
-            days_per_month.append(self.DAYS_IN_MONTH_JAN_TO_DEC[m - 1])
-
-        self.month_order = month_order
-        self.days_per_month = days_per_month
-
-        # Precompute the month mapping for each of the 365 days
-        month_of_day_list = []
-        for i in range(12):
-            for _ in range(self.days_per_month[i]):
-                month_of_day_list.append(self.month_order[i])
-        self.month_of_day = np.array(month_of_day_list)
+        # Mappings are computed once per first month and shared
+        calendar = get_study_calendar(first_month)
+        self.month_order: List[int] = list(calendar.month_order)
+        self.days_per_month: List[int] = list(calendar.days_per_month)
+        self.month_of_day: np.ndarray[Any, np.dtype[np.int_]] = calendar.month_of_day
+        self._winter_days = calendar.winter_days
 
     def is_winter(self) -> np.ndarray[Any, np.dtype[np.bool_]]:
         """
@@ -60,7 +43,7 @@ class SeasonManager:
         Winter is defined as months Jan, Feb, Mar, Oct, Nov, Dec.
         Returns a boolean array of length 365.
         """
-        return (self.month_of_day <= 3) | (self.month_of_day >= 10)
+        return self._winter_days.copy()
 
     def is_summer(self) -> np.ndarray[Any, np.dtype[np.bool_]]:
         """
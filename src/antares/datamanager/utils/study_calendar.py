@@ -0,0 +1,101 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Day and hour mappings of a 365-day study year, computed once per first month.
+
+Winter is made of the months Jan, Feb, Mar, Oct, Nov and Dec, summer of the other ones.
+Peak hours (HP - Heures Pleines) are 8:00 to 19:59 of each day, off-peak hours (HC - Heures Creuses) the other ones.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+from antares.craft import Month
+
+DAYS_PER_YEAR = 365
+HOURS_PER_DAY = 24
+HOURS_PER_YEAR = DAYS_PER_YEAR * HOURS_PER_DAY
+DAYS_IN_MONTH_JAN_TO_DEC = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+WINTER_MONTHS = (1, 2, 3, 10, 11, 12)
+FIRST_PEAK_HOUR = 8
+LAST_PEAK_HOUR = 19
+
+# Values of StudyCalendar.period_of_hour
+WINTER_HC = 0
+WINTER_HP = 1
+SUMMER_HC = 2
+SUMMER_HP = 3
+
+
+@dataclass(frozen=True)
+class StudyCalendar:
+    """
+    Read-only calendar arrays of a study starting on ``first_month``.
+
+    month_order         months (1-12) in study order
+    days_per_month      number of days of each month, in study order
+    month_of_day        month (1-12) of each of the 365 days
+    month_index_of_day  same as a 0-11 index in January to December monthly values
+    winter_days         True for the days of winter months
+    day_of_hour         day (0-364) of each of the 8760 hours
+    winter_hours        True for the hours of winter days
+    peak_hours          True for HP hours
+    period_of_hour      WINTER_HC, WINTER_HP, SUMMER_HC or SUMMER_HP for each hour
+    """
+
+    first_month: Month
+    month_order: tuple[int, ...]
+    days_per_month: tuple[int, ...]
+    month_of_day: np.ndarray[Any, np.dtype[np.int64]]
+    month_index_of_day: np.ndarray[Any, np.dtype[np.int64]]
+    winter_days: np.ndarray[Any, np.dtype[np.bool_]]
+    day_of_hour: np.ndarray[Any, np.dtype[np.int64]]
+    winter_hours: np.ndarray[Any, np.dtype[np.bool_]]
+    peak_hours: np.ndarray[Any, np.dtype[np.bool_]]
+    period_of_hour: np.ndarray[Any, np.dtype[np.int8]]
+
+
+@lru_cache(maxsize=None)
+def get_study_calendar(first_month: Month) -> StudyCalendar:
+    first_month_index = list(Month).index(first_month)
+    month_order = tuple((first_month_index + i) % 12 + 1 for i in range(12))
+    days_per_month = tuple(DAYS_IN_MONTH_JAN_TO_DEC[month - 1] for month in month_order)
+
+    month_of_day = np.repeat(np.array(month_order, dtype=np.int64), days_per_month)
+    month_index_of_day = month_of_day - 1
+    winter_days = np.isin(month_of_day, WINTER_MONTHS)
+    day_of_hour = np.repeat(np.arange(DAYS_PER_YEAR, dtype=np.int64), HOURS_PER_DAY)
+    winter_hours = winter_days[day_of_hour]
+    hour_of_day = np.tile(np.arange(HOURS_PER_DAY), DAYS_PER_YEAR)
+    peak_hours = (hour_of_day >= FIRST_PEAK_HOUR) & (hour_of_day <= LAST_PEAK_HOUR)
+    period_of_hour = np.where(winter_hours, WINTER_HC, SUMMER_HC).astype(np.int8) + peak_hours.astype(np.int8)
+
+    arrays = (month_of_day, month_index_of_day, winter_days, day_of_hour, winter_hours, peak_hours, period_of_hour)
+    for array in arrays:
+        # Shared by every caller of the same first month
+        array.flags.writeable = False
+
+    return StudyCalendar(
+        first_month=first_month,
+        month_order=month_order,
+        days_per_month=days_per_month,
+        month_of_day=month_of_day,
+        month_index_of_day=month_index_of_day,
+        winter_days=winter_days,
+        day_of_hour=day_of_hour,
+        winter_hours=winter_hours,
+        peak_hours=peak_hours,
+        period_of_hour=period_of_hour,
+    )
@@ -0,0 +1,81 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+"""
+Series transforms shared by the generators, runnable on pandas or on polars lazy frames.
+
+The engine is selected with the TRANSFORM_ENGINE setting. Polars executes the expressions on its
+own thread pool (sized by POLARS_MAX_THREADS); when it is not installed, pandas is used instead.
+Both engines return pandas objects so that callers do not depend on the selected engine.
+"""
+
+from typing import Any, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from antares.datamanager.core.settings import TransformEngine, settings
+from antares.datamanager.logs.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+
+def _polars() -> Optional[Any]:
+    try:
+        import polars
+    except ImportError:
+        logger.warning("polars is not installed, falling back to the pandas transform engine")
+        return None
+    return polars
+
+
+def _resolve_engine(engine: Optional[TransformEngine]) -> Optional[Any]:
+    """Polars module when the polars engine is selected and available, None for pandas."""
+    selected = engine or settings.transform_engine
+    if selected != TransformEngine.POLARS:
+        return None
+    return _polars()
+
+
+def scaled_sum(
+    series: Sequence["pd.Series[Any]"], factors: Sequence[float], engine: Optional[TransformEngine] = None
+) -> "np.ndarray[Any, np.dtype[np.float64]]":
+    """``sum(series[k] * factors[k])`` accumulated in float64, in the order of the inputs."""
+    if len(series) != len(factors):
+        raise ValueError("scaled_sum expects one factor per series")
+    if not series:
+        return np.zeros(0, dtype=np.float64)
+
+    pl = _resolve_engine(engine)
+    if pl is None:
+        total = np.zeros(len(series[0]), dtype=np.float64)
+        for values, factor in zip(series, factors):
+            total += values.to_numpy(dtype=np.float64) * factor
+        return total
+
+    lazy_frame = pl.LazyFrame({f"s{k}": values.to_numpy(dtype=np.float64) for k, values in enumerate(series)})
+    expression = pl.sum_horizontal([pl.col(f"s{k}") * float(factor) for k, factor in enumerate(factors)])
+    result: "np.ndarray[Any, np.dtype[np.float64]]" = lazy_frame.select(expression).collect().to_series().to_numpy()
+    return result
+
+
+def add_column(
+    matrix: pd.DataFrame, column: "np.ndarray[Any, Any]", engine: Optional[TransformEngine] = None
+) -> pd.DataFrame:
+    """Add a single column vector to every column of ``matrix``."""
+    pl = _resolve_engine(engine)
+    if pl is None:
+        return matrix.add(column.reshape(-1, 1), axis=0)
+
+    names = [f"c{k}" for k in range(matrix.shape[1])]
+    lazy_frame = pl.LazyFrame(matrix.to_numpy(), schema=names).with_columns(pl.Series("__offset", column.ravel()))
+    result = lazy_frame.select([pl.col(name) + pl.col("__offset") for name in names]).collect()
+    return pd.DataFrame(result.to_numpy(), index=matrix.index, columns=matrix.columns)
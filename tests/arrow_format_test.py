@@ -0,0 +1,84 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+import pytest
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from antares.datamanager.core.arrow_format import ArrowLayout, detect_layout, read_arrow_bytes, read_arrow_file
+from antares.datamanager.core.storage import LocalObjectStoreClient, S3StorageBackend
+
+
+def _series() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({str(i): rng.random(8760) for i in range(3)})
+
+
+def _write_stream(df: pd.DataFrame, path: Path) -> None:
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    options = pa.ipc.IpcWriteOptions(compression="zstd")
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+
+
+def _write_frame(df: pd.DataFrame, path: Path, codec: str) -> None:
+    raw = path.with_suffix(".raw")
+    df.to_feather(raw, compression="uncompressed")
+    with pa.output_stream(str(path), compression=codec) as sink:
+        sink.write(raw.read_bytes())
+    raw.unlink()
+
+
+WRITERS = {
+    "uncompressed": lambda df, path: df.to_feather(path, compression="uncompressed"),
+    "lz4": lambda df, path: df.to_feather(path, compression="lz4"),
+    "zstd": lambda df, path: df.to_feather(path, compression="zstd"),
+    "stream": _write_stream,
+    "lz4_frame": lambda df, path: _write_frame(df, path, "lz4"),
+    "zstd_frame": lambda df, path: _write_frame(df, path, "zstd"),
+}
+
+
+@pytest.mark.parametrize("layout", list(WRITERS))
+def test_every_layout_is_read_from_file_and_bytes(tmp_path, layout):
+    expected = _series()
+    path = tmp_path / "series.arrow"
+    WRITERS[layout](expected, path)
+
+    pd.testing.assert_frame_equal(read_arrow_file(path), expected)
+    pd.testing.assert_frame_equal(read_arrow_bytes(path.read_bytes()), expected)
+
+
+def test_detect_layout():
+    assert detect_layout(b"ARROW1\x00\x00") == ArrowLayout.FILE
+    assert detect_layout(b"\xff\xff\xff\xff\x10\x00") == ArrowLayout.STREAM
+    assert detect_layout(b"\x04\x22\x4d\x18") == ArrowLayout.LZ4_FRAME
+    assert detect_layout(b"\x28\xb5\x2f\xfd") == ArrowLayout.ZSTD_FRAME
+    assert detect_layout(b"not arrow") is None
+
+
+def test_missing_file_raises_file_not_found(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        read_arrow_file(tmp_path / "missing.arrow")
+
+
+def test_s3_backend_reads_compressed_objects(tmp_path):
+    expected = _series()
+    bucket_dir = tmp_path / "store" / "inputs"
+    bucket_dir.mkdir(parents=True)
+    _write_frame(expected, bucket_dir / "series.arrow", "zstd")
+    backend = S3StorageBackend(client=LocalObjectStoreClient(tmp_path / "store"), bucket="inputs", root=tmp_path)
+
+    pd.testing.assert_frame_equal(backend.read_table(tmp_path / "series.arrow"), expected)
@@ -10,6 +10,8 @@
 #
 # This file is part of the Antares project.
 
+import pytest
+
 import numpy as np
 import pandas as pd
 
@@ -128,3 +130,38 @@ def test_generate_binding_constraints_non_fr():
     expected_be = 100 * (24 * 1 / 12)  # 100 * 2 = 200
     assert "BE_DSR_0" in df_constraints.columns
     np.testing.assert_allclose(df_constraints["BE_DSR_0"].iloc[0], expected_be, rtol=1e-5)
+
+
+def _groupby_binding_constraints(dsr_data, cluster_series):
+    """Reference: per-cluster groupby daily means, summed non-FR columns named after the last cluster."""
+    results = {}
+    for cluster_name, series in cluster_series.items():
+        data = dsr_data[cluster_name]["data"]
+        coefficient = 24 * data["max_hour_per_day"] / data["nb_hour_per_day"]
+        results[cluster_name] = series.groupby(series.index // 24).mean() * coefficient
+    df_results = pd.DataFrame(results)
+    fr_columns = [col for col in df_results.columns if col.startswith("FR_")]
+    non_fr_columns = [col for col in df_results.columns if not col.startswith("FR_")]
+    final_df = df_results[fr_columns].copy()
+    if non_fr_columns:
+        final_df[cluster_name] = df_results[non_fr_columns].sum(axis=1)
+    return pd.concat([final_df, pd.DataFrame([[0] * final_df.shape[1]], columns=final_df.columns)], ignore_index=True)
+
+
+@pytest.mark.parametrize(
+    "names",
+    [["BE_DSR_0"], ["FR_DSR_0_ter", "FR_DSR_0_ind"], ["BE_DSR_0", "FR_DSR_1", "BE_DSR_2"], ["BE_DSR_0", "FR_DSR_1"]],
+)
+def test_generate_binding_constraints_matches_groupby_daily_means_exactly(names):
+    rng = np.random.default_rng(0)
+    cluster_series = {name: pd.Series(rng.random(8760) * 1000) for name in names}
+    dsr_data = {
+        name: {"data": {"nb_hour_per_day": int(rng.integers(1, 24)), "max_hour_per_day": int(rng.integers(1, 4))}}
+        for name in names
+    }
+
+    df_constraints = generate_dsr_binding_constraints(dsr_data, cluster_series)
+
+    pd.testing.assert_frame_equal(
+        df_constraints, _groupby_binding_constraints(dsr_data, cluster_series), check_exact=True
+    )
@@ -12,10 +12,12 @@
 
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 
 from antares.craft.model.area import Area
 from antares.datamanager.generator.generate_dsr_clusters import (
+    DsrCapacitySeries,
     create_dsr_modulation_matrix_from_series,
     generate_dsr_clusters,
 )
@@ -270,3 +272,24 @@ def test_generate_dsr_clusters_calculates_global_max_with_second_user_example(
     for i in range(3):
         args, _ = mock_create_modulation.call_args_list[i]
         assert args[1] == expected_global_max
+
+
+def test_dsr_capacity_series_buffer_matches_concatenated_series():
+    rng = np.random.default_rng(0)
+    cluster_series = {f"dsr_{i}": pd.Series(rng.random(8760) * 100, name=0) for i in range(5)}
+
+    capacities = DsrCapacitySeries.from_series(cluster_series)
+
+    assert capacities.values.shape == (5, 8760)
+    assert capacities.global_max() == pd.concat(cluster_series.values(), axis=1).sum(axis=1).max()
+    pd.testing.assert_series_equal(capacities.series("dsr_3"), cluster_series["dsr_3"])
+    assert capacities.series("unknown") is None
+    # Series are views on the buffer
+    assert np.shares_memory(capacities.series("dsr_3").to_numpy(), capacities.values)
+
+
+def test_dsr_capacity_series_pads_series_of_different_lengths():
+    capacities = DsrCapacitySeries.from_series({"a": pd.Series([1, 5, 2]), "b": pd.Series([3, 1])})
+
+    assert capacities.global_max() == 6
+    assert np.isnan(capacities.values[1, 2])
@@ -12,7 +12,38 @@
 
 import pytest
 
-from antares.datamanager.generator.generate_link_matrices import generate_link_capacity_df, generate_link_parameters_df
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from antares.craft import Month
+from antares.datamanager.core.settings import settings
+from antares.datamanager.generator.generate_link_matrices import (
+    generate_link_capacity_df,
+    generate_link_parameters_df,
+    generate_links_capacity_series,
+    write_link_capacity,
+)
+from antares.tsgen.ts_generator import TimeseriesGenerator
+
+
+def _capacity_frames(links_data: Any, **kwargs: Any) -> list[tuple[str, pd.DataFrame, pd.DataFrame]]:
+    """``(link_name, direct, indirect)`` capacities of ``generate_links_capacity_series`` as DataFrames."""
+    return [
+        (name, direct.to_frame(), indirect.to_frame())
+        for name, direct, indirect in generate_links_capacity_series(links_data, **kwargs)
+    ]
+
+
+def _link_capacity_frames(
+    link_data: dict[str, Any], link_name: str = "", **kwargs: Any
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    [(_, direct, indirect)] = _capacity_frames({link_name: link_data}, **kwargs)
+    return direct, indirect
 
 
 @pytest.fixture
@@ -208,3 +239,189 @@ def test_generate_link_capacity_df_case_insensitivity() -> None:
     # Summer: Day 100 (April)
     assert df.iloc[100 * 24, 0] == 1200  # April, 00:00 -> Summer HC
     assert df.iloc[100 * 24 + 8, 0] == 1300  # April, 08:00 -> Summer HP
+
+
+def test_generate_link_capacity_df_follows_first_month(link_data_example: dict[str, int]) -> None:
+    """With a July start, the first hours of the year are summer hours."""
+    df_january = generate_link_capacity_df(link_data_example, mode="direct", first_month=Month.JANUARY)
+    df_july = generate_link_capacity_df(link_data_example, mode="direct", first_month=Month.JULY)
+
+    # Midnight of the first day
+    assert df_january.iloc[0, 0] == link_data_example["winterHcDirectMw"]
+    assert df_july.iloc[0, 0] == link_data_example["summerHcDirectMw"]
+    # Jul 1st of a January start is the first day of a July start
+    assert df_january.iloc[181 * 24 :, 0].tolist() == df_july.iloc[: (365 - 181) * 24, 0].tolist()
+
+
+@pytest.mark.parametrize("indirect_nb", [3, 2])
+def test_link_capacity_series_matches_each_direction(link_data_example: dict[str, int], indirect_nb: int) -> None:
+    link_data = {
+        **link_data_example,
+        "hvdcMwDirect": 900,
+        "hvdcNbDirect": 3,
+        "hvdcFoRateDirect": 0.1,
+        "hvdcMwIndirect": 600,
+        "hvdcNbIndirect": indirect_nb,
+        "hvdcFoRateIndirect": 0.1,
+    }
+    tsgen_runs = []
+    generate = TimeseriesGenerator.generate_time_series_for_links
+
+    def counting_generate(self, *args, **kwargs):
+        tsgen_runs.append(args)
+        return generate(self, *args, **kwargs)
+
+    with patch.object(TimeseriesGenerator, "generate_time_series_for_links", counting_generate):
+        df_direct, df_indirect = _link_capacity_frames(link_data, seed_tsgen_link=1234, link_name="a-b")
+
+    # Same units and outage rate in both directions: a single tsgen run
+    assert len(tsgen_runs) == (1 if indirect_nb == 3 else 2)
+    expected_direct = generate_link_capacity_df(link_data, "direct", seed_tsgen_link=1234, link_name="a-b")
+    expected_indirect = generate_link_capacity_df(link_data, "indirect", seed_tsgen_link=1234, link_name="a-b")
+    assert df_direct.equals(expected_direct)
+    assert df_indirect.equals(expected_indirect)
+    assert (df_direct.values < link_data_example["winterHcDirectMw"]).any()
+
+
+def test_link_capacity_series_without_hvdc(link_data_example: dict[str, int]) -> None:
+    df_direct, df_indirect = _link_capacity_frames(link_data_example, first_month=Month.JULY)
+
+    assert df_direct.equals(generate_link_capacity_df(link_data_example, "direct", first_month=Month.JULY))
+    assert df_indirect.equals(generate_link_capacity_df(link_data_example, "indirect", first_month=Month.JULY))
+
+
+def test_links_capacity_series_does_not_depend_on_hvdc_workers(link_data_example: dict[str, int]) -> None:
+    links_data = {
+        f"a-{i}": {**link_data_example, "hvdcMwDirect": 300 + i, "hvdcNbDirect": 2, "hvdcFoRateDirect": 0.2}
+        for i in range(3)
+    }
+    links_data["a-hvac"] = link_data_example
+
+    capacities_by_workers = {}
+    for workers in (1, 2):
+        with patch("antares.datamanager.generator.generate_link_matrices.settings") as mock_settings:
+            mock_settings.hvdc_ts_workers = workers
+            mock_settings.number_of_timeseries = settings.number_of_timeseries
+            capacities_by_workers[workers] = _capacity_frames(links_data, seed_tsgen_link=99)
+
+    sequential, parallel = capacities_by_workers[1], capacities_by_workers[2]
+    assert [link_name for link_name, _, _ in parallel] == list(links_data)
+    for (link_name, direct, indirect), (_, parallel_direct, parallel_indirect) in zip(sequential, parallel):
+        assert parallel_direct.equals(direct)
+        assert parallel_indirect.equals(indirect)
+        assert direct.equals(
+            generate_link_capacity_df(links_data[link_name], "direct", seed_tsgen_link=99, link_name=link_name)
+        )
+
+
+def test_links_capacity_series_matches_each_link(link_data_example: dict[str, int]) -> None:
+    links_data = {
+        "a-b": link_data_example,
+        "a-c": {**link_data_example, "hvdcMwDirect": 300, "hvdcNbDirect": 2, "hvdcFoRateDirect": 0.2},
+        "a-d": {**{key: 800 for key in link_data_example}, "hvdcMwDirect": 800, "hvdcMwIndirect": 800},
+    }
+
+    capacities = _capacity_frames(links_data, seed_tsgen_link=5, first_month=Month.JULY)
+
+    assert [link_name for link_name, _, _ in capacities] == list(links_data)
+    for link_name, direct, indirect in capacities:
+        for mode, df in (("direct", direct), ("indirect", indirect)):
+            expected = generate_link_capacity_df(
+                links_data[link_name], mode, seed_tsgen_link=5, link_name=link_name, first_month=Month.JULY
+            )
+            assert df.equals(expected)
+
+
+def test_links_capacity_series_keeps_links_with_the_same_name(link_data_example: dict[str, int]) -> None:
+    hvdc_data = {**link_data_example, "hvdcMwDirect": 300, "hvdcNbDirect": 2, "hvdcFoRateDirect": 0.2}
+    links_data = [("fr-it-nord", link_data_example), ("fr-it-nord", hvdc_data)]
+
+    capacities = _capacity_frames(links_data, seed_tsgen_link=5)
+
+    assert [link_name for link_name, _, _ in capacities] == ["fr-it-nord", "fr-it-nord"]
+    for (link_name, direct, _), (_, link_data) in zip(capacities, links_data):
+        assert direct.equals(generate_link_capacity_df(link_data, "direct", seed_tsgen_link=5, link_name=link_name))
+
+
+def test_links_capacity_series_generates_hvdc_up_front_with_workers(link_data_example: dict[str, int]) -> None:
+    links_data = {"a-b": link_data_example, "a-c": {**link_data_example, "hvdcMwDirect": 300}}
+    # All units available: the HVDC part is available all year long
+    units = [None, {"direct": np.ones((365, 3), dtype=np.uint8)}]
+
+    with (
+        patch("antares.datamanager.generator.generate_link_matrices.settings") as mock_settings,
+        patch(
+            "antares.datamanager.generator.generate_link_matrices._generate_links_hvdc_units", return_value=units
+        ) as mock_generate_units,
+        patch.object(TimeseriesGenerator, "generate_time_series_for_links", side_effect=AssertionError),
+    ):
+        mock_settings.hvdc_ts_workers = 4
+        capacities = _capacity_frames(links_data, seed_tsgen_link=7)
+
+    assert mock_generate_units.call_args.args[1:] == (7, 4)
+    hvac_direct = generate_link_capacity_df(link_data_example, "direct").iloc[:, 0].to_numpy()
+    assert capacities[1][1].shape == (8760, 3)
+    assert (capacities[1][1].to_numpy() == hvac_direct[:, None]).all()
+
+
+@pytest.mark.parametrize("days_per_block", [1, 30, 365])
+def test_capacity_series_blocks_match_whole_series(link_data_example: dict[str, int], days_per_block: int) -> None:
+    links_data = {
+        "a-b": link_data_example,
+        "a-c": {**link_data_example, "hvdcMwDirect": 300, "hvdcNbDirect": 2, "hvdcFoRateDirect": 0.2},
+        "a-d": {**{key: 800 for key in link_data_example}, "hvdcMwDirect": 800, "hvdcMwIndirect": 800},
+    }
+
+    for _, direct, indirect in generate_links_capacity_series(links_data, seed_tsgen_link=3):
+        for series in (direct, indirect):
+            blocks = list(series.iter_blocks(days_per_block))
+            assert max(len(block) for block in blocks) == 24 * days_per_block
+            assert np.array_equal(np.concatenate(blocks), series.to_frame().to_numpy())
+
+
+def test_write_link_capacity_matches_study_matrix_file(link_data_example: dict[str, int], tmp_path: Path) -> None:
+    link_data = {**link_data_example, "hvdcMwDirect": 333.3, "hvdcNbDirect": 3, "hvdcFoRateDirect": 0.05}
+    [(_, direct, _)] = generate_links_capacity_series({"a-b": link_data}, seed_tsgen_link=3)
+    pl.from_pandas(direct.to_frame()).write_csv(tmp_path / "whole.txt", separator="\t", include_header=False)
+
+    write_link_capacity(direct, tmp_path / "capacities" / "chunked.txt", days_per_block=7)
+
+    assert (tmp_path / "capacities" / "chunked.txt").read_bytes() == (tmp_path / "whole.txt").read_bytes()
+
+
+@pytest.mark.parametrize(
+    "hvdc_data, expected_dtype",
+    [
+        ({}, np.int16),
+        ({"hvdcMwDirect": 300, "hvdcNbDirect": 2, "hvdcFoRateDirect": 0.2}, np.int16),
+        ({"hvdcMwDirect": 40000, "hvdcNbDirect": 4, "hvdcFoRateDirect": 0.2}, np.int32),
+        # 100 MW units: the HVDC part is not a whole number of MW
+        ({"hvdcMwDirect": 100, "hvdcNbDirect": 3, "hvdcFoRateDirect": 0.2}, np.float64),
+    ],
+)
+def test_link_capacities_use_narrowest_dtype(
+    link_data_example: dict[str, int], hvdc_data: dict[str, float], expected_dtype: type
+) -> None:
+    link_data = {**link_data_example, **hvdc_data}
+
+    df_direct, _ = _link_capacity_frames(link_data, seed_tsgen_link=3, link_name="a-b")
+
+    assert set(df_direct.dtypes) == {np.dtype(expected_dtype)}
+    expected = generate_link_capacity_df(link_data, "direct", seed_tsgen_link=3, link_name="a-b")
+    assert df_direct.equals(expected)
+
+
+@pytest.mark.parametrize(
+    "overflowing_data",
+    [
+        {"winterHcDirectMw": 2**70},
+        {"hvdcMwDirect": 2**70, "hvdcNbDirect": 1, "hvdcFoRateDirect": 0.0},
+    ],
+)
+def test_link_capacities_overflowing_int64_are_rejected(
+    link_data_example: dict[str, int], overflowing_data: dict[str, float]
+) -> None:
+    link_data = {**link_data_example, **overflowing_data}
+
+    with pytest.raises(ValueError, match="do not fit in 64-bit integers"):
+        _link_capacity_frames(link_data, link_name="a-b")
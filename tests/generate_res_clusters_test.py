@@ -12,11 +12,16 @@
 import pytest
 
 from typing import Any, cast
+from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 
 from antares.datamanager.exceptions.exceptions import RESGenerationError
+from antares.datamanager.generator import generate_res_clusters as generate_res_clusters_module
 from antares.datamanager.generator.generate_res_clusters import (
+    ZoneAverageCache,
+    _compute_fr_weighted_load_factor_tensor,
     _compute_zone_average,
     _resolve_res_base_directory,
     generate_res_clusters,
@@ -440,6 +445,51 @@ def test_compute_zone_average_no_usable_series():
         _compute_zone_average(zone="FR01", tech_weights={"t1": 0.0}, series_by_tech={"t1": s1})
 
 
+def test_fr_tensor_contraction_matches_zone_by_zone_aggregation():
+    rng = np.random.default_rng(1)
+    columns = [f"TS{i}" for i in range(4)]
+    zonal_weights = {"FR01": 0.2, "FR02": 0.0, "FR03": 0.5, "FR04": 1.3}
+    techno_weights_by_zone = {
+        "FR01": {"t1": 0.6, "t2": 0.4},
+        "FR02": {"t1": 1.0},
+        "FR03": {"t1": 0.0, "t2": 2.0, "t3": 1.0},
+        "FR04": {"t1": 1.0},
+    }
+    techno_series_by_zone = {
+        zone: {tech: pd.DataFrame(rng.random((48, 4)), columns=columns) for tech in techs}
+        for zone, techs in techno_weights_by_zone.items()
+    }
+
+    # Zone by zone: technology average of each active zone, then average of the zones
+    zone_averages = {
+        zone: sum(techno_series_by_zone[zone][tech] * weight for tech, weight in techno_weights_by_zone[zone].items())
+        / sum(techno_weights_by_zone[zone].values())
+        for zone, zone_weight in zonal_weights.items()
+        if zone_weight > 0
+    }
+    expected = sum(zone_averages[zone] * zonal_weights[zone] for zone in zone_averages) / sum(zonal_weights.values())
+    result = _compute_fr_weighted_load_factor_tensor(
+        techno_series_by_zone=techno_series_by_zone,
+        techno_weights_by_zone=techno_weights_by_zone,
+        zonal_weights=zonal_weights,
+    )
+
+    assert list(result.columns) == columns
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-12)
+
+
+def test_fr_tensor_contraction_rejects_inconsistent_zone_columns():
+    with pytest.raises(RESGenerationError, match="Inconsistent zone series columns"):
+        _compute_fr_weighted_load_factor_tensor(
+            techno_series_by_zone={
+                "FR01": {"t1": pd.DataFrame({"a": [0.1]})},
+                "FR02": {"t1": pd.DataFrame({"b": [0.1]})},
+            },
+            techno_weights_by_zone={"FR01": {"t1": 1.0}, "FR02": {"t1": 1.0}},
+            zonal_weights={"FR01": 1.0, "FR02": 1.0},
+        )
+
+
 def test_resolve_res_base_directory_invalid_type(monkeypatch):
     class MockSettings:
         res_ts_directory = "not_a_path"
@@ -849,3 +899,190 @@ def test_fr_aggregation_zero_weight_zone_is_excluded_from_computation(tmp_path,
     }
     generate_res_clusters(area, "FR", res)
     assert float(area.timeseries["wind_offshore"].iloc[0, 0]) == pytest.approx(0.6)
+
+
+def test_fr_aggregation_does_not_read_zero_weight_series(tmp_path, monkeypatch):
+    pd.DataFrame({"date": ["2020-01-01"] * 8760, "v": [0.6] * 8760}).to_feather(tmp_path / "fr02_t1.arrow")
+    # Out of bounds values would be rejected if these files were read
+    pd.DataFrame({"date": ["2020-01-01"] * 8760, "v": [5.0] * 8760}).to_feather(tmp_path / "fr01_t1.arrow")
+    pd.DataFrame({"date": ["2020-01-01"] * 8760, "v": [5.0] * 8760}).to_feather(tmp_path / "fr02_t2.arrow")
+    area = _make_area()
+    _set_res_directory(monkeypatch, tmp_path)
+    res = {
+        "wind_offshore": {
+            "properties": {"group": "wind_offshore", "capacity": 1000},
+            "series": [],
+            "fr_aggregation": {
+                "zone_weights": {"FR01": 0.0, "FR02": 1.0},
+                "tech_weights_by_zone": {"FR01": {"t1": 1.0}, "FR02": {"t1": 1.0, "t2": 0.0}},
+                "series_by_zone_and_tech": {
+                    "FR01": {"t1": "fr01_t1.arrow"},
+                    "FR02": {"t1": "fr02_t1.arrow", "t2": "fr02_t2.arrow"},
+                },
+            },
+        }
+    }
+    used_files: set[Any] = set()
+
+    generate_res_clusters(area, "FR", res, used_files=used_files)
+
+    assert float(area.timeseries["wind_offshore"].iloc[0, 0]) == pytest.approx(0.6)
+    assert {path.name for path in used_files} == {"fr01_t1.arrow", "fr02_t1.arrow", "fr02_t2.arrow"}
+
+
+def test_fr_aggregation_zero_weight_series_must_exist(tmp_path, monkeypatch):
+    pd.DataFrame({"date": ["2020-01-01"] * 8760, "v": [0.6] * 8760}).to_feather(tmp_path / "fr02.arrow")
+    _set_res_directory(monkeypatch, tmp_path)
+    res = {
+        "wind_offshore": {
+            "properties": {"group": "wind_offshore", "capacity": 1000},
+            "series": [],
+            "fr_aggregation": {
+                "zone_weights": {"FR01": 0.0, "FR02": 1.0},
+                "tech_weights_by_zone": {"FR01": {"t1": 1.0}, "FR02": {"t1": 1.0}},
+                "series_by_zone_and_tech": {"FR01": {"t1": "missing.arrow"}, "FR02": {"t1": "fr02.arrow"}},
+            },
+        }
+    }
+
+    with pytest.raises(FileNotFoundError, match="RES series file not found"):
+        generate_res_clusters(_make_area(), "FR", res)
+
+
+def test_fr_zone_averages_are_reused_across_clusters(tmp_path, monkeypatch):
+    pd.DataFrame({"date": ["2020-01-01"] * 8760, "v": [0.2] * 8760}).to_feather(tmp_path / "fr01_t1.arrow")
+    pd.DataFrame({"date": ["2020-01-01"] * 8760, "v": [0.4] * 8760}).to_feather(tmp_path / "fr01_t2.arrow")
+    pd.DataFrame({"date": ["2020-01-01"] * 8760, "v": [0.8] * 8760}).to_feather(tmp_path / "fr02_t1.arrow")
+    _set_res_directory(monkeypatch, tmp_path)
+
+    def _cluster(fr02_weight: float) -> dict[str, Any]:
+        return {
+            "properties": {"group": "wind_onshore", "capacity": 1000},
+            "series": [],
+            "fr_aggregation": {
+                "zone_weights": {"FR01": 1.0, "FR02": 1.0},
+                "tech_weights_by_zone": {"FR01": {"t1": 1.0, "t2": 1.0}, "FR02": {"t1": fr02_weight}},
+                "series_by_zone_and_tech": {
+                    "FR01": {"t1": "fr01_t1.arrow", "t2": "fr01_t2.arrow"},
+                    "FR02": {"t1": "fr02_t1.arrow"},
+                },
+            },
+        }
+
+    area = _make_area()
+    cache = ZoneAverageCache()
+    used_files: set[Any] = set()
+
+    generate_res_clusters(
+        area,
+        "FR",
+        {"first": _cluster(1.0), "second": _cluster(1.0), "third": _cluster(2.0)},
+        used_files=used_files,
+        zone_average_cache=cache,
+    )
+
+    # FR01 is averaged once for all clusters, FR02 once for the two clusters sharing its weight;
+    # the FR02 series of the third cluster is only used by it and goes straight into its contraction
+    assert (cache.hits, cache.misses) == (3, 2)
+    for cluster in ("first", "second", "third"):
+        assert float(area.timeseries[cluster].iloc[0, 0]) == pytest.approx(0.55)
+    assert len(used_files) == 3
+
+
+def test_fr_clusters_without_shared_zones_use_one_contraction(tmp_path, monkeypatch):
+    rng = np.random.default_rng(5)
+    series = {}
+    for name in ("fr01_t1", "fr01_t2", "fr02_t1"):
+        series[name] = rng.random(8760)
+        pd.DataFrame({"date": ["2020-01-01"] * 8760, "v": series[name]}).to_feather(tmp_path / f"{name}.arrow")
+    _set_res_directory(monkeypatch, tmp_path)
+    res = {
+        "wind_onshore": {
+            "properties": {"group": "wind_onshore", "capacity": 1000},
+            "series": [],
+            "fr_aggregation": {
+                "zone_weights": {"FR01": 1.0, "FR02": 3.0},
+                "tech_weights_by_zone": {"FR01": {"t1": 1.0, "t2": 3.0}, "FR02": {"t1": 1.0}},
+                "series_by_zone_and_tech": {
+                    "FR01": {"t1": "fr01_t1.arrow", "t2": "fr01_t2.arrow"},
+                    "FR02": {"t1": "fr02_t1.arrow"},
+                },
+            },
+        }
+    }
+    area = _make_area()
+
+    with (
+        patch("antares.datamanager.generator.generate_res_clusters._compute_zone_average", side_effect=AssertionError),
+        patch(
+            "antares.datamanager.generator.generate_res_clusters._contract",
+            wraps=generate_res_clusters_module._contract,
+        ) as contract,
+    ):
+        generate_res_clusters(area, "FR", res)
+
+    contract.assert_called_once()
+    expected = 0.25 * (0.25 * series["fr01_t1"] + 0.75 * series["fr01_t2"]) + 0.75 * series["fr02_t1"]
+    np.testing.assert_allclose(area.timeseries["wind_onshore"].iloc[:, 0].to_numpy(), expected)
+
+
+@pytest.mark.parametrize("mode", ["IN_MEMORY", "STREAMING"])
+def test_fr_aggregation_modes_produce_the_same_series(tmp_path, monkeypatch, mode):
+    rng = np.random.default_rng(3)
+    files = {}
+    for zone in ("FR01", "FR02", "FR03"):
+        for tech in ("t1", "t2"):
+            files[(zone, tech)] = f"{zone}_{tech}.arrow"
+            frame = pd.DataFrame({"date": ["2020-01-01"] * 8760, "TS1": rng.random(8760), "TS2": rng.random(8760)})
+            frame.to_feather(tmp_path / files[(zone, tech)])
+    _set_res_directory(monkeypatch, tmp_path)
+    monkeypatch.setenv("FR_AGGREGATION_MODE", mode)
+    zone_weights = {"FR01": 0.3, "FR02": 0.0, "FR03": 0.7}
+    tech_weights_by_zone = {zone: {"t1": 0.25, "t2": 0.75} for zone in zone_weights}
+    res = {
+        "wind_onshore": {
+            "properties": {"group": "wind_onshore", "capacity": 1000},
+            "series": [],
+            "fr_aggregation": {
+                "zone_weights": zone_weights,
+                "tech_weights_by_zone": tech_weights_by_zone,
+                "series_by_zone_and_tech": {
+                    zone: {tech: files[(zone, tech)] for tech in ("t1", "t2")} for zone in zone_weights
+                },
+            },
+        }
+    }
+    area = _make_area()
+    used_files: set[Any] = set()
+
+    generate_res_clusters(area, "FR", res, used_files=used_files)
+
+    def _read(zone: str, tech: str) -> np.ndarray:
+        return pd.read_feather(tmp_path / files[(zone, tech)])[["TS1", "TS2"]].to_numpy()
+
+    expected = sum(
+        zone_weights[zone] * (0.25 * _read(zone, "t1") + 0.75 * _read(zone, "t2")) for zone in ("FR01", "FR03")
+    )
+    np.testing.assert_allclose(area.timeseries["wind_onshore"].to_numpy(), expected, rtol=1e-12)
+    assert list(area.timeseries["wind_onshore"].columns) == ["TS1", "TS2"]
+    assert len(used_files) == 6
+
+
+def test_fr_streaming_aggregation_rejects_missing_series(tmp_path, monkeypatch):
+    pd.DataFrame({"date": ["2020-01-01"] * 8760, "v": [0.5] * 8760}).to_feather(tmp_path / "fr01_t1.arrow")
+    _set_res_directory(monkeypatch, tmp_path)
+    monkeypatch.setenv("FR_AGGREGATION_MODE", "STREAMING")
+    res = {
+        "wind_onshore": {
+            "properties": {"group": "wind_onshore", "capacity": 1000},
+            "series": [],
+            "fr_aggregation": {
+                "zone_weights": {"FR01": 1.0},
+                "tech_weights_by_zone": {"FR01": {"t1": 1.0, "t2": 1.0}},
+                "series_by_zone_and_tech": {"FR01": {"t1": "fr01_t1.arrow"}},
+            },
+        }
+    }
+
+    with pytest.raises(RESGenerationError, match="Missing technology series"):
+        generate_res_clusters(_make_area(), "FR", res)
@@ -15,7 +15,7 @@ import pytest
 import pandas as pd
 
 from antares.craft import AdditionalConstraintOperator, AdditionalConstraintVariable
-from antares.datamanager.generator.generate_sts_clusters import generate_sts_clusters
+from antares.datamanager.generator.generate_sts_clusters import _parse_occurrences, generate_sts_clusters
 
 
 class StorageForTest:
@@ -139,7 +139,7 @@ def test_generate_sts_clusters_supports_nested_series_payload(tmp_path, monkeypa
         type("S", (), {"sts_ts_directory": tmp_path}),
     )
 
-    df = pd.DataFrame({"time": range(2), "TS1": [10.0, 20.0]})
+    df = pd.DataFrame({"time": range(8760), "TS1": [10.0] * 8760})
     df.to_feather(tmp_path / "inflows.xlsx.uuid.arrow")
 
     sts_data = {
@@ -269,3 +269,167 @@ def test_generate_sts_clusters_missing_file_raises(tmp_path, monkeypatch, area):
 
     assert "STS matrix file not found" in str(exc.value)
     assert "cluster1" in str(exc.value)
+
+
+def test_generate_sts_clusters_missing_file_keeps_found_files_in_used_files(tmp_path, monkeypatch, area):
+    monkeypatch.setattr(
+        "antares.datamanager.generator.generate_sts_clusters.settings",
+        type("S", (), {"sts_ts_directory": tmp_path}),
+    )
+    pd.DataFrame({"time": range(8760), "TS1": [1.0] * 8760}).to_feather(tmp_path / "inflows.cluster1.arrow")
+    sts_data = {"cluster1": {"properties": {}, "series": ["inflows.cluster1.arrow", "upper_curve.cluster1.arrow"]}}
+    used_files = set()
+
+    with pytest.raises(FileNotFoundError, match="STS matrix file not found"):
+        generate_sts_clusters(area, sts_data, used_files)
+
+    # The file found is still cleaned up (or snapshotted) with the other inputs of the failed study
+    assert used_files == {tmp_path.resolve() / "inflows.cluster1.arrow"}
+
+
+class CountingStorageForTest(StorageForTest):
+    def __init__(self):
+        super().__init__()
+        self.create_constraints_calls = 0
+        self.term_calls = 0
+
+    def create_constraints(self, constraints):
+        self.create_constraints_calls += 1
+        super().create_constraints(constraints)
+
+    def set_constraint_term(self, constraint_id, matrix):
+        self.term_calls += 1
+        super().set_constraint_term(constraint_id, matrix)
+
+
+def _constraint_payload(hours):
+    return {"variable": "injection", "operator": "greater", "enabled": True, "hours": hours}
+
+
+def test_generate_sts_clusters_creates_constraints_in_bulk(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "antares.datamanager.generator.generate_sts_clusters.settings",
+        type("S", (), {"sts_ts_directory": tmp_path}),
+    )
+    names = [f"constraint_{i}" for i in range(4)]
+    for i, name in enumerate(names):
+        pd.DataFrame({"time": [0, 1], "TS1": [float(i), float(i + 1)]}).to_feather(tmp_path / f"{name}.csv.uuid.arrow")
+    sts_data = {
+        "cluster1": {
+            "properties": {},
+            "series": [],
+            "constraintParameters": {name: _constraint_payload([[1, 2]]) for name in names},
+            "stsConstraintsSeriesList": [f"{name}.csv.uuid.arrow" for name in names],
+        }
+    }
+    area = AreaForTest(CountingStorageForTest)
+
+    generate_sts_clusters(area, sts_data)
+
+    storage = area.last_storage
+    assert storage.create_constraints_calls == 1
+    assert storage.term_calls == len(names)
+    assert list(storage.constraints) == names
+    assert storage.constraint_terms["constraint_3"].iloc[:, 0].tolist() == [3.0, 4.0]
+
+
+def test_generate_sts_clusters_creates_no_constraint_when_one_rhs_is_missing(tmp_path, monkeypatch, area):
+    monkeypatch.setattr(
+        "antares.datamanager.generator.generate_sts_clusters.settings",
+        type("S", (), {"sts_ts_directory": tmp_path}),
+    )
+    pd.DataFrame({"time": [0], "TS1": [1.0]}).to_feather(tmp_path / "first.csv.uuid.arrow")
+    sts_data = {
+        "cluster1": {
+            "properties": {},
+            "series": [],
+            "constraintParameters": {"first": _constraint_payload([[1]]), "second": _constraint_payload([[2]])},
+            "stsConstraintsSeriesList": ["first.csv.uuid.arrow"],
+        }
+    }
+
+    with pytest.raises(FileNotFoundError, match="No RHS series found"):
+        generate_sts_clusters(area, sts_data)
+
+    assert area.last_storage.constraints == {}
+
+
+def test_parse_occurrences_keeps_blocks_in_order():
+    occurrences = _parse_occurrences([[3, 1], [], [8760]], "cluster1", "c1")
+
+    assert [occurrence.hours for occurrence in occurrences] == [[3, 1], [], [8760]]
+    assert all(isinstance(hour, int) for hour in occurrences[0].hours)
+    assert _parse_occurrences([], "cluster1", "c1") == []
+    assert _parse_occurrences(None, "cluster1", "c1") == []
+
+
+def test_parse_occurrences_large_constraint_set():
+    blocks = [list(range(start, start + 24)) for start in range(1, 8760, 24)] * 2
+
+    occurrences = _parse_occurrences(blocks, "cluster1", "c1")
+
+    assert len(occurrences) == len(blocks)
+    assert occurrences[-1].hours == list(range(8737, 8761))
+
+
+@pytest.mark.parametrize("hour", [0, -1, 8761, 2.0, "1", [1], 10**30])
+def test_parse_occurrences_rejects_invalid_hour(hour):
+    with pytest.raises(ValueError, match=r"Invalid hour value in STS constraint 'c1' for cluster 'cluster1'"):
+        _parse_occurrences([[1, 2], [3, hour]], "cluster1", "c1")
+
+
+def test_parse_occurrences_rejects_duplicate_hour_in_block():
+    # The same hour in two different blocks is allowed
+    assert len(_parse_occurrences([[1, 2], [2, 3]], "cluster1", "c1")) == 2
+
+    with pytest.raises(ValueError, match=r"Duplicate hour 5 in hours block #2"):
+        _parse_occurrences([[1, 2], [5, 4, 5]], "cluster1", "c1")
+
+
+def test_generate_sts_clusters_reads_all_matrices_of_the_area_at_once(tmp_path, monkeypatch, area):
+    monkeypatch.setattr(
+        "antares.datamanager.generator.generate_sts_clusters.settings",
+        type("S", (), {"sts_ts_directory": tmp_path}),
+    )
+    read_batches = []
+
+    def read_input_tables(paths):
+        read_batches.append(list(paths))
+        return {path: pd.read_feather(path) for path in paths}
+
+    monkeypatch.setattr("antares.datamanager.generator.generate_sts_clusters.read_input_tables", read_input_tables)
+    for cluster in ("cluster1", "cluster2"):
+        for kind in ("inflows", "upper_curve"):
+            pd.DataFrame({"time": range(8760), "TS1": [1.0] * 8760}).to_feather(tmp_path / f"{kind}.{cluster}.arrow")
+    sts_data = {
+        cluster: {"properties": {}, "series": [f"inflows.{cluster}.arrow", f"upper_curve.{cluster}.arrow"]}
+        for cluster in ("cluster1", "cluster2")
+    }
+    used_files = set()
+
+    generate_sts_clusters(area, sts_data, used_files)
+
+    assert len(read_batches) == 1
+    assert len(read_batches[0]) == 4
+    assert used_files == set(read_batches[0])
+    assert [name for name, _ in area.created] == ["cluster1", "cluster2"]
+    assert set(area.last_storage.calls) == {"inflows", "upper_curve"}
+
+
+def test_generate_sts_clusters_rejects_matrix_with_wrong_row_count(tmp_path, monkeypatch, area):
+    monkeypatch.setattr(
+        "antares.datamanager.generator.generate_sts_clusters.settings",
+        type("S", (), {"sts_ts_directory": tmp_path}),
+    )
+    pd.DataFrame({"time": range(8760), "TS1": [1.0] * 8760}).to_feather(tmp_path / "inflows.xlsx.uuid.arrow")
+    pd.DataFrame({"time": range(24), "TS1": [1.0] * 24}).to_feather(tmp_path / "lower_curve.xlsx.uuid.arrow")
+    sts_data = {
+        "cluster1": {"properties": {}, "series": ["inflows.xlsx.uuid.arrow"]},
+        "cluster2": {"properties": {}, "series": ["lower_curve.xlsx.uuid.arrow"]},
+    }
+
+    with pytest.raises(ValueError, match=r"Invalid STS lower_curve matrix for cluster 'cluster2': expected 8760 rows"):
+        generate_sts_clusters(area, sts_data)
+
+    # Shapes are checked before any storage is created
+    assert area.created == []
@@ -17,7 +17,7 @@ import os
 from pathlib import Path
 from unittest.mock import MagicMock, mock_open, patch
 
-from antares.craft import APIconf
+from antares.craft import APIconf, create_study_local
 from antares.datamanager.core.dependencies import get_study_factory
 from antares.datamanager.core.settings import GenerationMode
 from antares.datamanager.exceptions.exceptions import APIGenerationError, AreaGenerationError, MiscGenerationError
@@ -172,6 +172,11 @@ def test_add_areas_to_study_calls_create_area_and_set_load(
     assert mock_generate_misc_timeseries.call_count == 2
 
 
+def _mock_links_capacities(links_data, **kwargs):
+    capacity = MagicMock(**{"to_frame.return_value": "mock_df"})
+    return ((link_name, capacity, capacity) for link_name, _ in links_data)
+
+
 def test_add_links_to_study_calls_create_link():
     mock_study = MagicMock()
     mock_link = MagicMock()
@@ -214,7 +219,8 @@ def test_add_links_to_study_calls_create_link():
 
     # Patch the capacity generation functions to avoid randomness
     with patch(
-        "antares.datamanager.generator.generate_study_process.generate_link_capacity_df", return_value="mock_df"
+        "antares.datamanager.generator.generate_study_process.generate_links_capacity_series",
+        side_effect=_mock_links_capacities,
     ):
         # When
         add_links_to_study(mock_study, links)
@@ -236,7 +242,7 @@ def test_add_links_to_study_with_hurdle_cost():
     hurdle_value = 0.1
     links = {
         "A/B": {
-            # minimal keys required by generate_link_capacity_df for both modes
+            # minimal keys of the capacities of both directions
             "winterHcDirectMw": 1,
             "winterHpDirectMw": 1,
             "summerHcDirectMw": 1,
@@ -250,7 +256,8 @@ def test_add_links_to_study_with_hurdle_cost():
     }
 
     with patch(
-        "antares.datamanager.generator.generate_study_process.generate_link_capacity_df", return_value="mock_df"
+        "antares.datamanager.generator.generate_study_process.generate_links_capacity_series",
+        side_effect=_mock_links_capacities,
     ):
         add_links_to_study(mock_study, links)
 
@@ -312,7 +319,8 @@ def test_add_links_to_study_with_hurdle_cost():
 
     # Patch the capacity generation functions to avoid randomness
     with patch(
-        "antares.datamanager.generator.generate_study_process.generate_link_capacity_df", return_value="mock_df"
+        "antares.datamanager.generator.generate_study_process.generate_links_capacity_series",
+        side_effect=_mock_links_capacities,
     ):
         # When
         add_links_to_study(mock_study, links)
@@ -323,6 +331,76 @@ def test_add_links_to_study_with_hurdle_cost():
     assert mock_link.set_capacity_indirect.call_count == 2
 
 
+def test_add_links_to_study_computes_capacities_of_all_links_at_once():
+    mock_study = MagicMock()
+    links = {"FR/CH": {"hvdcMwDirect": 1}, "FR/IT-NORD": {}}
+
+    with patch(
+        "antares.datamanager.generator.generate_study_process.generate_links_capacity_series",
+        side_effect=_mock_links_capacities,
+    ) as mock_capacities:
+        add_links_to_study(mock_study, links, global_seed=7)
+
+    mock_capacities.assert_called_once()
+    assert mock_capacities.call_args.args == ([("fr-ch", links["FR/CH"]), ("fr-it-nord", links["FR/IT-NORD"])],)
+    assert mock_capacities.call_args.kwargs["seed_tsgen_link"] == 7
+    assert [call.kwargs for call in mock_study.create_link.call_args_list] == [
+        {"area_from": "fr", "area_to": "ch"},
+        {"area_from": "fr", "area_to": "it-nord"},
+    ]
+
+
+def test_add_links_to_study_keeps_links_with_colliding_names():
+    mock_study = MagicMock()
+    links = {"FR-IT/NORD": {"hurdleCost": 0.1}, "FR/IT-NORD": {}}
+    capacities = {key: MagicMock(**{"to_frame.return_value": key}) for key in links}
+
+    with patch(
+        "antares.datamanager.generator.generate_study_process.generate_links_capacity_series",
+        return_value=iter([("fr-it-nord", capacities[key], capacities[key]) for key in links]),
+    ) as mock_capacities:
+        add_links_to_study(mock_study, links)
+
+    assert mock_capacities.call_args.args == (
+        [("fr-it-nord", links["FR-IT/NORD"]), ("fr-it-nord", links["FR/IT-NORD"])],
+    )
+    assert [call.kwargs for call in mock_study.create_link.call_args_list] == [
+        {"area_from": "fr-it", "area_to": "nord"},
+        {"area_from": "fr", "area_to": "it-nord"},
+    ]
+    link = mock_study.create_link.return_value
+    assert [call.args for call in link.set_capacity_direct.call_args_list] == [("FR-IT/NORD",), ("FR/IT-NORD",)]
+    # Only the first link has a hurdle cost
+    assert link.set_parameters.call_count == 1
+
+
+def test_add_links_to_local_study_writes_capacities_by_blocks(tmp_path):
+    link_data = {
+        f"{season}{period}{mode}Mw": 1200
+        for season in ("winter", "summer")
+        for period in ("Hc", "Hp")
+        for mode in ("Direct", "Indirect")
+    }
+    link_data.update({"hvdcMwDirect": 500, "hvdcNbDirect": 2, "hvdcFoRateDirect": 0.1})
+    # "be" comes before "fr": the files of this link are written under be/
+    links = {"FR/CH": link_data, "FR/BE": link_data}
+    studies = {}
+    for chunk_days in (0, 7):
+        study = create_study_local(f"study_{chunk_days}", "8.8", tmp_path)
+        for area_name in ("fr", "ch", "be"):
+            study.create_area(area_name)
+        with patch("antares.datamanager.generator.generate_study_process.settings") as mock_settings:
+            mock_settings.link_ts_chunk_days = chunk_days
+            mock_settings.generation_mode = GenerationMode.LOCAL
+            add_links_to_study(study, links, global_seed=3)
+        studies[chunk_days] = Path(study.path) / "input" / "links"
+
+    for relative_path in ("ch/capacities/fr_direct.txt", "be/capacities/fr_indirect.txt"):
+        chunked, whole = studies[7] / relative_path, studies[0] / relative_path
+        assert chunked.read_bytes() == whole.read_bytes()
+        assert len(chunked.read_text().splitlines()) == 8760
+
+
 @patch("antares.datamanager.generator.generate_study_process.read_study_data_from_json")
 @patch("antares.datamanager.generator.generate_study_process.add_areas_to_study")
 @patch("antares.datamanager.generator.generate_study_process.add_links_to_study")
@@ -353,7 +431,9 @@ def test_generate_study_calls_all_functions(mock_add_links, mock_add_areas, mock
     mock_factory.create_study.assert_called_once_with("study_name")
     args, _ = mock_study.update_settings.call_args
     mock_add_areas.assert_called_once_with(mock_study, study_data, used_files)
-    mock_add_links.assert_called_once_with(mock_study, study_data.links, study_data.seed_tsgen_link)
+    mock_add_links.assert_called_once_with(
+        mock_study, study_data.links, study_data.seed_tsgen_link, study_data.first_month
+    )
     assert result == {"message": "Study study_name successfully generated", "study_id": "dummy_id", "study_path": ""}
 
 
@@ -471,8 +551,8 @@ def test_add_areas_to_study_with_unit_count_and_data_sets_prepro(mock_load_dir):
             side_effect=lambda **kwargs: DummyProps(**kwargs),
         ),
         patch(
-            "antares.datamanager.generator.generate_thermal_clusters.create_prepro_data_matrix",
-            return_value=sentinel_matrix,
+            "antares.datamanager.generator.generate_thermal_clusters.create_prepro_data_matrices",
+            return_value=[sentinel_matrix],
         ) as mock_create_matrix,
     ):
         add_areas_to_study(mock_study, study_data, used_files=set())
@@ -480,7 +560,9 @@ def test_add_areas_to_study_with_unit_count_and_data_sets_prepro(mock_load_dir):
         # create_thermal_cluster called once with DummyProps instance
         assert mock_area_obj.create_thermal_cluster.call_count == 1
         # Ensure prepro matrix was computed with provided data and unit_count
-        mock_create_matrix.assert_called_once()
+        mock_create_matrix.assert_called_once_with(
+            [study_data.area_thermals["A"]["clusterX"]["data"]], [3], first_month=study_data.first_month
+        )
         # And set on the cluster object
         mock_cluster_obj.set_prepro_data.assert_called_once_with(sentinel_matrix)
 
@@ -11,6 +11,8 @@
 # This file is part of the Antares project.
 import pytest
 
+from unittest.mock import MagicMock, patch
+
 import numpy as np
 import pandas as pd
 
@@ -18,7 +20,9 @@ from antares.craft import Month
 from antares.datamanager.generator.generate_thermal_clusters import (
     NPO_SUMMER_DIVISOR,
     NPO_WINTER_DIVISOR,
+    build_prepro_data_arrays,
     create_prepro_data_matrix,
+    generate_thermal_clusters,
 )
 
 
@@ -249,3 +253,119 @@ def test_flexibility_january_start(monkeypatch):
     # April 1st is Day 91 (0-indexed 90)
     # npo_max for April should be summer (4)
     assert df.iloc[90, 5] == 4
+
+
+def test_build_prepro_data_arrays_builds_rows_of_each_cluster():
+    clusters = [
+        {
+            "fo_duration": 1,
+            "po_duration": 2,
+            "fo_monthly_rate": list(range(1, 13)),
+            "po_monthly_rate": [20] * 12,
+            "npo_max_winter": 5,
+            "npo_max_summer": 10,
+            "nb_unit": 2,
+        },
+        None,
+        {
+            "fo_duration": 3,
+            "po_duration": 4,
+            "fo_monthly_rate": [0.5] * 12,
+            "po_monthly_rate": list(range(12)),
+            "npo_max_winter": 0,
+            "npo_max_summer": 0,
+            "nb_unit": 0,
+        },
+    ]
+
+    prepro = build_prepro_data_arrays(clusters, [3, 1, 7], first_month=Month.JULY)
+
+    assert prepro.shape == (3, 365, 6)
+    # July 1st (summer), September 30th (summer), October 1st (winter), January 1st (winter), June 30th (summer)
+    days = [0, 91, 92, 184, 364]
+    # NPO max is npo_max * unit_count / nb_unit: 10 * 3 / 2 in summer, 5 * 3 / 2 in winter
+    np.testing.assert_array_equal(
+        prepro[0, days],
+        [
+            [1, 2, 7, 20, 0, 15],
+            [1, 2, 9, 20, 0, 15],
+            [1, 2, 10, 20, 0, 7.5],
+            [1, 2, 1, 20, 0, 7.5],
+            [1, 2, 6, 20, 0, 15],
+        ],
+    )
+    # Cluster without data gets the default rows
+    assert (prepro[1] == [1, 1, 0, 0, 0, 0]).all()
+    # Without npo_max, NPO max is unit_count // 3 in summer and unit_count // 4 in winter
+    np.testing.assert_array_equal(
+        prepro[2, days],
+        [
+            [3, 4, 0.5, 6, 0, 2],
+            [3, 4, 0.5, 8, 0, 2],
+            [3, 4, 0.5, 9, 0, 1],
+            [3, 4, 0.5, 0, 0, 1],
+            [3, 4, 0.5, 5, 0, 2],
+        ],
+    )
+
+
+def test_generate_thermal_clusters_builds_prepro_of_area_in_one_batch():
+    data = {
+        "fo_duration": 1,
+        "po_duration": 2,
+        "fo_monthly_rate": [10] * 12,
+        "po_monthly_rate": [20] * 12,
+        "npo_max_winter": 5,
+        "npo_max_summer": 10,
+    }
+    thermals = {
+        "cluster_a": {"properties": {"unit_count": 2}, "data": data},
+        "cluster_b": {"properties": {"unit_count": 4}, "data": {**data, "fo_duration": 3}},
+        "cluster_c": {"properties": {"unit_count": 1}},
+    }
+    area = MagicMock()
+
+    with patch(
+        "antares.datamanager.generator.generate_thermal_clusters.build_prepro_data_arrays",
+        wraps=build_prepro_data_arrays,
+    ) as mock_build:
+        generate_thermal_clusters(area, thermals, first_month=Month.JULY)
+
+    mock_build.assert_called_once()
+    assert mock_build.call_args.args[1] == [2, 4, 1]
+    cluster = area.create_thermal_cluster.return_value
+    prepro_matrices = [call.args[0] for call in cluster.set_prepro_data.call_args_list]
+    assert [matrix.iloc[0, 0] for matrix in prepro_matrices] == [1, 3, 1]
+    # npo_max_summer * unit_count on July 1st
+    assert prepro_matrices[1].iloc[0, 5] == 10 * 4
+
+
+def test_build_prepro_data_arrays_rejects_invalid_rates_in_batch():
+    valid = {
+        "fo_duration": 1,
+        "po_duration": 2,
+        "fo_monthly_rate": [10] * 12,
+        "po_monthly_rate": [20] * 12,
+        "npo_max_winter": 5,
+        "npo_max_summer": 10,
+    }
+    invalid = {**valid, "po_monthly_rate": [20] * 11}
+
+    with pytest.raises(ValueError, match="must have 12 values"):
+        build_prepro_data_arrays([valid, invalid], [1, 1])
+
+
+def test_prepro_keeps_integer_inputs_as_integer_columns():
+    data = {
+        "fo_duration": 1,
+        "po_duration": 2,
+        "fo_monthly_rate": [0.1] * 12,
+        "po_monthly_rate": [20] * 12,
+        "npo_max_winter": 5,
+        "npo_max_summer": 10,
+        "nb_unit": 2,
+    }
+
+    df = create_prepro_data_matrix(data, unit_count=2)
+
+    assert df.dtypes.tolist() == [np.int64, np.int64, np.float64, np.int64, np.float64, np.float64]
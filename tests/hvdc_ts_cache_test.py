@@ -0,0 +1,106 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+
+import pytest
+
+import os
+
+from unittest.mock import patch
+
+import numpy as np
+
+from antares.datamanager.core.hvdc_ts_cache import HvdcTimeSeriesCache, hvdc_ts_cache_key
+from antares.datamanager.generator.generate_link_matrices import generate_links_capacity_series
+from antares.tsgen.ts_generator import TimeseriesGenerator
+
+LINK_DATA = {
+    "winterHcDirectMw": 1500,
+    "winterHpDirectMw": 1500,
+    "summerHcDirectMw": 1500,
+    "summerHpDirectMw": 1500,
+    "winterHcIndirectMw": 1200,
+    "winterHpIndirectMw": 1200,
+    "summerHcIndirectMw": 1200,
+    "summerHpIndirectMw": 1200,
+    "hvdcMwDirect": 900,
+    "hvdcNbDirect": 3,
+    "hvdcFoRateDirect": 0.2,
+    "hvdcMwIndirect": 600,
+    "hvdcNbIndirect": 2,
+    "hvdcFoRateIndirect": 0.1,
+}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HvdcTimeSeriesCache(tmp_path / "hvdc", max_bytes=10**9)
+
+
+def test_put_stores_compact_units(cache):
+    units = np.random.default_rng(0).integers(0, 4, size=(365, 60))
+
+    cache.put("key", units)
+
+    cached = cache.get("key")
+    assert cached.dtype == np.uint8
+    assert np.array_equal(cached, units)
+    assert cache.get("other_key") is None
+
+
+def test_key_depends_on_draw_inputs():
+    key = hvdc_ts_cache_key(2, 0.1, 1234, "a-b", 60)
+    variants = [
+        (3, 0.1, 1234, "a-b", 60),
+        (2, 0.10000001, 1234, "a-b", 60),
+        (2, 0.1, 1235, "a-b", 60),
+        (2, 0.1, 1234, "a-c", 60),
+        (2, 0.1, 1234, "a-b", 61),
+    ]
+
+    assert hvdc_ts_cache_key(2, 0.1, 1234, "a-b", 60) == key
+    assert key not in {hvdc_ts_cache_key(*args) for args in variants}
+    assert len({hvdc_ts_cache_key(*args) for args in variants}) == len(variants)
+    with patch("antares.datamanager.core.hvdc_ts_cache._tsgen_version", return_value="99.0"):
+        assert hvdc_ts_cache_key(2, 0.1, 1234, "a-b", 60) != key
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    units = np.ones((365, 10), dtype=np.uint8)
+    cache.put("first", units)
+    cache.put("second", units)
+    cache.max_bytes = 2 * (cache.root / "first.npy").stat().st_size
+    os.utime(cache.root / "first.npy", (0, 0))
+    os.utime(cache.root / "second.npy", (1, 1))
+
+    # Reading "first" makes "second" the least recently used entry
+    assert cache.get("first") is not None
+    cache.put("third", units)
+
+    assert sorted(path.stem for path in cache.root.glob("*.npy")) == ["first", "third"]
+
+
+def _capacities():
+    [(_, direct, indirect)] = generate_links_capacity_series({"a-b": LINK_DATA}, seed_tsgen_link=7)
+    return direct.to_frame(), indirect.to_frame()
+
+
+def test_generation_reuses_cached_draws(cache):
+    with patch("antares.datamanager.generator.generate_link_matrices.get_hvdc_ts_cache", return_value=cache):
+        direct, indirect = _capacities()
+        with patch.object(TimeseriesGenerator, "generate_time_series_for_links", side_effect=AssertionError):
+            cached_direct, cached_indirect = _capacities()
+
+    uncached_direct, uncached_indirect = _capacities()
+    # One entry per direction: units and outage rates differ
+    assert len(list(cache.root.glob("*.npy"))) == 2
+    assert cached_direct.equals(direct) and direct.equals(uncached_direct)
+    assert cached_indirect.equals(indirect) and indirect.equals(uncached_indirect)
@@ -0,0 +1,193 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+import pytest
+
+import time
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from antares.datamanager.core.input_snapshot import InputSnapshotStore, get_snapshot_store, input_snapshot_scope
+from antares.datamanager.core.storage import input_exists, read_input_table, read_input_tables
+from antares.datamanager.generator.generate_study_process import generate_study
+from antares.datamanager.models.study_data_json_model import StudyData
+
+
+def _write_series(path: Path, value: float) -> Path:
+    pd.DataFrame({"v": [value] * 24}).to_feather(path)
+    return path
+
+
+@pytest.fixture
+def store(tmp_path):
+    return InputSnapshotStore(tmp_path / "snapshots", max_bytes=10**9, max_age_seconds=3600)
+
+
+def test_snapshots_are_disabled_with_s3_inputs(tmp_path, monkeypatch):
+    monkeypatch.setenv("INPUT_SNAPSHOT_DIRECTORY", str(tmp_path / "snapshots"))
+    monkeypatch.setenv("INPUT_STORAGE_BACKEND", "S3")
+    get_snapshot_store.cache_clear()
+    try:
+        assert get_snapshot_store() is None
+        monkeypatch.setenv("INPUT_STORAGE_BACKEND", "LOCAL")
+        get_snapshot_store.cache_clear()
+        assert get_snapshot_store() is not None
+    finally:
+        get_snapshot_store.cache_clear()
+
+
+def test_save_moves_files_and_reads_them_back(tmp_path, store):
+    file = _write_series(tmp_path / "a.arrow", 1.5)
+    original = file.read_bytes()
+
+    assert store.save("study", {file}) == 1
+
+    assert not file.exists()
+    assert store.contains("study", file)
+    assert store.read_bytes("study", file) == original
+    assert store.read_bytes("other_study", file) is None
+
+
+@pytest.mark.parametrize("study_id", ["../escape", "a/b", "a\\b", "C:escape", "..", ""])
+def test_unsafe_study_ids_are_rejected(tmp_path, store, study_id):
+    file = _write_series(tmp_path / "series.arrow", 1.0)
+
+    with pytest.raises(ValueError, match="Invalid study id"):
+        store.save(study_id, [file])
+    with pytest.raises(ValueError, match="Invalid study id"):
+        with input_snapshot_scope(study_id):
+            pass
+
+    assert file.exists()
+    assert not (tmp_path / "escape.json").exists()
+
+
+def test_identical_contents_share_one_blob(tmp_path, store):
+    first = _write_series(tmp_path / "a.arrow", 2.0)
+    second = _write_series(tmp_path / "b.arrow", 2.0)
+
+    store.save("study_1", {first})
+    store.save("study_2", {second})
+
+    assert len(list(store.blobs_directory.glob("*.zst"))) == 1
+
+
+def test_save_keeps_entries_of_previous_attempt(tmp_path, store):
+    first = _write_series(tmp_path / "a.arrow", 1.0)
+    store.save("study", {first})
+    second = _write_series(tmp_path / "b.arrow", 2.0)
+
+    # First file is already gone from the NAS, it must stay in the snapshot
+    store.save("study", {first, second})
+
+    assert store.contains("study", first)
+    assert store.contains("study", second)
+
+
+def test_discard_removes_unreferenced_blobs(tmp_path, store):
+    store.save("study", {_write_series(tmp_path / "a.arrow", 1.0)})
+
+    store.discard("study")
+
+    assert list(store.blobs_directory.glob("*.zst")) == []
+    assert list(store.manifests_directory.glob("*.json")) == []
+
+
+def test_age_based_eviction(tmp_path, store):
+    file = _write_series(tmp_path / "a.arrow", 1.0)
+    store.save("study", {file})
+
+    store.evict(now=time.time() + 7200)
+
+    assert not store.contains("study", file)
+    assert list(store.blobs_directory.glob("*.zst")) == []
+
+
+def test_size_cap_evicts_oldest_snapshot_first(tmp_path):
+    store = InputSnapshotStore(tmp_path / "snapshots", max_bytes=1, max_age_seconds=3600)
+    old_file = _write_series(tmp_path / "old.arrow", 1.0)
+    new_file = _write_series(tmp_path / "new.arrow", 2.0)
+
+    store.save("old_study", {old_file})
+    store.save("new_study", {new_file})
+
+    # The snapshot being saved is kept even when it exceeds the cap alone
+    assert not store.contains("old_study", old_file)
+    assert store.contains("new_study", new_file)
+
+
+def test_storage_reads_fall_back_to_snapshot_in_scope(tmp_path, store):
+    files = [_write_series(tmp_path / f"s{i}.arrow", float(i)) for i in range(3)]
+    store.save("study", files)
+
+    with patch("antares.datamanager.core.input_snapshot.get_snapshot_store", return_value=store):
+        with pytest.raises(FileNotFoundError):
+            read_input_table(files[0])
+        assert not input_exists(files[0])
+
+        with input_snapshot_scope("study"):
+            assert input_exists(files[0])
+            assert read_input_table(files[1])["v"].iloc[0] == 1.0
+            tables = read_input_tables(files)
+
+    assert [tables[file]["v"].iloc[0] for file in files] == [0.0, 1.0, 2.0]
+
+
+@patch("antares.datamanager.generator.generate_study_process._cleanup_arrow_files")
+@patch("antares.datamanager.generator.generate_study_process.add_areas_to_study")
+@patch("antares.datamanager.generator.generate_study_process.read_study_data_from_json")
+def test_failed_study_inputs_are_snapshotted_and_reused(mock_read_json, mock_add_areas, _, tmp_path, store):
+    load_file = _write_series(tmp_path / "load.arrow", 42.0)
+    mock_read_json.return_value = StudyData(name="test_study")
+    factory = MagicMock()
+
+    def failing_add_areas(study, study_data, used_files):
+        used_files.add(load_file)
+        raise RuntimeError("Generation failed")
+
+    def reading_add_areas(study, study_data, used_files):
+        used_files.add(load_file)
+        assert read_input_table(load_file)["v"].iloc[0] == 42.0
+
+    with patch("antares.datamanager.generator.generate_study_process.get_snapshot_store", return_value=store):
+        with patch("antares.datamanager.core.input_snapshot.get_snapshot_store", return_value=store):
+            mock_add_areas.side_effect = failing_add_areas
+            with pytest.raises(RuntimeError, match="Generation failed"):
+                generate_study("study_id", factory)
+
+            assert not load_file.exists()
+            assert store.contains("study_id", load_file)
+
+            mock_add_areas.side_effect = reading_add_areas
+            generate_study("study_id", factory)
+
+    # Successful retry drops the snapshot
+    assert not store.contains("study_id", load_file)
+
+
+@patch("antares.datamanager.generator.generate_study_process._cleanup_arrow_files")
+@patch("antares.datamanager.generator.generate_study_process.add_areas_to_study")
+@patch("antares.datamanager.generator.generate_study_process.read_study_data_from_json")
+def test_snapshot_failure_does_not_hide_generation_error(mock_read_json, mock_add_areas, _, store):
+    mock_read_json.return_value = StudyData(name="test_study")
+    mock_add_areas.side_effect = RuntimeError("Generation failed")
+
+    with (
+        patch("antares.datamanager.generator.generate_study_process.get_snapshot_store", return_value=store),
+        patch.object(store, "save", side_effect=OSError("No space left on device")) as mock_save,
+    ):
+        with pytest.raises(RuntimeError, match="Generation failed"):
+            generate_study("study_id", MagicMock())
+
+    mock_save.assert_called_once()
@@ -0,0 +1,121 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+import pytest
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+
+from antares.datamanager.core.settings import StorageBackendType
+from antares.datamanager.core.storage import (
+    LocalObjectStoreClient,
+    LocalStorageBackend,
+    S3StorageBackend,
+    get_storage_backend,
+    input_exists,
+    inputs_exist,
+    read_input_table,
+    read_input_tables,
+)
+
+
+@pytest.fixture
+def object_store(tmp_path):
+    """NAS root mirrored in a local stand-in bucket."""
+    nas_root = tmp_path / "nas"
+    bucket_dir = tmp_path / "store" / "inputs" / "pegase"
+    (bucket_dir / "res").mkdir(parents=True)
+    for i in range(3):
+        pd.DataFrame({"v": [float(i)] * 10}).to_feather(bucket_dir / "res" / f"ts_{i}.arrow")
+    (bucket_dir / "res" / "notes.txt").write_text("not a series")
+
+    client = LocalObjectStoreClient(tmp_path / "store")
+    backend = S3StorageBackend(client=client, bucket="inputs", root=nas_root, prefix="pegase")
+    return backend, nas_root
+
+
+def test_local_backend_ranged_read_and_stat(tmp_path):
+    file_path = tmp_path / "data.bin"
+    file_path.write_bytes(b"0123456789")
+    backend = LocalStorageBackend()
+
+    assert backend.read_bytes(file_path) == b"0123456789"
+    assert backend.read_bytes(file_path, start=2, end=5) == b"234"
+    assert backend.stat(file_path).size == 10
+    assert backend.exists(file_path)
+    assert not backend.exists(tmp_path / "missing.bin")
+
+
+def test_s3_backend_stat_exists_and_ranged_read(object_store):
+    backend, nas_root = object_store
+    notes = nas_root / "res" / "notes.txt"
+
+    assert backend.stat(notes).size == len("not a series")
+    assert backend.read_bytes(notes, start=4, end=5) == b"a"
+    assert backend.read_bytes(notes, start=4) == b"a series"
+    assert backend.exists(notes)
+    assert not backend.exists(nas_root / "res" / "missing.arrow")
+
+
+def test_s3_backend_missing_object_raises_file_not_found(object_store):
+    backend, nas_root = object_store
+
+    with pytest.raises(FileNotFoundError, match="Object not found"):
+        backend.read_table(nas_root / "res" / "missing.arrow")
+    with pytest.raises(FileNotFoundError):
+        backend.stat(nas_root / "res" / "missing.arrow")
+
+
+def test_s3_backend_rejects_path_outside_root(object_store):
+    backend, _ = object_store
+
+    with pytest.raises(ValueError, match="outside of the storage root"):
+        backend.read_bytes(Path("/elsewhere/ts.arrow"))
+
+
+def test_module_helpers_use_configured_backend(object_store):
+    backend, nas_root = object_store
+    paths = [nas_root / "res" / f"ts_{i}.arrow" for i in range(3)]
+
+    with patch("antares.datamanager.core.storage.get_storage_backend", return_value=backend):
+        assert input_exists(paths[0])
+        assert read_input_table(paths[1])["v"].iloc[0] == 1.0
+        tables = read_input_tables(paths)
+        existing = inputs_exist([*paths, nas_root / "res" / "missing.arrow"])
+
+    assert [tables[path]["v"].iloc[0] for path in paths] == [0.0, 1.0, 2.0]
+    assert existing == {**{path: True for path in paths}, nas_root / "res" / "missing.arrow": False}
+
+
+def test_get_storage_backend_defaults_to_local():
+    get_storage_backend.cache_clear()
+    try:
+        with patch("antares.datamanager.core.storage.settings") as mock_settings:
+            mock_settings.input_storage_backend = StorageBackendType.LOCAL
+            backend = get_storage_backend()
+    finally:
+        get_storage_backend.cache_clear()
+
+    assert isinstance(backend, LocalStorageBackend)
+
+
+def test_get_storage_backend_s3_requires_bucket():
+    get_storage_backend.cache_clear()
+    try:
+        with patch("antares.datamanager.core.storage.settings") as mock_settings:
+            mock_settings.input_storage_backend = StorageBackendType.S3
+            mock_settings.s3_bucket = ""
+            with pytest.raises(ValueError, match="S3_BUCKET"):
+                get_storage_backend()
+    finally:
+        get_storage_backend.cache_clear()
@@ -0,0 +1,135 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+import pytest
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from antares.craft import Month, create_study_local
+from antares.datamanager.generator.generate_dsr_clusters import create_dsr_modulation_matrix_from_series
+from antares.datamanager.generator.generate_thermal_clusters import (
+    create_modulation_matrix,
+    create_prepro_data_matrix,
+    generate_thermal_clusters,
+)
+from antares.datamanager.utils.matrix_interning import content_key, intern_matrix, matrix_interning_scope, write_matrix
+
+PREPRO_DATA = {
+    "fo_duration": 1,
+    "po_duration": 2,
+    "fo_monthly_rate": [0.1] * 12,
+    "po_monthly_rate": [0.2] * 12,
+    "npo_max_winter": 1,
+    "npo_max_summer": 1,
+    "nb_unit": 2,
+}
+
+
+def test_identical_keys_share_one_matrix_in_scope():
+    build = MagicMock(side_effect=lambda: pd.DataFrame(np.zeros((2, 2))))
+
+    with matrix_interning_scope() as interner:
+        first = intern_matrix(("key", 1), build)
+        second = intern_matrix(("key", 1), build)
+        other = intern_matrix(("key", 2), build)
+
+    assert first is second
+    assert other is not first
+    assert build.call_count == 2
+    assert (interner.hits, interner.misses) == (1, 2)
+    # Outside of a scope, matrices are built every time
+    assert intern_matrix(("key", 1), build) is not first
+
+
+def test_interned_matrices_are_read_only():
+    with matrix_interning_scope():
+        prepro = create_prepro_data_matrix(dict(PREPRO_DATA), 2, first_month=Month.JULY)
+        modulation = intern_matrix(("key", 1), lambda: pd.DataFrame(np.zeros((2, 2))))
+
+    # Integer columns of the prepro data are kept
+    assert prepro.dtypes[0] == np.int64 and prepro.dtypes[2] == np.float64
+    for matrix in (prepro, modulation):
+        for column in (0, 1):
+            with pytest.raises(ValueError, match="read-only"):
+                matrix.iloc[0, column] = 5
+    # Single dtype matrices are wrapped without copy: their values are read-only too
+    with pytest.raises(ValueError, match="read-only"):
+        modulation.to_numpy()[0, 0] = 5
+    # Copies can still be modified
+    copy = modulation.copy()
+    copy.iloc[0, 0] = 5
+    assert copy.iloc[0, 0] == 5
+    # Outside of a scope, matrices are not shared and stay writable
+    matrix = intern_matrix(("key", 1), lambda: pd.DataFrame(np.zeros((2, 2))))
+    matrix.iloc[0, 0] = 5
+    assert matrix.iloc[0, 0] == 5
+
+
+def test_content_key_distinguishes_integer_and_float_inputs():
+    assert content_key({"a": [1, 2]}) == content_key({"a": [1, 2]})
+    assert content_key({"a": [1, 2]}) != content_key({"a": [1.0, 2.0]})
+    assert content_key(pd.Series([0.5, 1.0])) == content_key(np.array([0.5, 1.0]))
+
+
+def test_generators_intern_prepro_and_modulation_matrices():
+    with matrix_interning_scope():
+        prepro = create_prepro_data_matrix(dict(PREPRO_DATA), 2, first_month=Month.JULY)
+        assert create_prepro_data_matrix(dict(PREPRO_DATA), 2, first_month=Month.JULY) is prepro
+        assert create_prepro_data_matrix(dict(PREPRO_DATA), 3, first_month=Month.JULY) is not prepro
+
+        assert create_modulation_matrix([]) is create_dsr_modulation_matrix_from_series(None, 0)
+        series = pd.Series([5.0, 10.0])
+        dsr_modulation = create_dsr_modulation_matrix_from_series(series, 10.0)
+        assert create_dsr_modulation_matrix_from_series(series.copy(), 10.0) is dsr_modulation
+
+
+def test_write_matrix_copies_file_of_interned_matrix(tmp_path):
+    def write_file(relative_path: str, matrix: pd.DataFrame) -> None:
+        (tmp_path / relative_path).parent.mkdir(parents=True, exist_ok=True)
+        matrix.to_csv(tmp_path / relative_path, sep="\t", header=False, index=False)
+
+    setter = MagicMock(side_effect=write_file)
+    with matrix_interning_scope(tmp_path) as interner:
+        matrix = intern_matrix("key", lambda: pd.DataFrame([[1, 2]]))
+        write_matrix(matrix, "a/data.txt", lambda: setter("a/data.txt", matrix))
+        write_matrix(matrix, "b/data.txt", lambda: setter("b/data.txt", matrix))
+        # Matrices that are not interned are always written
+        not_interned = pd.DataFrame([[1, 2]])
+        write_matrix(not_interned, "c/data.txt", lambda: setter("c/data.txt", not_interned))
+
+    assert setter.call_count == 2
+    assert interner.copied_files == 1
+    assert (tmp_path / "b/data.txt").read_text() == (tmp_path / "a/data.txt").read_text()
+
+
+def test_identical_thermal_clusters_of_local_study_reuse_written_files(tmp_path):
+    study = create_study_local("study", "8.8", tmp_path)
+    area = study.create_area("fr")
+    thermals = {
+        f"cluster_{i}": {"properties": {"unit_count": 2, "nominal_capacity": 10.0}, "data": dict(PREPRO_DATA)}
+        for i in range(3)
+    }
+
+    with matrix_interning_scope(Path(study.path)) as interner:
+        generate_thermal_clusters(area, thermals, first_month=Month.JULY)
+
+    # One prepro and one modulation matrix, written for the first cluster and copied for the others
+    assert interner.misses == 2
+    assert interner.copied_files == 4
+    prepro_directory = Path(study.path) / "input" / "thermal" / "prepro" / "fr"
+    expected = create_prepro_data_matrix(dict(PREPRO_DATA), 2, first_month=Month.JULY)
+    for i in range(3):
+        written = pd.read_csv(prepro_directory / f"cluster_{i}" / "data.txt", sep="\t", header=None)
+        np.testing.assert_array_equal(written.to_numpy(), expected.to_numpy())
@@ -0,0 +1,57 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from antares.datamanager.utils.modulation import build_modulation_matrix
+
+
+def test_default_matrix_matches_list_based_construction():
+    expected = pd.DataFrame([[1, 1, 1, 0]] * 8760)
+
+    pd.testing.assert_frame_equal(build_modulation_matrix(), expected)
+
+
+@pytest.mark.parametrize(
+    "cm_values, mr_values",
+    [
+        ([0.1, 0.2, 0.3], [0.9, 0.8, 0.7]),
+        ([0.1, 0.2, 0.3], None),
+        (None, [0.9, 0.8, 0.7]),
+        ([1, 0, 1], None),
+    ],
+)
+def test_matrix_matches_list_based_construction(cm_values, mr_values):
+    cm = [1] * 3 if cm_values is None else cm_values
+    mr = [0] * 3 if mr_values is None else mr_values
+    expected = pd.DataFrame([[1, 1, c, m] for c, m in zip(cm, mr)])
+
+    matrix = build_modulation_matrix(
+        cm_values=None if cm_values is None else np.array(cm_values),
+        mr_values=None if mr_values is None else pd.Series(mr_values),
+    )
+
+    pd.testing.assert_frame_equal(matrix, expected)
+
+
+def test_mismatched_rows_are_rejected():
+    with pytest.raises(ValueError, match="same number of rows"):
+        build_modulation_matrix(cm_values=np.ones(3), mr_values=np.zeros(2))
+
+
+def test_reduced_precision_matrix_is_built_in_that_dtype():
+    matrix = build_modulation_matrix(cm_values=np.array([0.5, 0.25]), dtype=np.dtype(np.float32))
+
+    assert set(matrix.dtypes) == {np.dtype(np.float32)}
+    assert matrix.iloc[1].tolist() == [1.0, 1.0, 0.25, 0.0]
@@ -0,0 +1,81 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+import json
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from antares.datamanager.core.settings import SeriesPrecision
+from antares.datamanager.generator.generate_dsr_clusters import create_dsr_modulation_matrix_from_series
+from antares.datamanager.generator.generate_misc_timeseries import build_misc_timeseries_matrix
+from antares.datamanager.generator.generate_res_clusters import read_res_hourly_series
+from antares.datamanager.generator.generate_study_process import read_study_data_from_json
+from antares.datamanager.generator.generate_thermal_clusters import create_modulation_matrix
+from antares.datamanager.utils.precision import series_dtype, series_precision_scope
+
+
+def test_scope_sets_the_series_dtype():
+    assert series_dtype() == np.float64
+    with series_precision_scope(SeriesPrecision.FLOAT32):
+        assert series_dtype() == np.float32
+        assert series_dtype(np.dtype(np.float64)) == np.float64
+    assert series_dtype() == np.float64
+
+
+def test_res_series_are_read_in_study_precision(tmp_path):
+    pd.DataFrame({"date": [0.0] * 8760, "TS1": [0.123456789] * 8760}).to_feather(tmp_path / "ts.arrow")
+
+    with series_precision_scope(SeriesPrecision.FLOAT32):
+        ts_df = read_res_hourly_series(base_dir=tmp_path, filename="ts.arrow")
+
+    assert ts_df["TS1"].dtype == np.float32
+    assert float(ts_df["TS1"].iloc[0]) == np.float32(0.123456789)
+
+
+def test_misc_matrix_accumulates_in_float64_and_returns_float32(tmp_path):
+    pd.DataFrame({"FR": [333.3] * 8760}).to_feather(tmp_path / "f1.arrow")
+    pd.DataFrame({"FR": [666.6] * 8760}).to_feather(tmp_path / "f2.arrow")
+    misc = {
+        "biomass": {"properties": {"capacity": 1000}, "series": ["f1.arrow"]},
+        "biogas": {"properties": {"capacity": 10}, "series": ["f2.arrow"]},
+    }
+
+    with patch("antares.datamanager.generator.generate_misc_timeseries.settings") as mock_settings:
+        mock_settings.misc_ts_directory = tmp_path
+        matrix = build_misc_timeseries_matrix("FR", misc, dtype=np.dtype(np.float32))
+
+    assert set(matrix.dtypes) == {np.dtype(np.float32)}
+    assert float(matrix["BioMass"].iloc[0]) == np.float32(333.3)
+
+
+def test_modulation_matrices_follow_study_precision():
+    with series_precision_scope(SeriesPrecision.FLOAT32):
+        thermal = create_modulation_matrix([])
+        dsr = create_dsr_modulation_matrix_from_series(pd.Series([5.0, 10.0]), global_max=10.0)
+
+    assert set(thermal.dtypes) == {np.dtype(np.float32)}
+    assert set(dsr.dtypes) == {np.dtype(np.float32)}
+    assert dsr.iloc[0].tolist() == [1.0, 1.0, 0.5, 0.0]
+    # Full precision keeps the historical integer columns
+    assert create_modulation_matrix([]).dtypes.iloc[0] == np.int64
+
+
+def test_study_json_precision_is_parsed(tmp_path):
+    (tmp_path / "study_id.json").write_text(json.dumps({"my_study": {"precision": "float32"}}), encoding="utf-8")
+
+    with patch("antares.datamanager.generator.generate_study_process.settings") as mock_settings:
+        mock_settings.study_json_directory = tmp_path
+        study_data = read_study_data_from_json("study_id")
+
+    assert study_data.precision == SeriesPrecision.FLOAT32
@@ -0,0 +1,61 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+import pytest
+
+import numpy as np
+
+from antares.craft import Month
+from antares.datamanager.utils.study_calendar import (
+    SUMMER_HC,
+    SUMMER_HP,
+    WINTER_HC,
+    WINTER_HP,
+    get_study_calendar,
+)
+
+
+def test_calendar_is_computed_once_per_first_month():
+    assert get_study_calendar(Month.JULY) is get_study_calendar(Month.JULY)
+    assert get_study_calendar(Month.JULY) is not get_study_calendar(Month.JANUARY)
+
+
+def test_calendar_arrays_are_read_only():
+    calendar = get_study_calendar(Month.JULY)
+
+    with pytest.raises(ValueError):
+        calendar.month_of_day[0] = 1
+    with pytest.raises(ValueError):
+        calendar.period_of_hour[0] = WINTER_HP
+
+
+def test_july_calendar_day_mappings():
+    calendar = get_study_calendar(Month.JULY)
+
+    assert calendar.month_order[:2] == (7, 8)
+    assert calendar.month_of_day.shape == (365,)
+    # Jul 1st, Sep 30th, Oct 1st, Mar 31st, Apr 1st
+    assert calendar.month_of_day[[0, 91, 92, 273, 274]].tolist() == [7, 9, 10, 3, 4]
+    assert calendar.winter_days[[0, 91, 92, 273, 274]].tolist() == [False, False, True, True, False]
+    np.testing.assert_array_equal(calendar.month_index_of_day, calendar.month_of_day - 1)
+
+
+def test_hour_mappings():
+    calendar = get_study_calendar(Month.JANUARY)
+
+    assert calendar.day_of_hour.shape == (8760,)
+    assert calendar.day_of_hour[[0, 23, 24, 8759]].tolist() == [0, 0, 1, 364]
+    # 7:00, 8:00, 19:00 and 20:00 of Jan 1st
+    assert calendar.peak_hours[[7, 8, 19, 20]].tolist() == [False, True, True, False]
+    np.testing.assert_array_equal(calendar.winter_hours, calendar.winter_days[calendar.day_of_hour])
+    # Jan 1st is in winter, Jul 1st (day 181) in summer
+    assert calendar.period_of_hour[[0, 8]].tolist() == [WINTER_HC, WINTER_HP]
+    assert calendar.period_of_hour[[181 * 24, 181 * 24 + 8]].tolist() == [SUMMER_HC, SUMMER_HP]
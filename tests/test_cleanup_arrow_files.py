@@ -9,9 +9,16 @@
 # SPDX-License-Identifier: MPL-2.0
 #
 # This file is part of the Antares project.
+import pytest
+
+import json
+import threading
+import time
+
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+from antares.datamanager.core.arrow_cleanup import ArrowCleanupWorker, get_cleanup_worker
 from antares.datamanager.generator.generate_study_process import _cleanup_arrow_files, generate_study
 
 
@@ -31,7 +38,7 @@ def test_cleanup_arrow_files_basic(tmp_path):
     used_files = {file1, file2, file3}  # file3 is .txt, should be ignored by logic
 
     # Action
-    _cleanup_arrow_files(used_files)
+    _cleanup_arrow_files(used_files, wait=True)
 
     # Assert
     assert not file1.exists()
@@ -46,7 +53,19 @@ def test_cleanup_arrow_files_non_existent(tmp_path):
     used_files = {file_path}
 
     # Action & Assert: Should not raise any error
-    _cleanup_arrow_files(used_files)
+    _cleanup_arrow_files(used_files, wait=True)
+
+
+def test_cleanup_arrow_files_skips_s3_inputs(tmp_path, monkeypatch):
+    monkeypatch.setenv("INPUT_STORAGE_BACKEND", "S3")
+    file_path = tmp_path / "file.arrow"
+    file_path.touch()
+
+    with patch("antares.datamanager.generator.generate_study_process.get_cleanup_worker") as mock_get_worker:
+        _cleanup_arrow_files({file_path}, study_id="study", wait=True)
+
+    mock_get_worker.assert_not_called()
+    assert file_path.exists()
 
 
 def test_cleanup_arrow_files_error_handling(tmp_path):
@@ -56,9 +75,12 @@ def test_cleanup_arrow_files_error_handling(tmp_path):
 
     with patch.object(Path, "unlink", side_effect=OSError("Permission denied")):
         # Action & Assert: Should not raise error due to try-except in _cleanup_arrow_files
-        _cleanup_arrow_files({file_path})
+        _cleanup_arrow_files({file_path}, wait=True)
 
     assert file_path.exists()
+    # The failure is recorded so that the deletion can be retried
+    worker = get_cleanup_worker()
+    assert "Permission denied" in worker.failed.pop(file_path)
 
 
 @patch("antares.datamanager.generator.generate_study_process.read_study_data_from_json")
@@ -81,6 +103,7 @@ def test_generate_study_calls_cleanup(mock_cleanup, mock_read_json):
     mock_cleanup.assert_called_once()
     used_files = mock_cleanup.call_args[0][0]
     assert isinstance(used_files, set)
+    assert mock_cleanup.call_args.kwargs["study_id"] == "study_id"
 
 
 @patch("antares.datamanager.generator.generate_study_process.read_study_data_from_json")
@@ -108,3 +131,152 @@ def test_generate_study_cleanup_on_failure(mock_cleanup, mock_add_areas, mock_re
 
     # Assert: Cleanup should have been called even on failure
     mock_cleanup.assert_called_once()
+
+
+def _make_arrow_files(directory: Path, count: int) -> list[Path]:
+    files = []
+    for i in range(count):
+        file = directory / f"series_{i}.arrow"
+        file.touch()
+        files.append(file)
+    return files
+
+
+def test_cleanup_worker_deletes_in_batches(tmp_path):
+    files = _make_arrow_files(tmp_path, 7)
+    worker = ArrowCleanupWorker(batch_size=3, max_workers=2)
+
+    worker.submit(files, study_id="study")
+    worker.flush()
+    worker.shutdown()
+
+    assert not any(file.exists() for file in files)
+    assert worker.failed == {}
+
+
+def test_cleanup_worker_retries_failed_files(tmp_path):
+    files = _make_arrow_files(tmp_path, 2)
+    worker = ArrowCleanupWorker()
+
+    with patch.object(Path, "unlink", side_effect=OSError("Device busy")):
+        worker.submit(files, study_id="study")
+        worker.flush()
+
+    assert set(worker.failed) == set(files)
+
+    worker.retry_failed()
+    worker.flush()
+    worker.shutdown()
+
+    assert worker.failed == {}
+    assert not any(file.exists() for file in files)
+
+
+def test_cleanup_worker_trash_allows_restore(tmp_path):
+    inputs = tmp_path / "inputs"
+    inputs.mkdir()
+    files = _make_arrow_files(inputs, 3)
+    files[0].write_bytes(b"payload")
+    worker = ArrowCleanupWorker(trash_directory=tmp_path / "trash")
+
+    worker.submit(files, study_id="study_a")
+    worker.flush()
+
+    assert not any(file.exists() for file in files)
+    assert (tmp_path / "trash" / "study_a").is_dir()
+
+    assert worker.restore("study_a") == 3
+    worker.shutdown()
+
+    assert all(file.exists() for file in files)
+    assert files[0].read_bytes() == b"payload"
+    assert not (tmp_path / "trash" / "study_a").exists()
+
+
+def test_cleanup_worker_trash_manifest_keeps_original_paths(tmp_path):
+    inputs = tmp_path / "inputs"
+    (inputs / "a").mkdir(parents=True)
+    (inputs / "b").mkdir()
+    # Same name in two directories
+    files = [inputs / "a" / "series.arrow", inputs / "b" / "series.arrow"]
+    for file in files:
+        file.write_text(file.parent.name)
+    worker = ArrowCleanupWorker(trash_directory=tmp_path / "trash")
+
+    worker.submit(files, study_id="study_a")
+    worker.flush()
+
+    manifest = (tmp_path / "trash" / "study_a" / "manifest.jsonl").read_text().splitlines()
+    assert sorted(json.loads(line)["original"] for line in manifest) == sorted(str(file) for file in files)
+    assert worker.restore("study_a") == 2
+    worker.shutdown()
+    assert [file.read_text() for file in files] == ["a", "b"]
+
+
+def test_cleanup_worker_restore_keeps_newer_inputs(tmp_path):
+    files = _make_arrow_files(tmp_path, 2)
+    worker = ArrowCleanupWorker(trash_directory=tmp_path / "trash")
+    worker.submit(files, study_id="study_a")
+    worker.flush()
+    # New upstream export of the first file
+    files[0].write_bytes(b"new export")
+
+    assert worker.restore("study_a") == 1
+    worker.shutdown()
+
+    assert files[0].read_bytes() == b"new export"
+    assert files[1].exists()
+
+
+def test_cleanup_worker_restore_does_not_wait_for_other_studies(tmp_path):
+    other_study_files = _make_arrow_files(tmp_path, 1)
+    release = threading.Event()
+    dispose = ArrowCleanupWorker._dispose
+    worker = ArrowCleanupWorker(trash_directory=tmp_path / "trash")
+
+    def blocking_dispose(self, file, study_id):
+        release.wait(timeout=10)
+        return dispose(self, file, study_id)
+
+    with patch.object(ArrowCleanupWorker, "_dispose", blocking_dispose):
+        worker.submit(other_study_files, study_id="study_b")
+        start = time.monotonic()
+        assert worker.restore("study_a") == 0
+        assert time.monotonic() - start < 5
+        release.set()
+        worker.flush()
+    worker.shutdown()
+
+    assert not other_study_files[0].exists()
+
+
+def test_cleanup_worker_rejects_unsafe_study_ids(tmp_path):
+    files = _make_arrow_files(tmp_path, 1)
+    worker = ArrowCleanupWorker(trash_directory=tmp_path / "trash")
+
+    worker.submit(files, study_id="../escape")
+    worker.flush()
+    worker.shutdown()
+
+    # Kept in place rather than moved outside of the trash directory
+    assert files[0].exists()
+    assert "Invalid study id" in worker.failed[files[0]]
+    with pytest.raises(ValueError, match="Invalid study id"):
+        worker.restore("../escape")
+
+
+def test_cleanup_worker_restore_unknown_study_is_noop(tmp_path):
+    worker = ArrowCleanupWorker(trash_directory=tmp_path / "trash")
+
+    assert worker.restore("unknown") == 0
+    assert ArrowCleanupWorker().restore("unknown") == 0
+
+
+def test_cleanup_worker_purges_expired_trash(tmp_path):
+    trash = tmp_path / "trash"
+    (trash / "old_study").mkdir(parents=True)
+    worker = ArrowCleanupWorker(trash_directory=trash, trash_retention_seconds=60)
+
+    assert worker.purge_trash(now=time.time() + 30) == 0
+    assert worker.purge_trash(now=time.time() + 120) == 1
+    assert not (trash / "old_study").exists()
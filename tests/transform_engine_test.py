@@ -0,0 +1,45 @@
+# Copyright (c) 2024, RTE (https://www.rte-france.com)
+#
+# See AUTHORS.txt
+#
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+# SPDX-License-Identifier: MPL-2.0
+#
+# This file is part of the Antares project.
+import pytest
+
+import numpy as np
+import pandas as pd
+
+from antares.datamanager.core.settings import TransformEngine
+from antares.datamanager.utils.transform_engine import add_column, scaled_sum
+
+ENGINES = [TransformEngine.PANDAS, TransformEngine.POLARS]
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(42)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_scaled_sum(engine, rng):
+    series = [pd.Series(rng.random(24)) for _ in range(3)]
+
+    result = scaled_sum(series, [10.0, 0.5, 3.0], engine=engine)
+
+    np.testing.assert_allclose(result, series[0] * 10.0 + series[1] * 0.5 + series[2] * 3.0)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_add_column(engine, rng):
+    matrix = pd.DataFrame(rng.random((24, 5)))
+    column = np.arange(24)
+
+    result = add_column(matrix, column, engine=engine)
+
+    assert result.shape == (24, 5)
+    np.testing.assert_allclose(result.to_numpy(), matrix.to_numpy() + column[:, None])